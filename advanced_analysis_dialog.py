@@ -3,226 +3,151 @@ Advanced Analysis Dialog - Shows comprehensive chapter analysis
 with microservices-style results and meta-layer reasoning
 """
 
+from html import escape
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
-    QLabel, QPushButton, QScrollArea, QFrame, QProgressBar,
-    QTextEdit, QGroupBox
+    QLabel, QPushButton, QProgressBar,
+    QTextEdit, QTextBrowser, QGroupBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QUrl
 from PyQt6.QtGui import QFont
 from theme_manager import theme_manager
 from typing import Dict, Any, List, Optional
 
 
-class CollapsibleSectionAdvanced(QWidget):
-    """A widget that can collapse its contents"""
-    def __init__(self, title: str, parent=None):
-        super().__init__(parent)
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
-
-        self.toggle_btn = QPushButton(title)
-        self.toggle_btn.setCheckable(True)
-        self.toggle_btn.setChecked(True)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                border: none;
-                font-size: 11pt;
-                font-weight: bold;
-                color: #A0A0A0;
-                padding: 8px;
-                background: #252526;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background: #2d2d2d;
-            }
-            QPushButton:checked {
-                color: #7C4DFF;
-            }
-        """)
-        self.toggle_btn.toggled.connect(self._on_toggle)
-
-        self.content_area = QWidget()
-        self.content_layout = QVBoxLayout(self.content_area)
-        self.content_layout.setContentsMargins(5, 5, 5, 5)
-        self.content_layout.setSpacing(8)
-
-        self.layout.addWidget(self.toggle_btn)
-        self.layout.addWidget(self.content_area)
-
-    def _on_toggle(self, checked: bool):
-        self.content_area.setVisible(checked)
-
-    def add_widget(self, widget: QWidget):
-        self.content_layout.addWidget(widget)
-
-class AnalysisWorker(QThread):
-    """Background worker for running chapter analysis"""
+class AnalysisWorkerSignals(QObject):
     progress = pyqtSignal(str, int)  # message, percentage
+    result_ready = pyqtSignal(str, object, str)  # insight_type, stored insight, issues HTML ('' if none)
     finished = pyqtSignal(dict)  # All results
     error = pyqtSignal(str)
 
+
+class AnalysisWorker(QRunnable):
+    """Runs a chapter's analyses on a pool thread"""
+
     def __init__(self, insight_service, project_id: str, chapter_id: str):
         super().__init__()
+        self.signals = AnalysisWorkerSignals()
         self.insight_service = insight_service
         self.project_id = project_id
         self.chapter_id = chapter_id
 
+    # Chapter analyses run by this dialog (world rules too, as the job queue did)
+    ANALYSIS_TYPES = ['timeline', 'consistency', 'style', 'reader_snapshot', 'world_rules']
+
     def run(self):
         try:
-            self.progress.emit("Starting analysis...", 10)
-
-            # Enqueue all chapter analyses
-            self.insight_service.enqueue_chapter_analyses(
+            self.signals.progress.emit("Starting analysis...", 10)
+
+            total = len(self.ANALYSIS_TYPES)
+            db = self.insight_service.insight_db
+            results = {}
+
+            def on_done(insight_type):
+                # Hand each result over as soon as it is stored so the dialog can
+                # show it while the other analyses are still running
+                insight = db.get_latest(self.project_id, 'chapter', self.chapter_id, insight_type)
+                results[insight_type] = insight
+                if insight:
+                    # Build the issue list's HTML here rather than on the GUI thread
+                    html = _issues_html(insight.payload.get('issues', [])) if insight_type in ISSUE_TAB_TYPES else ''
+                    self.signals.result_ready.emit(insight_type, insight, html)
+                self.signals.progress.emit(f"Finished {insight_type.replace('_', ' ')} ({len(results)}/{total})",
+                                           10 + 80 * len(results) // total)
+
+            # The analyses are independent AI calls, so run them side by side
+            errors = self.insight_service.run_chapter_analyses(
                 self.project_id,
                 self.chapter_id,
-                include_style=True,
-                include_reader_snapshot=True
+                self.ANALYSIS_TYPES,
+                on_done=on_done
             )
+            if len(errors) == total:
+                self.signals.error.emit("; ".join(f"{t}: {e}" for t, e in errors.items()))
+                return
 
-            self.progress.emit("Analysis queued, waiting for results...", 30)
-
-            # Wait for results (simplified - in production use proper job completion tracking)
-            import time
-            time.sleep(2)  # Give worker time to process
-
-            self.progress.emit("Retrieving results...", 80)
-
-            # Load results from database
-            results = self._load_results()
-
-            self.progress.emit("Complete!", 100)
-            self.finished.emit(results)
+            self.signals.progress.emit("Complete!", 100)
+            self.signals.finished.emit(results)
 
         except Exception as e:
             import traceback
             traceback.print_exc()
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+
+# Issues are rendered as one HTML document per tab; QTextDocument lays them out
+# in a single pass instead of building a widget tree per issue
+_ISSUE_DOC_CSS = """
+    h3 { color: #495057; margin-top: 14px; margin-bottom: 4px; }
+    .card { background-color: white; margin-bottom: 8px; }
+    .badge { color: white; font-weight: bold; font-size: 9pt; }
+    .Critical { background-color: #dc3545; }
+    .Major { background-color: #fd7e14; }
+    .Minor { background-color: #ffc107; color: black; }
+    .Strength { background-color: #198754; font-weight: normal; }
+    .location { color: #6c757d; font-size: 9pt; }
+    .title { font-size: 11pt; font-weight: bold; color: #212529; }
+    .detail { color: #6c757d; font-size: 9pt; }
+    .suggestions { color: #495057; font-size: 9pt; background-color: #e7f3ff; }
+    a.fix { color: #667eea; font-weight: bold; }
+"""
 
-    def _load_results(self) -> Dict[str, Any]:
-        """Load all analysis results for this chapter"""
-        db = self.insight_service.insight_db
+_SEVERITY_GROUPS = [
+    ('Critical', 'Critical Issues'),
+    ('Major', 'Major Issues'),
+    ('Minor', 'Minor Issues'),
+    ('Suggestion', 'Suggestions'),
+    ('Strength', 'Strengths'),
+]
 
-        return {
-            'timeline': db.get_latest(self.project_id, 'chapter', self.chapter_id, 'timeline'),
-            'consistency': db.get_latest(self.project_id, 'chapter', self.chapter_id, 'consistency'),
-            'style': db.get_latest(self.project_id, 'chapter', self.chapter_id, 'style'),
-            'reader_snapshot': db.get_latest(self.project_id, 'chapter', self.chapter_id, 'reader_snapshot'),
-        }
 
+# Analyses shown as issue lists; the rest have their own tabs or none
+ISSUE_TAB_TYPES = ('timeline', 'consistency', 'style')
 
-class IssueCardAdvanced(QFrame):
-    """Issue card with AI Fix integration"""
 
-    fix_requested = pyqtSignal(dict, str, str)  # issue_data, scene_id, scene_content
+def _issue_html(index: int, issue: Dict[str, Any]) -> str:
+    """One issue as an HTML card; the AI Fix link carries the issue's index"""
+    severity = issue.get('severity', 'Minor')
+    badge_class = severity if severity in ('Critical', 'Major', 'Minor', 'Strength') else 'Minor'
+    parts = [
+        f'<div class="card"><p><span class="badge {badge_class}">&nbsp;{escape(str(severity))}&nbsp;</span>'
+        f'&nbsp;&nbsp;<span class="location">📍 {escape(str(issue.get("location", "Unknown")))}</span>'
+    ]
+    if issue.get('scene_id') and severity != "Strength":
+        parts.append(f'&nbsp;&nbsp;<a class="fix" href="fix:{index}">🔧 AI Fix</a>')
+    parts.append(f'</p><p class="title">{escape(str(issue.get("issue", "No description")))}</p>')
 
-    def __init__(self, issue: Dict[str, Any], db_manager, project_id: str):
-        super().__init__()
-        self.issue = issue
-        self.db_manager = db_manager
-        self.project_id = project_id
-        self.init_ui()
+    detail = issue.get('detail', '')
+    if detail:
+        parts.append(f'<p class="detail">{escape(str(detail))}</p>')
 
-    def init_ui(self):
-        self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background: white;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 12px;
-                margin: 5px;
-            }
-            QFrame:hover {
-                border-color: #667eea;
-                background: #f8f9fa;
-            }
-        """)
+    suggestions = [s for s in issue.get('suggestions', []) if s]
+    if suggestions:
+        parts.append('<p class="suggestions">💡 ' + '<br>'.join(f'• {escape(str(s))}' for s in suggestions) + '</p>')
 
-        layout = QVBoxLayout(self)
-        layout.setSpacing(8)
-
-        # Header: Severity + Fix button
-        header = QHBoxLayout()
-
-        severity = self.issue.get('severity', 'Minor')
-        badge = QLabel(severity)
-        badge.setStyleSheet(self._get_severity_style(severity))
-        badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header.addWidget(badge)
-
-        header.addStretch()
-
-        # AI Fix button if we have scene_id
-        if self.issue.get('scene_id') and severity != "Strength":
-            fix_btn = QPushButton("🔧 AI Fix")
-            fix_btn.setStyleSheet("""
-                QPushButton {
-                    background: #667eea;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 4px 10px;
-                    font-weight: bold;
-                }
-                QPushButton:hover { background: #5a67d8; }
-            """)
-            fix_btn.clicked.connect(self._request_fix)
-            header.addWidget(fix_btn)
-
-        # Location
-        location = QLabel(f"📍 {self.issue.get('location', 'Unknown')}")
-        location.setStyleSheet("color: #6c757d; font-size: 9pt;")
-        header.addWidget(location)
-
-        layout.addLayout(header)
-
-        # Issue title
-        title = QLabel(self.issue.get('issue', 'No description'))
-        title.setWordWrap(True)
-        title.setStyleSheet("font-size: 11pt; font-weight: bold; color: #212529;")
-        layout.addWidget(title)
-
-        # Detail
-        detail = self.issue.get('detail', '')
-        if detail:
-            detail_label = QLabel(detail)
-            detail_label.setWordWrap(True)
-            detail_label.setStyleSheet("color: #6c757d; font-size: 9pt;")
-            layout.addWidget(detail_label)
-
-        # Suggestions
-        suggestions = self.issue.get('suggestions', [])
-        if suggestions:
-            sug_text = "\n".join([f"• {s}" for s in suggestions if s])
-            sug_label = QLabel(f"💡 {sug_text}")
-            sug_label.setWordWrap(True)
-            sug_label.setStyleSheet(
-                "color: #495057; font-size: 9pt; background: #e7f3ff; padding: 6px; border-radius: 4px;")
-            layout.addWidget(sug_label)
-
-    def _request_fix(self):
-        """Request AI fix for this issue"""
-        scene_id = self.issue.get('scene_id')
-        if not scene_id:
-            return
+    parts.append('</div>')
+    return ''.join(parts)
 
-        scene = self.db_manager.load_item(scene_id)
-        if not scene:
-            return
 
-        self.fix_requested.emit(self.issue, scene_id, getattr(scene, 'content', ''))
+def _issues_html(issues: List[Dict]) -> str:
+    """A whole issues tab as HTML, grouped by severity"""
+    if not issues:
+        return '<p align="center" style="font-size: 13pt; color: #28a745;"><br><br>✅ No issues found!</p>'
 
-    def _get_severity_style(self, severity: str) -> str:
-        styles = {
-            'Critical': "background: #dc3545; color: white; padding: 4px 10px; border-radius: 12px; font-weight: bold; font-size: 9pt;",
-            'Major': "background: #fd7e14; color: white; padding: 4px 10px; border-radius: 12px; font-weight: bold; font-size: 9pt;",
-            'Minor': "background: #ffc107; color: black; padding: 4px 10px; border-radius: 12px; font-weight: bold; font-size: 9pt;",
-            'Strength': "background: #198754; color: white; padding: 4px 10px; border-radius: 12px; font-size: 9pt;",
-        }
-        return styles.get(severity, styles['Minor'])
+    # Group by severity, remembering each issue's index for its fix link
+    groups = {severity: [] for severity, _ in _SEVERITY_GROUPS}
+    observations = []
+    for index, issue in enumerate(issues):
+        groups.get(issue.get('severity'), observations).append(_issue_html(index, issue))
+
+    html = []
+    for severity, title in _SEVERITY_GROUPS + [(None, 'Observations')]:
+        cards = groups[severity] if severity else observations
+        if cards:
+            html.append(f'<h3>{title} ({len(cards)})</h3>')
+            html.extend(cards)
+    return ''.join(html)
 
 
 class AdvancedAnalysisDialog(QDialog):
@@ -305,18 +230,15 @@ class AdvancedAnalysisDialog(QDialog):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background: #f8f9fa; }")
+        browser = QTextBrowser()
+        browser.setOpenLinks(False)
+        browser.setStyleSheet("QTextBrowser { border: none; background: #f8f9fa; }")
+        browser.document().setDefaultStyleSheet(_ISSUE_DOC_CSS)
+        browser.anchorClicked.connect(lambda url, w=widget: self._on_issue_link(w, url))
+        layout.addWidget(browser)
 
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        scroll_layout.setSpacing(8)
-
-        scroll.setWidget(scroll_widget)
-        layout.addWidget(scroll)
-
-        widget.scroll_layout = scroll_layout
+        widget.browser = browser
+        widget.issues = []
         return widget
 
     def create_reader_tab(self) -> QWidget:
@@ -346,89 +268,75 @@ class AdvancedAnalysisDialog(QDialog):
         self.progress_label.setVisible(True)
 
         # Start worker
+        self.results = {}
+        self._last_progress = -1
         self.worker = AnalysisWorker(self.insight_service, self.project_id, self.chapter_id)
-        self.worker.progress.connect(self.on_progress)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.error.connect(self.on_error)
-        self.worker.start()
+        self.worker.signals.progress.connect(self.on_progress, Qt.ConnectionType.QueuedConnection)
+        self.worker.signals.result_ready.connect(self.on_result_ready)
+        self.worker.signals.finished.connect(self.on_finished)
+        self.worker.signals.error.connect(self.on_error)
+        QThreadPool.globalInstance().start(self.worker)
 
     def on_progress(self, message: str, percentage: int):
+        # Analyses finishing together can deliver a burst of updates; only repaint
+        # when the bar actually moves forward
+        if percentage <= self._last_progress:
+            return
+        self._last_progress = percentage
         self.progress_label.setText(message)
         self.progress_bar.setValue(percentage)
 
+    def on_result_ready(self, insight_type: str, insight, html: str):
+        """Show one analysis as soon as the worker has it"""
+        self.results[insight_type] = insight
+        self.display_result(insight_type, insight, html or None)
+
     def on_finished(self, results: Dict[str, Any]):
+        # Each result was already displayed through on_result_ready
         self.progress_bar.setVisible(False)
         self.progress_label.setVisible(False)
         self.results = results
-        self.display_results()
 
     def on_error(self, error: str):
         self.progress_bar.setVisible(False)
         self.progress_label.setText(f"Error: {error}")
         self.progress_label.setStyleSheet("color: #dc3545; font-weight: bold;")
 
-    def display_results(self):
-        """Display all analysis results"""
-        # Timeline
-        if self.results.get('timeline'):
-            timeline_data = self.results['timeline'].payload
-            issues = timeline_data.get('issues', [])
-            self.populate_issues_tab(self.timeline_tab, issues)
-
-        # Consistency
-        if self.results.get('consistency'):
-            cons_data = self.results['consistency'].payload
-            issues = cons_data.get('issues', [])
-            self.populate_issues_tab(self.consistency_tab, issues)
-
-        # Style
-        if self.results.get('style'):
-            style_data = self.results['style'].payload
-            issues = style_data.get('issues', [])
-            self.populate_issues_tab(self.style_tab, issues)
-
-        # Reader simulation
-        if self.results.get('reader_snapshot'):
-            reader_data = self.results['reader_snapshot'].payload
-            self.display_reader_snapshot(reader_data)
-
-    def populate_issues_tab(self, tab: QWidget, issues: List[Dict]):
-        """Populate tab with issue cards"""
-        layout = tab.scroll_layout
-
-        # Clear existing
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        if not issues:
-            no_issues = QLabel("✅ No issues found!")
-            no_issues.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_issues.setStyleSheet("font-size: 13pt; color: #28a745; padding: 40px;")
-            layout.addWidget(no_issues)
-        else:
-            # Group by severity
-            groups = [
-                ('Critical Issues', [i for i in issues if i.get('severity') == 'Critical']),
-                ('Major Issues', [i for i in issues if i.get('severity') == 'Major']),
-                ('Minor Issues', [i for i in issues if i.get('severity') == 'Minor']),
-                ('Suggestions', [i for i in issues if i.get('severity') == 'Suggestion']),
-                ('Strengths', [i for i in issues if i.get('severity') == 'Strength']),
-                ('Observations', [i for i in issues if i.get('severity') not in ['Critical', 'Major', 'Minor', 'Suggestion', 'Strength']])
-            ]
-
-            for title, issue_list in groups:
-                if issue_list:
-                    section = CollapsibleSectionAdvanced(f"{title} ({len(issue_list)})")
-                    layout.addWidget(section)
-
-                    for issue in issue_list:
-                        card = IssueCardAdvanced(issue, self.db_manager, self.project_id)
-                        card.fix_requested.connect(self.on_fix_requested)
-                        section.add_widget(card)
-
-        layout.addStretch()
+    def display_result(self, insight_type: str, insight, html: Optional[str] = None):
+        """Display one analysis result in its tab"""
+        issue_tabs = {
+            'timeline': self.timeline_tab,
+            'consistency': self.consistency_tab,
+            'style': self.style_tab,
+        }
+        if insight_type in issue_tabs:
+            self.populate_issues_tab(issue_tabs[insight_type], insight.payload.get('issues', []), html)
+        elif insight_type == 'reader_snapshot':
+            self.display_reader_snapshot(insight.payload)
+
+    def populate_issues_tab(self, tab: QWidget, issues: List[Dict], html: Optional[str] = None):
+        """Render the tab's issues, using html when it was already built off the GUI thread"""
+        tab.issues = issues
+        tab.browser.setHtml(html if html is not None else _issues_html(issues))
+
+    def _on_issue_link(self, tab: QWidget, url: QUrl):
+        """Handle an AI Fix link in an issues tab"""
+        if url.scheme() != 'fix':
+            return
+        try:
+            issue = tab.issues[int(url.path())]
+        except (ValueError, IndexError):
+            return
+
+        scene_id = issue.get('scene_id')
+        if not scene_id:
+            return
+
+        scene = self.db_manager.load_item(scene_id)
+        if not scene:
+            return
+
+        self.on_fix_requested(issue, scene_id, getattr(scene, 'content', ''))
 
     def display_reader_snapshot(self, data: Dict[str, Any]):
         """Display reader simulation results"""
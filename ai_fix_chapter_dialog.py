@@ -197,11 +197,12 @@ class SceneReviewDialog(QDialog):
         tabs = QTabWidget()
         
         orig_highlighted, fixed_highlighted = get_highlighted_diffs(self.original_text, self.fixed_text)
+        orig_html = f"<div style='white-space: pre-wrap;'>{orig_highlighted}</div>"
+        fixed_html = f"<div style='white-space: pre-wrap;'>{fixed_highlighted}</div>"
 
-        # Original text
+        # Original text (filled when its tab is first opened; side-by-side is the default)
         original_widget = QTextEdit()
         original_widget.setReadOnly(True)
-        original_widget.setHtml(f"<div style='white-space: pre-wrap;'>{orig_highlighted}</div>")
         original_widget.setStyleSheet("""
             QTextEdit {
                 background: #1E1E1E;
@@ -217,7 +218,6 @@ class SceneReviewDialog(QDialog):
         # Fixed text
         fixed_widget = QTextEdit()
         fixed_widget.setReadOnly(True)
-        fixed_widget.setHtml(f"<div style='white-space: pre-wrap;'>{fixed_highlighted}</div>")
         fixed_widget.setStyleSheet("""
             QTextEdit {
                 background: #1A1A1A;
@@ -235,7 +235,7 @@ class SceneReviewDialog(QDialog):
 
         original_side = QTextEdit()
         original_side.setReadOnly(True)
-        original_side.setHtml(f"<div style='white-space: pre-wrap;'>{orig_highlighted}</div>")
+        original_side.setHtml(orig_html)
         original_side.setStyleSheet("""
             QTextEdit {
                 background: #1E1E1E;
@@ -248,7 +248,7 @@ class SceneReviewDialog(QDialog):
 
         fixed_side = QTextEdit()
         fixed_side.setReadOnly(True)
-        fixed_side.setHtml(f"<div style='white-space: pre-wrap;'>{fixed_highlighted}</div>")
+        fixed_side.setHtml(fixed_html)
         fixed_side.setStyleSheet("""
             QTextEdit {
                 background: #1A1A1A;
@@ -274,6 +274,16 @@ class SceneReviewDialog(QDialog):
         tabs.addTab(splitter, "📊 Side-by-Side")
         tabs.setCurrentIndex(2) # Default to side-by-side
 
+        # The whole chapter is laid out twice already; only build the single views on demand
+        pending_html = {0: (original_widget, orig_html), 1: (fixed_widget, fixed_html)}
+
+        def fill_tab(index):
+            widget, html = pending_html.pop(index, (None, None))
+            if widget is not None:
+                widget.setHtml(html)
+
+        tabs.currentChanged.connect(fill_tab)
+
         layout.addWidget(tabs)
 
         # Stats
@@ -3,10 +3,12 @@ Centralized AI Manager - Single source of truth for all AI operations
 """
 
 import time
+import random
 import re
-from typing import Optional, Dict, Any, List
-from PyQt6.QtCore import QSettings
+from typing import Optional, Dict, Any, List, Callable
+from PyQt6.QtCore import QMutex, QMutexLocker
 
+from app_settings import thread_settings
 from utils.rate_limiter import RateLimiter
 
 try:
@@ -16,6 +18,10 @@ except ImportError:
     OPENAI_AVAILABLE = False
 
 
+class APICancelled(Exception):
+    """Raised by call_api when its should_stop callback asks it to give up"""
+
+
 class AIManager:
     """Centralized AI manager for all OpenAI and Azure OpenAI operations"""
 
@@ -34,7 +40,10 @@ class AIManager:
             return
 
         self.client: Optional[AzureOpenAI | OpenAI] = None
-        self.settings = QSettings("Rabbit Consulting", "Novelist AI")
+
+        # Serializes client rebuilds from the settings dialog's pool thread
+        # and connection tests on the GUI thread
+        self._client_mutex = QMutex()
         
         # Track models that don't support temperature
         self._unsupported_temp_models = set()
@@ -50,57 +59,63 @@ class AIManager:
         self._initialized = True
         self.refresh_client()
 
+    @property
+    def settings(self):
+        """Settings for the calling thread; the manager is used from pool threads too"""
+        return thread_settings()
+
     def refresh_client(self):
         """Refresh the AI client with current settings"""
         if not OPENAI_AVAILABLE:
             print("ERROR: OpenAI library not available")
             return
 
-        self._unsupported_temp_models.clear()
-        provider = self.settings.value("ai/provider", "azure")
-        print(f"Refreshing AI client (Provider: {provider})...")
+        with QMutexLocker(self._client_mutex):
+            self._unsupported_temp_models.clear()
+            provider = self.settings.value("ai/provider", "azure")
+            print(f"Refreshing AI client (Provider: {provider})...")
 
-        if provider == "openai":
-            api_key = self.settings.value("openai/api_key", "")
-            model = self.settings.value("openai/model", "gpt-4")
+            if provider == "openai":
+                api_key = self.settings.value("openai/api_key", "")
+                model = self.settings.value("openai/model", "gpt-4")
             
-            print(f"  Model: {model}")
-            print(f"  API Key: {'*' * 20}" if api_key else "  API Key: (empty)")
-
-            if api_key:
-                try:
-                    self.client = OpenAI(api_key=api_key)
-                    print("  ✓ OpenAI client initialized successfully")
-                except Exception as e:
-                    print(f"  ✗ Error initializing OpenAI client: {e}")
+                print(f"  Model: {model}")
+                print(f"  API Key: {'*' * 20}" if api_key else "  API Key: (empty)")
+
+                if api_key:
+                    try:
+                        self.client = OpenAI(api_key=api_key)
+                        print("  ✓ OpenAI client initialized successfully")
+                    except Exception as e:
+                        print(f"  ✗ Error initializing OpenAI client: {e}")
+                        self.client = None
+                else:
+                    print("  ✗ Missing OpenAI credentials")
                     self.client = None
             else:
-                print("  ✗ Missing OpenAI credentials")
-                self.client = None
-        else:
-            # Default to Azure
-            api_key = self.settings.value("azure/api_key", "")
-            endpoint = self.settings.value("azure/endpoint", "")
-            api_version = self.settings.value("azure/api_version", "2024-02-15-preview")
-
-            print(f"  Endpoint: {endpoint[:30]}..." if endpoint else "  Endpoint: (empty)")
-            print(f"  API Key: {'*' * 20}" if api_key else "  API Key: (empty)")
-            print(f"  API Version: {api_version}")
-
-            if api_key and endpoint:
-                try:
-                    self.client = AzureOpenAI(
-                        api_key=api_key,
-                        azure_endpoint=endpoint,
-                        api_version=api_version
-                    )
-                    print("  ✓ Azure OpenAI client initialized successfully")
-                except Exception as e:
-                    print(f"  ✗ Error initializing Azure client: {e}")
+                # Default to Azure
+                api_key = self.settings.value("azure/api_key", "")
+                endpoint = self.settings.value("azure/endpoint", "")
+                api_version = self.settings.value("azure/api_version", "2024-02-15-preview")
+
+                print(f"  Endpoint: {endpoint[:30]}..." if endpoint else "  Endpoint: (empty)")
+                print(f"  API Key: {'*' * 20}" if api_key else "  API Key: (empty)")
+                print(f"  API Version: {api_version}")
+
+                if api_key and endpoint:
+                    try:
+                        self.client = AzureOpenAI(
+                            api_key=api_key,
+                            azure_endpoint=endpoint,
+                            api_version=api_version
+                        )
+                        print("  ✓ Azure OpenAI client initialized successfully")
+                    except Exception as e:
+                        print(f"  ✗ Error initializing Azure client: {e}")
+                        self.client = None
+                else:
+                    print("  ✗ Missing Azure credentials")
                     self.client = None
-            else:
-                print("  ✗ Missing Azure credentials")
-                self.client = None
 
     def is_configured(self) -> bool:
         """Check if AI is properly configured"""
@@ -130,9 +145,19 @@ class AIManager:
     def call_api(self, messages: List[Dict[str, str]],
                  temperature: Optional[float] = None,
                  max_tokens: Optional[int] = None,
-                 system_message: Optional[str] = None) -> str:
+                 system_message: Optional[str] = None,
+                 response_format: Optional[Dict[str, str]] = None,
+                 timeout: Optional[float] = None,
+                 should_stop: Optional[Callable[[], bool]] = None) -> str:
         """
         Call OpenAI/Azure API with messages with automatic retries and rate limiting.
+
+        response_format is passed through (e.g. {"type": "json_object"}) and
+        dropped automatically if the deployment rejects it. timeout (seconds)
+        bounds each HTTP request; None uses the client default. With
+        should_stop, the response is streamed and the call raises APICancelled
+        as soon as should_stop() returns True, instead of waiting for the
+        full completion.
         """
         print("call_api called")
 
@@ -171,8 +196,15 @@ class AIManager:
         if not is_o1 and not disable_temp:
             params["temperature"] = temp
 
+        if response_format:
+            params["response_format"] = response_format
+
+        if timeout is not None:
+            params["timeout"] = timeout
+
         max_retries = 5
         base_delay = 2.0
+        max_delay = 60.0
         
         for attempt in range(max_retries):
             try:
@@ -180,15 +212,16 @@ class AIManager:
                 self.limiter.wait_if_needed()
                 
                 print(f"Calling API (Attempt {attempt+1}/{max_retries}) with model: {deployment}")
-                response = self.client.chat.completions.create(**params)
+                result = self._create_completion(params, should_stop)
                 
                 # Record successful request
                 self.limiter.record_request()
                 
-                result = response.choices[0].message.content
                 print(f"API call successful, got {len(result)} characters")
                 return result
 
+            except APICancelled:
+                raise
             except Exception as e:
                 err_msg = str(e)
                 print(f"API call error (Attempt {attempt+1}): {err_msg}")
@@ -213,20 +246,28 @@ class AIManager:
                     # but let's just let it retry in the next loop iteration to keep it simple.
                     # OR we can just update it and try again right now.
                     try:
-                        response = self.client.chat.completions.create(**params)
+                        result = self._create_completion(params, should_stop)
                         self.limiter.record_request()
-                        result = response.choices[0].message.content
                         return result
+                    except APICancelled:
+                        raise
                     except Exception as retry_e:
                         err_msg = str(retry_e)
                         print(f"Retry without temperature failed: {err_msg}")
 
+                if ("response_format" in err_msg.lower() and "response_format" in params
+                        and attempt < max_retries - 1):
+                    print("  Deployment rejected response_format. Retrying without it...")
+                    del params["response_format"]
+                    continue
+
                 # Check for rate limit error (429)
                 is_rate_limit = "429" in err_msg or "RateLimitReached" in err_msg or "rate limit" in err_msg.lower()
                 
                 if is_rate_limit and attempt < max_retries - 1:
                     # Try to extract "retry after X seconds"
-                    wait_time = base_delay * (2 ** attempt) # Exponential backoff
+                    # Exponential backoff; jitter keeps parallel callers from retrying in lockstep
+                    wait_time = min(max_delay, base_delay * (2 ** attempt)) + random.uniform(0, 1)
                     
                     # Pattern for Azure/OpenAI "retry after" messages
                     retry_match = re.search(r"retry after (\d+) second", err_msg.lower())
@@ -237,6 +278,12 @@ class AIManager:
                     time.sleep(wait_time)
                     continue
                 
+                # Bad requests, auth failures and missing deployments won't fix themselves
+                # (a rejected temperature was already dropped from params above)
+                status = getattr(e, "status_code", None)
+                if status in (400, 401, 403, 404, 422) and not is_temp_err:
+                    raise Exception(f"API call failed ({status}): {err_msg}")
+
                 # If it's the last attempt or not a rate limit error we want to retry
                 if attempt == max_retries - 1:
                     raise Exception(f"API call failed after {max_retries} attempts: {err_msg}")
@@ -245,12 +292,54 @@ class AIManager:
                 # unless it's an error we know won't be fixed by retrying.
                 # But wait, we already handled the temperature retry internally above.
                 
-                # Let's add a small sleep for general errors to avoid tight loops
-                time.sleep(1.0)
+                # Timeouts, 5xx and connection errors: back off before retrying
+                wait_time = min(max_delay, 2 ** attempt) + random.uniform(0, 1)
+                print(f"Transient error. Waiting {wait_time:.1f}s before retry...")
+                time.sleep(wait_time)
                 continue
 
         return "" # Should not reach here
 
+    def _create_completion(self, params: Dict[str, Any],
+                           should_stop: Optional[Callable[[], bool]] = None) -> str:
+        """One completion request; streamed when should_stop is given so it can be abandoned"""
+        if should_stop is None:
+            response = self.client.chat.completions.create(**params)
+            return response.choices[0].message.content
+
+        if should_stop():
+            raise APICancelled("API call cancelled")
+        stream = self.client.chat.completions.create(**params, stream=True)
+        parts = []
+        try:
+            for chunk in stream:
+                if should_stop():
+                    raise APICancelled("API call cancelled")
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+        finally:
+            # Closes the HTTP connection when abandoning the stream early
+            stream.close()
+        return "".join(parts)
+
+    def get_embedding_model(self) -> str:
+        """Get the embedding model (the deployment name on Azure)"""
+        return self.settings.value("ai/embedding_model", "text-embedding-3-small")
+
+    def embed(self, texts: List[str], timeout: Optional[float] = None) -> List[List[float]]:
+        """Embed a list of texts in a single request; timeout (seconds) bounds the HTTP request"""
+        if not self.is_configured():
+            raise Exception("AI is not configured. Please configure in Settings.")
+
+        params = {"model": self.get_embedding_model(), "input": texts}
+        if timeout is not None:
+            params["timeout"] = timeout
+
+        self.limiter.wait_if_needed()
+        response = self.client.embeddings.create(**params)
+        self.limiter.record_request()
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
     def test_connection(self) -> tuple[bool, str]:
         """Test the AI connection"""
         print("test_connection called")
@@ -3,6 +3,7 @@ AI Prompts - Centralized prompts for all AI features
 """
 from typing import Dict, Any, List
 import json
+import re
 
 
 class AIPrompts:
@@ -73,7 +74,6 @@ Provide ONLY the rewritten text with no explanations or preamble."""
         system = "You are a literary analyst helping authors organize their novels."
 
         # Strip HTML and get plain text
-        import re
         plain_text = re.sub(r'<[^>]+>', ' ', scene_content)
         plain_text = plain_text[:2000]  # Limit length
 
@@ -214,7 +214,6 @@ Provide analysis of:
         # Get sample text from scenes
         samples = []
         for scene in scene_contents[:5]:
-            import re
             text = re.sub(r'<[^>]+>', ' ', scene.get('content', ''))
             samples.append(text[:800])
 
@@ -684,6 +683,10 @@ Analyze:
     """.strip()
 
 
+# A property line such as "SUMMARY:" or "**Summary:**", matched case-insensitively
+_SCENE_PROPERTY_RE = re.compile(r'^[\s*]*(SUMMARY|GOAL|CONFLICT|OUTCOME)\**:', re.IGNORECASE)
+
+
 class PromptParser:
     """Helper to parse AI responses"""
 
@@ -698,30 +701,19 @@ class PromptParser:
         current_key = None
         current_value = []
 
-        # Keywords to look for (case-insensitive)
-        keywords = {
-            'SUMMARY': 'summary',
-            'GOAL': 'goal',
-            'CONFLICT': 'conflict',
-            'OUTCOME': 'outcome'
-        }
-
         for line in lines:
             clean_line = line.strip()
             if not clean_line:
                 continue
 
-            # Check if line starts with any of our keywords
+            # Check if line starts with one of our keywords
             # Handle markdown like **SUMMARY:** or just SUMMARY:
             found_key = None
-            for kw, key_id in keywords.items():
-                # Look for keyword at start, ignoring markdown asterisks
-                pattern = clean_line.upper().replace('*', '').strip()
-                if pattern.startswith(kw + ':'):
-                    found_key = key_id
-                    # Get the content after the colon
-                    content = clean_line.split(':', 1)[1].strip()
-                    break
+            match = _SCENE_PROPERTY_RE.match(clean_line)
+            if match:
+                found_key = match.group(1).lower()
+                # Get the content after the colon
+                content = clean_line.split(':', 1)[1].strip()
 
             if found_key:
                 # Save previous key if exists
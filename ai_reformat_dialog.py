@@ -434,7 +434,7 @@ class AIReformatDialog(QDialog):
     def on_progress(self, current: int, total: int, message: str):
         self.progress_label.setText(message)
         if total > 0:
-            self.progress_bar.setValue(int((current / total) * 100))
+            self.progress_bar.setValue(current * 100 // total)
 
     def on_scene_complete(self, scene_id: str, success: bool, message: str):
         scene_info = self.scene_lookup.get(scene_id, {"name": "Unknown", "chapter": "Unknown"})
@@ -4,8 +4,8 @@ Enhanced Azure OpenAI integration for comprehensive AI-powered analysis
 
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
-from PyQt6.QtCore import QSettings
 import json
+from app_settings import thread_settings
 from text_utils import format_scene_for_ai
 from ai_prompts import AIPrompts as prompts
 
@@ -31,10 +31,14 @@ class AIAnalyzer:
     """Enhanced AI analyzer using Azure OpenAI"""
 
     def __init__(self):
-        self.settings = QSettings()
         self.client: Optional[AzureOpenAI] = None
         self._initialize_client()
 
+    @property
+    def settings(self):
+        """Settings for the calling thread; analyses run on executor threads"""
+        return thread_settings()
+
     def _initialize_client(self):
         """Initialize Azure OpenAI client"""
         if not OPENAI_AVAILABLE:
@@ -0,0 +1,30 @@
+"""
+Shared application settings - one QSettings instance for the GUI thread
+"""
+
+import threading
+
+from PyQt6.QtCore import QSettings
+
+# Constructing QSettings probes the backing store (registry/ini file), so
+# every window, dialog and manager on the GUI thread binds to this instance
+SETTINGS = QSettings("Rabbit Consulting", "Novelist AI")
+
+_thread_local = threading.local()
+
+
+def thread_settings() -> QSettings:
+    """
+    Settings for the calling thread.
+
+    QSettings is reentrant, not thread-safe: worker threads each get their own
+    instance (created once per thread), while the GUI thread uses SETTINGS.
+    Writes through one instance are visible to the others in the same process.
+    """
+    if threading.current_thread() is threading.main_thread():
+        return SETTINGS
+    settings = getattr(_thread_local, 'settings', None)
+    if settings is None:
+        settings = QSettings("Rabbit Consulting", "Novelist AI")
+        _thread_local.settings = settings
+    return settings
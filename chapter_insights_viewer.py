@@ -7,8 +7,8 @@ from PyQt6.QtWidgets import (
     QScrollArea, QFrame, QTabWidget, QTextEdit, QGroupBox, QToolButton,
     QSpacerItem, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
+from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QPainter
 from typing import Dict, Any, List, Optional
 
 
@@ -23,24 +23,8 @@ class CollapsibleSectionInsight(QWidget):
         self.toggle_btn = QPushButton(title)
         self.toggle_btn.setCheckable(True)
         self.toggle_btn.setChecked(True)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                border: none;
-                font-size: 10pt;
-                font-weight: bold;
-                color: #A0A0A0;
-                padding: 6px;
-                background: #1A1A1A;
-                text-align: left;
-                border-bottom: 1px solid #2D2D2D;
-            }
-            QPushButton:hover {
-                background: #252526;
-            }
-            QPushButton:checked {
-                color: #7C4DFF;
-            }
-        """)
+        # Styled by _ISSUE_LIST_STYLESHEET on the containing list
+        self.toggle_btn.setObjectName("sectionToggle")
         self.toggle_btn.toggled.connect(self._on_toggle)
 
         self.content_area = QWidget()
@@ -58,6 +42,105 @@ class CollapsibleSectionInsight(QWidget):
         self.content_layout.addWidget(widget)
 
 
+# Styles for every issue card, set once on the list that holds them so Qt
+# parses a single stylesheet however many cards are shown
+_ISSUE_LIST_STYLESHEET = """
+    QWidget#scrollContent { background: transparent; }
+    QPushButton#sectionToggle {
+        border: none;
+        font-size: 10pt;
+        font-weight: bold;
+        color: #A0A0A0;
+        padding: 6px;
+        background: #1A1A1A;
+        text-align: left;
+        border-bottom: 1px solid #2D2D2D;
+    }
+    QPushButton#sectionToggle:hover {
+        background: #252526;
+    }
+    QPushButton#sectionToggle:checked {
+        color: #7C4DFF;
+    }
+    QFrame#insightCard {
+        background: #252526;
+        border-left: 3px solid #7C4DFF;
+        padding: 10px;
+        margin: 5px 0;
+        border-top-right-radius: 6px;
+        border-bottom-right-radius: 6px;
+    }
+    QFrame#insightCard:hover {
+        background: #2D2D2D;
+        border-left-color: #00D2FF;
+    }
+    QLabel#issueLocation { color: #888; font-size: 8pt; }
+    QLabel#issueText { font-size: 9pt; color: #E0E0E0; font-weight: bold; }
+    QLabel#issueDetail { font-size: 8pt; color: #A0A0A0; }
+    QPushButton#jumpButton {
+        background: #3E3E42;
+        color: #E0E0E0;
+        border: none;
+        border-radius: 4px;
+        font-size: 8pt;
+        padding: 0 8px;
+    }
+    QPushButton#jumpButton:hover { background: #4E4E52; }
+    QPushButton#fixButton {
+        background: #7C4DFF;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 8pt;
+        padding: 0 8px;
+    }
+    QPushButton#fixButton:hover { background: #9E7CFF; }
+"""
+
+class SeverityBadge(QLabel):
+    """Rounded severity pill coloured through its palette rather than a stylesheet"""
+
+    COLORS = {
+        'Critical': ('#dc3545', 'white'),
+        'Major': ('#fd7e14', 'white'),
+        'Minor': ('#ffc107', 'black'),
+        'Strength': ('#198754', 'white'),
+    }
+    _palettes = {}  # severity -> QPalette, built on first use (needs the QApplication)
+
+    def __init__(self, severity: str, parent=None):
+        super().__init__(severity, parent)
+        self.setTextFormat(Qt.TextFormat.PlainText)
+        key = severity if severity in self.COLORS else 'Minor'
+        self.setPalette(self._palette(key))
+        font = self.font()
+        font.setPointSize(8)
+        font.setBold(key != 'Strength')
+        self.setFont(font)
+        self.setContentsMargins(6, 3, 6, 3)
+
+    @classmethod
+    def _palette(cls, key: str) -> QPalette:
+        palette = cls._palettes.get(key)
+        if palette is None:
+            background, text = cls.COLORS[key]
+            palette = QPalette()
+            palette.setColor(QPalette.ColorRole.Window, QColor(background))
+            palette.setColor(QPalette.ColorRole.WindowText, QColor(text))
+            cls._palettes[key] = palette
+        return palette
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.palette().color(QPalette.ColorRole.Window))
+        painter.drawRoundedRect(self.rect(), 8, 8)
+        painter.end()
+        super().paintEvent(event)
+
+
 class InsightIssueCard(QFrame):
     """Compact issue card for chapter view"""
 
@@ -71,20 +154,8 @@ class InsightIssueCard(QFrame):
 
     def init_ui(self):
         self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background: #252526;
-                border-left: 3px solid #7C4DFF;
-                padding: 10px;
-                margin: 5px 0;
-                border-top-right-radius: 6px;
-                border-bottom-right-radius: 6px;
-            }
-            QFrame:hover {
-                background: #2D2D2D;
-                border-left-color: #00D2FF;
-            }
-        """)
+        # Styled by _ISSUE_LIST_STYLESHEET on the containing list
+        self.setObjectName("insightCard")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 10, 12, 10)
@@ -95,8 +166,7 @@ class InsightIssueCard(QFrame):
 
         # Severity badge
         severity = self.issue.get('severity', 'Minor')
-        badge = QLabel(severity)
-        badge.setStyleSheet(self._get_severity_style(severity))
+        badge = SeverityBadge(severity)
         badge.setFixedWidth(70)
         badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_layout.addWidget(badge)
@@ -105,7 +175,8 @@ class InsightIssueCard(QFrame):
         loc = self.issue.get('location', '')
         if loc:
             loc_label = QLabel(f"📍 {loc}")
-            loc_label.setStyleSheet("color: #888; font-size: 8pt;")
+            loc_label.setTextFormat(Qt.TextFormat.PlainText)
+            loc_label.setObjectName("issueLocation")
             loc_label.setWordWrap(True)
             header_layout.addWidget(loc_label)
 
@@ -115,16 +186,18 @@ class InsightIssueCard(QFrame):
         # Issue text
         issue_text = self.issue.get('issue', 'No description')
         label = QLabel(issue_text)
+        label.setTextFormat(Qt.TextFormat.PlainText)
         label.setWordWrap(True)
-        label.setStyleSheet("font-size: 9pt; color: #E0E0E0; font-weight: bold;")
+        label.setObjectName("issueText")
         layout.addWidget(label)
 
         # Detail text (optional)
         detail = self.issue.get('detail', '')
         if detail:
             detail_label = QLabel(detail)
+            detail_label.setTextFormat(Qt.TextFormat.PlainText)
             detail_label.setWordWrap(True)
-            detail_label.setStyleSheet("font-size: 8pt; color: #A0A0A0;")
+            detail_label.setObjectName("issueDetail")
             layout.addWidget(detail_label)
 
         # Buttons layout
@@ -135,17 +208,7 @@ class InsightIssueCard(QFrame):
         # Jump button
         self.jump_btn = QPushButton("👁️ Jump to Scene")
         self.jump_btn.setFixedHeight(24)
-        self.jump_btn.setStyleSheet("""
-            QPushButton {
-                background: #3E3E42;
-                color: #E0E0E0;
-                border: none;
-                border-radius: 4px;
-                font-size: 8pt;
-                padding: 0 8px;
-            }
-            QPushButton:hover { background: #4E4E52; }
-        """)
+        self.jump_btn.setObjectName("jumpButton")
         self.jump_btn.clicked.connect(lambda: self.jump_requested.emit(self.issue))
         btn_layout.addWidget(self.jump_btn)
 
@@ -153,32 +216,21 @@ class InsightIssueCard(QFrame):
         if self.issue.get('scene_id') and severity != "Strength":
             self.fix_btn = QPushButton("✨ AI Fix")
             self.fix_btn.setFixedHeight(24)
-            self.fix_btn.setStyleSheet("""
-                QPushButton {
-                    background: #7C4DFF;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    font-size: 8pt;
-                    padding: 0 8px;
-                }
-                QPushButton:hover { background: #9E7CFF; }
-            """)
+            self.fix_btn.setObjectName("fixButton")
             self.fix_btn.clicked.connect(lambda: self.fix_requested.emit(self.issue))
             btn_layout.addWidget(self.fix_btn)
 
         btn_layout.addStretch()
         layout.addLayout(btn_layout)
 
-    def _get_severity_style(self, severity: str) -> str:
-        styles = {
-            'Critical': "background: #dc3545; color: white; padding: 3px 6px; border-radius: 8px; font-size: 8pt; font-weight: bold;",
-            'Major': "background: #fd7e14; color: white; padding: 3px 6px; border-radius: 8px; font-size: 8pt; font-weight: bold;",
-            'Minor': "background: #ffc107; color: black; padding: 3px 6px; border-radius: 8px; font-size: 8pt; font-weight: bold;",
-            'Strength': "background: #198754; color: white; padding: 3px 6px; border-radius: 8px; font-size: 8pt;",
-        }
-        return styles.get(severity, styles['Minor'])
+
+# Status line styles; _set_status only re-applies one when the state changes
+_STATUS_STYLES = {
+    'idle': "color: #A0A0A0; font-style: italic; margin-bottom: 5px;",
+    'error': "color: #dc3545; font-weight: bold;",
+    'available': "color: #28a745; font-weight: bold; margin: 5px 0;",
+    'missing': "color: #6c757d; font-style: italic; margin: 5px 0;",
+}
 
 
 class ChapterInsightsViewer(QWidget):
@@ -189,6 +241,9 @@ class ChapterInsightsViewer(QWidget):
     jump_requested = pyqtSignal(dict) # issue_data
     collapse_toggled = pyqtSignal(bool)
 
+    # Cards are built this many at a time, as the list is scrolled near its end
+    CARD_BATCH_SIZE = 20
+
     def __init__(self):
         super().__init__()
         self.chapter_id = None
@@ -264,7 +319,8 @@ class ChapterInsightsViewer(QWidget):
         
         # Status label
         self.status_label = QLabel("No analysis yet")
-        self.status_label.setStyleSheet("color: #A0A0A0; font-style: italic;")
+        self._status_state = None
+        self._set_status("No analysis yet", 'idle')
         status_action_layout.addWidget(self.status_label)
         
         status_action_layout.addStretch()
@@ -407,19 +463,22 @@ class ChapterInsightsViewer(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Only the scroll area and its viewport need clearing; a bare QWidget rule
+        # here would be matched against every card in the list
+        scroll.viewport().setObjectName("issuesViewport")
         scroll.setStyleSheet("""
             QScrollArea { 
                 border: none; 
                 background: transparent; 
             }
-            QWidget {
+            QWidget#issuesViewport {
                 background: transparent;
             }
         """)
 
         scroll_content = QWidget()
         scroll_content.setObjectName("scrollContent")
-        scroll_content.setStyleSheet("QWidget#scrollContent { background: transparent; }")
+        scroll_content.setStyleSheet(_ISSUE_LIST_STYLESHEET)
         scroll_layout = QVBoxLayout(scroll_content)
         scroll_layout.setSpacing(10)
         scroll_layout.setContentsMargins(5, 5, 5, 5)
@@ -429,6 +488,19 @@ class ChapterInsightsViewer(QWidget):
 
         # Store reference
         widget.scroll_layout = scroll_layout
+        widget.scroll_content = scroll_content
+        widget.pending_cards = None
+
+        # Build more cards when the user nears the end, or while they don't fill the view yet
+        bar = scroll.verticalScrollBar()
+        bar.valueChanged.connect(lambda _value, w=widget, b=bar: self._on_issues_scrolled(w, b))
+        bar.rangeChanged.connect(lambda _min, _max, w=widget, b=bar: self._on_issues_scrolled(w, b))
+
+        # Re-checks after a batch has been laid out; owned by the tab so it dies with it
+        widget.build_timer = QTimer(widget)
+        widget.build_timer.setSingleShot(True)
+        widget.build_timer.setInterval(0)
+        widget.build_timer.timeout.connect(lambda w=widget, b=bar: self._on_issues_scrolled(w, b))
 
         return widget
 
@@ -460,8 +532,7 @@ class ChapterInsightsViewer(QWidget):
             traceback.print_exc()
 
             # Show error in UI
-            self.status_label.setText(f"Error loading insights: {str(e)}")
-            self.status_label.setStyleSheet("color: #dc3545; font-weight: bold;")
+            self._set_status(f"Error loading insights: {str(e)}", 'error')
 
     def _load_insights(self):
         """Load and display existing insights"""
@@ -518,11 +589,9 @@ class ChapterInsightsViewer(QWidget):
         has_insights = any([timeline, consistency, style, reader])
 
         if has_insights:
-            self.status_label.setText("✓ Analysis available")
-            self.status_label.setStyleSheet("color: #28a745; font-weight: bold; margin: 5px 0;")
+            self._set_status("✓ Analysis available", 'available')
         else:
-            self.status_label.setText("No analysis yet - click 'Run AI Analysis'")
-            self.status_label.setStyleSheet("color: #6c757d; font-style: italic; margin: 5px 0;")
+            self._set_status("No analysis yet - click 'Run AI Analysis'", 'missing')
 
         # Populate tabs
         if timeline:
@@ -559,6 +628,7 @@ class ChapterInsightsViewer(QWidget):
         layout = widget.scroll_layout
 
         # Clear existing
+        widget.pending_cards = None
         while layout.count():
             child = layout.takeAt(0)
             if child.widget():
@@ -578,23 +648,61 @@ class ChapterInsightsViewer(QWidget):
             ('Observations', [i for i in issues if i.get('severity') not in ['Critical', 'Major', 'Minor', 'Suggestion', 'Strength']])
         ]
 
+        layout.addStretch()
+        widget.pending_cards = self._iter_issue_cards(layout, groups)
+        self._build_more_cards(widget)
+
+    def _iter_issue_cards(self, layout: QVBoxLayout, groups: List):
+        """Build sections and cards one card per step, above the trailing stretch; yields each card's section"""
         for title, issue_list in groups:
             if issue_list:
                 section = CollapsibleSectionInsight(f"{title} ({len(issue_list)})")
-                layout.addWidget(section)
+                layout.insertWidget(layout.count() - 1, section)
 
                 for issue in issue_list:
                     card = InsightIssueCard(issue)
                     card.fix_requested.connect(lambda i: self.fix_requested.emit(i, self.chapter_id))
                     card.jump_requested.connect(self.jump_requested.emit)
                     section.add_widget(card)
+                    yield section
 
-        layout.addStretch()
+    def _build_more_cards(self, widget: QWidget):
+        """Build the next batch of pending cards"""
+        if widget.pending_cards is None:
+            return
+
+        # Lay out and repaint once after the batch is in, not once per card
+        content = widget.scroll_content
+        content.setUpdatesEnabled(False)
+        try:
+            built = 0
+            for section in widget.pending_cards:
+                # Cards in a collapsed section don't fill the view, so they don't count
+                if section.toggle_btn.isChecked():
+                    built += 1
+                    if built >= self.CARD_BATCH_SIZE:
+                        break
+            else:
+                widget.pending_cards = None
+        finally:
+            content.setUpdatesEnabled(True)
+            content.updateGeometry()
+
+        # A batch that leaves the scroll range unchanged emits no signal, so
+        # look again once it has been laid out
+        if widget.pending_cards is not None:
+            widget.build_timer.start()
+
+    def _on_issues_scrolled(self, widget: QWidget, bar):
+        """Build more cards once the view is within a page of the last one"""
+        if bar.maximum() - bar.value() < bar.pageStep():
+            self._build_more_cards(widget)
 
     def _show_empty(self, widget: QWidget):
         """Show empty state in widget"""
         layout = widget.scroll_layout
 
+        widget.pending_cards = None
         while layout.count():
             child = layout.takeAt(0)
             if child.widget():
@@ -625,6 +733,13 @@ class ChapterInsightsViewer(QWidget):
 
         self.reader_widget.setPlainText(text)
 
+    def _set_status(self, text: str, state: str):
+        """Set the status line, re-styling it only when its state changes"""
+        self.status_label.setText(text)
+        if state != self._status_state:
+            self._status_state = state
+            self.status_label.setStyleSheet(_STATUS_STYLES[state])
+
     def _on_analyze_clicked(self):
         """Handle analyze button click"""
         if self.chapter_id:
@@ -644,8 +759,7 @@ class ChapterInsightsViewer(QWidget):
         self.chapter_id = None
         self.insight_service = None
         self.title_label.setText("Chapter Insights")
-        self.status_label.setText("No analysis yet")
-        self.status_label.setStyleSheet("color: #A0A0A0; font-style: italic; margin-bottom: 5px;")
+        self._set_status("No analysis yet", 'idle')
         self.analyze_btn.setEnabled(False)
         self.empty_state.setVisible(True)
         self.tabs.setVisible(False)
\ No newline at end of file
@@ -10,6 +10,9 @@ from typing import List, Dict, Any
 import re
 import json
 
+# "LABEL: value" lines inside one ---separated issue/observation block
+_BLOCK_FIELD_RE = re.compile(r'^[^\S\n]*(ISSUE|OBSERVATION|LOCATION|SEVERITY|TYPE|DETAIL):(.*)$', re.MULTILINE)
+
 
 class ComprehensiveAnalysisWorker(QThread):
     """Worker that analyzes chapter by chapter, then compiles final report"""
@@ -41,6 +44,11 @@ class ComprehensiveAnalysisWorker(QThread):
             import traceback
             traceback.print_exc()
             self.error.emit(str(e))
+        finally:
+            # The integration keeps the last worker around; don't pin the whole
+            # manuscript in memory until the next analysis replaces it
+            self.chapters = None
+            self.scenes = None
 
     def _analyze_pacing_comprehensive(self):
         """Analyze book pacing and tension chapter by chapter"""
@@ -347,27 +355,17 @@ DETAIL: [Specific example or explanation]
             if not block.strip():
                 continue
 
+            # Later lines win when a label repeats
+            fields = {label: value.strip() for label, value in _BLOCK_FIELD_RE.findall(block)}
             issue_data = {
                 'chapter': chapter_name,
                 'type': issue_type,
-                'issue': '',
-                'location': '',
-                'severity': 'Minor',
-                'detail': ''
+                'issue': fields.get('ISSUE', ''),
+                'location': fields.get('LOCATION', ''),
+                'severity': fields.get('SEVERITY', 'Minor'),
+                'detail': fields.get('DETAIL', '')
             }
 
-            lines = block.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('ISSUE:'):
-                    issue_data['issue'] = line.split(':', 1)[1].strip()
-                elif line.startswith('LOCATION:'):
-                    issue_data['location'] = line.split(':', 1)[1].strip()
-                elif line.startswith('SEVERITY:'):
-                    issue_data['severity'] = line.split(':', 1)[1].strip()
-                elif line.startswith('DETAIL:'):
-                    issue_data['detail'] = line.split(':', 1)[1].strip()
-
             if not issue_data['issue']:
                 continue
 
@@ -399,29 +397,19 @@ DETAIL: [Specific example or explanation]
             if not block.strip():
                 continue
 
+            fields = {label: value.strip() for label, value in _BLOCK_FIELD_RE.findall(block)}
             obs_data = {
                 'chapter': chapter_name,
                 'type': 'style',
-                'issue': '',
-                'location': '',
+                'issue': fields.get('OBSERVATION', ''),
+                'location': fields.get('LOCATION', ''),
                 'severity': 'Observation',
-                'detail': '',
+                'detail': fields.get('DETAIL', ''),
                 'is_strength': False
             }
-
-            lines = block.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('OBSERVATION:'):
-                    obs_data['issue'] = line.split(':', 1)[1].strip()
-                elif line.startswith('LOCATION:'):
-                    obs_data['location'] = line.split(':', 1)[1].strip()
-                elif line.startswith('TYPE:'):
-                    type_val = line.split(':', 1)[1].strip()
-                    obs_data['is_strength'] = 'strength' in type_val.lower()
-                    obs_data['severity'] = 'Strength' if obs_data['is_strength'] else 'Suggestion'
-                elif line.startswith('DETAIL:'):
-                    obs_data['detail'] = line.split(':', 1)[1].strip()
+            if 'TYPE' in fields:
+                obs_data['is_strength'] = 'strength' in fields['TYPE'].lower()
+                obs_data['severity'] = 'Strength' if obs_data['is_strength'] else 'Suggestion'
 
             if obs_data['issue']:
                 observations.append(obs_data)
@@ -2,21 +2,37 @@ import hashlib
 import sqlite3
 import json
 import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Callable
 from pathlib import Path
 from models.project import (
     Project, Scene, Chapter, Part, Character, Location, PlotThread, WorldRule,
     ProjectItem, ItemType
 )
 
+# Shared by save_item and save_items_bulk; one statement string lets
+# sqlite3's statement cache reuse the prepared INSERT
+_ITEM_UPSERT_SQL = '''
+    INSERT OR REPLACE INTO items
+    (id, project_id, name, item_type, parent_id, order_index,
+     created, modified, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Rows per executemany call in save_items_bulk; keeps the parameter list
+# bounded on very large saves. Tune per instance via bulk_batch_size.
+BULK_BATCH_SIZE = 1000
+
 
 class DatabaseManager:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
         self._lock = threading.RLock()
+        self._tx_depth = 0
+        self.bulk_batch_size = BULK_BATCH_SIZE
         self._initialize_database()
 
     def _initialize_database(self):
@@ -117,6 +133,11 @@ class DatabaseManager:
                        CREATE INDEX IF NOT EXISTS idx_items_type
                            ON items(item_type)
                        ''')
+        # Serves "scenes of this chapter in order" without a scan or sort
+        cursor.execute('''
+                       CREATE INDEX IF NOT EXISTS idx_items_parent_type_order
+                           ON items(parent_id, item_type, order_index, created)
+                       ''')
 
         self.conn.commit()
 
@@ -194,50 +215,77 @@ class DatabaseManager:
             print(f"Error deleting project: {e}")
             return False
 
+    def _item_row(self, project_id: str, item: ProjectItem) -> tuple:
+        """Build the items table row for a project item"""
+        # to_dict() returns a fresh dict, so the common columns are popped
+        # off it and whatever remains is the extended data
+        item_dict = item.to_dict()
+        pop = item_dict.pop
+        return (
+            pop('id'),
+            project_id,
+            pop('name'),
+            pop('item_type'),
+            pop('parent_id', None),
+            pop('order', 0),
+            pop('created'),
+            pop('modified'),
+            json.dumps(item_dict)
+        )
+
+    @contextmanager
+    def transaction(self):
+        """Group writes into one commit; save_item defers its commit while inside"""
+        with self._lock:
+            outermost = self._tx_depth == 0
+            self._tx_depth += 1
+            try:
+                yield self.conn
+                if outermost:
+                    self.conn.commit()
+            except BaseException:
+                if outermost:
+                    self.conn.rollback()
+                raise
+            finally:
+                self._tx_depth -= 1
+
     def save_item(self, project_id: str, item: ProjectItem) -> bool:
         """Save or update a project item"""
         try:
             with self._lock:
                 cursor = self.conn.cursor()
-                item_dict = item.to_dict()
-
-                common_data = {
-                    'id': item_dict['id'],
-                    'name': item_dict['name'],
-                    'item_type': item_dict['item_type'],
-                    'parent_id': item_dict.get('parent_id'),
-                    'order': item_dict.get('order', 0),
-                    'created': item_dict['created'],
-                    'modified': item_dict['modified']
-                }
-
-                # Use a key set (safer than checking against dict object)
-                COMMON_KEYS = {"id", "name", "item_type", "parent_id", "order", "created", "modified"}
-                extended_data = {k: v for k, v in item_dict.items() if k not in COMMON_KEYS}
+                cursor.execute(_ITEM_UPSERT_SQL, self._item_row(project_id, item))
 
-                cursor.execute('''
-                    INSERT OR REPLACE INTO items 
-                    (id, project_id, name, item_type, parent_id, order_index, 
-                     created, modified, data)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    common_data['id'],
-                    project_id,
-                    common_data['name'],
-                    common_data['item_type'],
-                    common_data['parent_id'],
-                    common_data['order'],
-                    common_data['created'],
-                    common_data['modified'],
-                    json.dumps(extended_data)
-                ))
-
-                self.conn.commit()
+                if not self._tx_depth:
+                    self.conn.commit()
             return True
         except Exception as e:
             print(f"Error saving item: {e}")
             return False
 
+    def save_items_bulk(self, project_id: str, items: List[ProjectItem],
+                        progress: Optional[Callable[[int, int], None]] = None) -> bool:
+        """
+        Save or update many project items in a single transaction.
+        Rows are written bulk_batch_size at a time; progress(written, total)
+        is called after each batch.
+        """
+        try:
+            total = len(items)
+            batch_size = max(1, self.bulk_batch_size)
+            with self.transaction():
+                for start in range(0, total, batch_size):
+                    rows = [self._item_row(project_id, item)
+                            for item in items[start:start + batch_size]]
+                    self.conn.executemany(_ITEM_UPSERT_SQL, rows)
+                    if progress:
+                        progress(start + len(rows), total)
+            return True
+        except Exception as e:
+            print(f"Error saving items: {e}")
+            return False
+
     def load_item(self, item_id: str) -> Optional[ProjectItem]:
         """Load a project item by ID"""
         with self._lock:
@@ -273,6 +321,57 @@ class DatabaseManager:
 
         return [self._row_to_item(row) for row in rows]
 
+    def iter_items(self, project_id: str,
+                   item_type: Optional[ItemType] = None,
+                   batch_size: int = 100) -> Iterator[ProjectItem]:
+        """Yield project items in load_items order without loading them all at once"""
+        query = 'SELECT * FROM items WHERE project_id = ?'
+        params = [project_id]
+
+        if item_type:
+            query += ' AND item_type = ?'
+            params.append(item_type.value)
+
+        query += ' ORDER BY order_index, created'
+
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
+
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield self._row_to_item(row)
+
+    def load_scenes_for(self, chapter_id: str) -> List[ProjectItem]:
+        """Load the scenes of one chapter in order"""
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                'SELECT * FROM items WHERE parent_id = ? AND item_type = ? ORDER BY order_index, created',
+                (chapter_id, ItemType.SCENE.value)
+            )
+            rows = cursor.fetchall()
+
+        return [self._row_to_item(row) for row in rows]
+
+    def count_items(self, project_id: str, item_type: Optional[ItemType] = None) -> int:
+        """Count project items, optionally of one type"""
+        query = 'SELECT COUNT(*) FROM items WHERE project_id = ?'
+        params = [project_id]
+
+        if item_type:
+            query += ' AND item_type = ?'
+            params.append(item_type.value)
+
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
+            return cursor.fetchone()[0]
+
     def delete_item(self, item_id: str) -> bool:
         """Delete an item and all its children"""
         try:
@@ -298,6 +397,25 @@ class DatabaseManager:
             print(f"Error deleting item: {e}")
             return False
 
+    def delete_items_of_type(self, project_id: str, item_type: ItemType) -> int:
+        """Delete every item of one type (and their children) in one statement; returns rows deleted"""
+        try:
+            with self.transaction():
+                # rowcount isn't reported for statements starting with WITH
+                before = self.conn.total_changes
+                self.conn.execute('''
+                    WITH RECURSIVE doomed(id) AS (
+                        SELECT id FROM items WHERE project_id = ? AND item_type = ?
+                        UNION
+                        SELECT items.id FROM items JOIN doomed ON items.parent_id = doomed.id
+                    )
+                    DELETE FROM items WHERE id IN (SELECT id FROM doomed)
+                ''', (project_id, item_type.value))
+                return self.conn.total_changes - before
+        except Exception as e:
+            print(f"Error deleting items: {e}")
+            return 0
+
     def _row_to_item(self, row: sqlite3.Row) -> ProjectItem:
         """Convert a database row to a ProjectItem"""
         base_data = {
@@ -0,0 +1,159 @@
+"""
+embed_cache.py - Similarity cache for per-chapter extraction results
+
+Chapters that are edited between runs rarely change their characters or
+locations. Each chapter's prompt text is embedded and stored with its
+extraction result; on the next run a new draft whose embedding is close
+enough to a stored draft of the same chapter reuses that result instead
+of calling the AI again.
+
+Example:
+    vectors = ai_manager.embed(texts)
+    result = embed_cache.lookup(scope, chapter_name, vectors[0])
+    if result is None:
+        result = analyze(...)
+        embed_cache.store(scope, chapter_name, vectors[0], result)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Any, Sequence
+
+from app_settings import thread_settings
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+@dataclass
+class EmbedCacheConfig:
+    """Embedding cache configuration"""
+    enabled: bool = True
+    threshold: float = 0.92  # Minimum cosine similarity to reuse a result
+    max_versions: int = 5  # Drafts kept per chapter
+
+
+class EmbedCache:
+    """SQLite-backed store of (embedding, extraction result) per chapter"""
+
+    def __init__(self, db_path: Optional[Path] = None, config: Optional[EmbedCacheConfig] = None):
+        self.db_path = db_path or Path.home() / ".novelist_ai" / "embed_cache.db"
+        self.config = config or EmbedCacheConfig()
+        self.conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        if self.conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    scope TEXT NOT NULL,
+                    chapter TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    result TEXT NOT NULL,
+                    ts INTEGER NOT NULL
+                )
+            """)
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_embeddings_chapter ON embeddings(scope, chapter)'
+            )
+            self.conn.commit()
+        return self.conn
+
+    def is_enabled(self) -> bool:
+        """Check numpy, the config flag and the user's "Cache responses" setting"""
+        return (NUMPY_AVAILABLE and self.config.enabled
+                and thread_settings().value("ai/enable_caching", True, type=bool))
+
+    def lookup(self, scope: str, chapter: str, embedding: Sequence[float]) -> Optional[Any]:
+        """Return the stored result of the most similar earlier draft, or None"""
+        if not self.is_enabled():
+            return None
+
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    'SELECT embedding, result FROM embeddings WHERE scope = ? AND chapter = ?',
+                    (scope, chapter)
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"[EmbedCache] Read failed: {e}")
+            return None
+
+        if not rows:
+            self.misses += 1
+            return None
+
+        new = np.asarray(embedding, dtype=np.float32)
+        stored = np.stack([np.frombuffer(row[0], dtype=np.float32) for row in rows])
+        if stored.shape[1] != new.shape[0]:
+            # Embedding model changed
+            self.misses += 1
+            return None
+
+        norms = np.linalg.norm(stored, axis=1) * np.linalg.norm(new)
+        scores = (stored @ new) / np.maximum(norms, 1e-12)
+        best = int(scores.argmax())
+        if scores[best] <= self.config.threshold:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(rows[best][1])
+
+    def store(self, scope: str, chapter: str, embedding: Sequence[float], result: Any) -> None:
+        """Remember a chapter's result, keeping only the newest drafts"""
+        if not self.is_enabled():
+            return
+
+        blob = np.asarray(embedding, dtype=np.float32).tobytes()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    'INSERT INTO embeddings (scope, chapter, embedding, result, ts) VALUES (?, ?, ?, ?, ?)',
+                    (scope, chapter, blob, json.dumps(result, ensure_ascii=False), int(time.time()))
+                )
+                conn.execute("""
+                    DELETE FROM embeddings WHERE scope = ? AND chapter = ? AND id NOT IN (
+                        SELECT id FROM embeddings WHERE scope = ? AND chapter = ?
+                        ORDER BY id DESC LIMIT ?
+                    )
+                """, (scope, chapter, scope, chapter, self.config.max_versions))
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"[EmbedCache] Write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all stored results"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute('DELETE FROM embeddings')
+            conn.commit()
+
+    def get_stats(self) -> dict:
+        """Get statistics"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+# Global instance
+embed_cache = EmbedCache()
@@ -1,6 +1,7 @@
 # insight_service.py
 import uuid
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Tuple, Callable
 
 from analyzer import AnalysisEngine, ChapterData
 from db_manager import InsightDatabase, sha256_text
@@ -79,6 +80,53 @@ class InsightService:
             self._enqueue_if_needed(project_id, "book", None, "pacing", source_hash,
                                     kind="book_pacing", payload={"project_id": project_id})
 
+    # --------- run now ----------
+
+    def run_chapter_analyses(self, project_id: str, chapter_id: str, insight_types: List[str],
+                             on_done: Optional[Callable[[str], None]] = None,
+                             max_workers: int = 5) -> Dict[str, str]:
+        """
+        Run chapter analyses immediately and concurrently, blocking until all are
+        stored. Types whose stored result already matches the chapter text are
+        skipped. on_done(insight_type) is called on this thread as each one
+        finishes. Returns {insight_type: error} for the ones that failed.
+        """
+        chapter = self._load_chapter_data(project_id, chapter_id)
+        if not chapter:
+            raise ValueError("Chapter not found")
+        chapter_source = self._hash_chapter_source(chapter)
+
+        pending = []
+        for insight_type in insight_types:
+            if self.insight_db.exists_with_hash(project_id, "chapter", chapter_id, insight_type, chapter_source):
+                if on_done:
+                    on_done(insight_type)
+            else:
+                pending.append(insight_type)
+
+        errors = {}
+        if not pending:
+            return errors
+
+        # Each analysis is one AI call that mostly waits on the network
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = {
+                executor.submit(self._run_chapter_job, f"chapter_{insight_type}", project_id,
+                                chapter_id, chapter, chapter_source): insight_type
+                for insight_type in pending
+            }
+            for future in as_completed(futures):
+                insight_type = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Chapter analysis failed: {insight_type}: {e}")
+                    errors[insight_type] = str(e)
+                if on_done:
+                    on_done(insight_type)
+
+        return errors
+
     def _enqueue_if_needed(self, project_id: str, scope: str, scope_id: Optional[str], insight_type: str,
                            source_hash: str, kind: str, payload: Dict[str, Any]) -> None:
         if self.insight_db.exists_with_hash(project_id, scope, scope_id, insight_type, source_hash):
@@ -99,35 +147,7 @@ class InsightService:
                 raise ValueError("Chapter not found")
 
             chapter_source_hash = self._hash_chapter_source(chapter)
-
-            if kind == "chapter_timeline":
-                result = self.engine.analyze_chapter_timeline(chapter)
-                self._store_chapter_issues(project_id, chapter_id, "timeline", result, chapter_source_hash)
-                return result
-
-            if kind == "chapter_consistency":
-                result = self.engine.analyze_chapter_consistency(chapter)
-                self._store_chapter_issues(project_id, chapter_id, "consistency", result, chapter_source_hash)
-                return result
-
-            if kind == "chapter_style":
-                result = self.engine.analyze_chapter_style(chapter)
-                self._store_chapter_issues(project_id, chapter_id, "style", result, chapter_source_hash)
-                return result
-
-            if kind == "chapter_reader_snapshot":
-                result = self.engine.analyze_chapter_reader_snapshot(chapter)
-                self._store_generic(project_id, "chapter", chapter_id, "reader_snapshot", result, chapter_source_hash)
-                return result
-
-            if kind == "chapter_world_rules":
-                project = self.db_manager.load_project(project_id)
-                rules = [r.to_dict() for r in project.world_rules if r.is_active]
-                result = self.engine.analyze_chapter_world_rules(chapter, rules)
-                self._store_chapter_issues(project_id, chapter_id, "world_rules", result, chapter_source_hash)
-                return result
-
-            raise ValueError(f"Unknown job kind: {kind}")
+            return self._run_chapter_job(kind, project_id, chapter_id, chapter, chapter_source_hash)
 
         # book level
         compiled = self.compile_book_text(project_id)
@@ -271,6 +291,37 @@ class InsightService:
 
         raise ValueError(f"Unknown job kind: {kind}")
 
+    def _run_chapter_job(self, kind: str, project_id: str, chapter_id: str,
+                         chapter: ChapterData, chapter_source_hash: str) -> Dict[str, Any]:
+        if kind == "chapter_timeline":
+            result = self.engine.analyze_chapter_timeline(chapter)
+            self._store_chapter_issues(project_id, chapter_id, "timeline", result, chapter_source_hash)
+            return result
+
+        if kind == "chapter_consistency":
+            result = self.engine.analyze_chapter_consistency(chapter)
+            self._store_chapter_issues(project_id, chapter_id, "consistency", result, chapter_source_hash)
+            return result
+
+        if kind == "chapter_style":
+            result = self.engine.analyze_chapter_style(chapter)
+            self._store_chapter_issues(project_id, chapter_id, "style", result, chapter_source_hash)
+            return result
+
+        if kind == "chapter_reader_snapshot":
+            result = self.engine.analyze_chapter_reader_snapshot(chapter)
+            self._store_generic(project_id, "chapter", chapter_id, "reader_snapshot", result, chapter_source_hash)
+            return result
+
+        if kind == "chapter_world_rules":
+            project = self.db_manager.load_project(project_id)
+            rules = [r.to_dict() for r in project.world_rules if r.is_active]
+            result = self.engine.analyze_chapter_world_rules(chapter, rules)
+            self._store_chapter_issues(project_id, chapter_id, "world_rules", result, chapter_source_hash)
+            return result
+
+        raise ValueError(f"Unknown job kind: {kind}")
+
     # --------- storage ----------
 
     def _store_chapter_issues(self, project_id: str, chapter_id: str, insight_type: str,
@@ -0,0 +1,147 @@
+"""
+llm_cache.py - Content-addressed cache for deterministic AI responses
+
+Low-temperature calls on unchanged text return the same answer, so their
+responses are stored in a small SQLite database keyed by a hash of
+(model, messages, temperature, extra parameters).
+
+Example:
+    key = llm_cache.cache_key(model, messages, temperature)
+    response = llm_cache.get(key)
+    if response is None:
+        response = ai_manager.call_api(...)
+        llm_cache.set(key, response)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+from app_settings import thread_settings
+
+
+@dataclass
+class LLMCacheConfig:
+    """LLM cache configuration"""
+    enabled: bool = True
+    max_temperature: float = 0.5  # Only cache (near-)deterministic calls
+    ttl_seconds: Optional[int] = 30 * 24 * 3600  # None = never expire
+
+
+class LLMCache:
+    """SQLite-backed cache of AI responses keyed by prompt hash"""
+
+    def __init__(self, db_path: Optional[Path] = None, config: Optional[LLMCacheConfig] = None):
+        self.db_path = db_path or Path.home() / ".novelist_ai" / "llm_cache.db"
+        self.config = config or LLMCacheConfig()
+        self.conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        if self.conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    ts INTEGER NOT NULL
+                )
+            """)
+            self.conn.commit()
+        return self.conn
+
+    def is_enabled(self) -> bool:
+        """Check the config flag and the user's "Cache responses" setting"""
+        return self.config.enabled and thread_settings().value("ai/enable_caching", True, type=bool)
+
+    def cache_key(self, model: str, messages: List[Dict[str, str]],
+                  temperature: Optional[float], **params: Any) -> Optional[str]:
+        """
+        Build the cache key for a call.
+        Returns None if the call shouldn't be cached (disabled or too random).
+        """
+        if not self.is_enabled():
+            return None
+        if temperature is None or temperature > self.config.max_temperature:
+            return None
+
+        payload = json.dumps({
+            'model': model,
+            'messages': messages,
+            'temperature': temperature,
+            'params': params
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Return the cached response for key, or None"""
+        if key is None:
+            return None
+
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    'SELECT response, ts FROM cache WHERE key = ?', (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[LLMCache] Read failed: {e}")
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        response, ts = row
+        if self.config.ttl_seconds is not None and time.time() - ts > self.config.ttl_seconds:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return response
+
+    def set(self, key: Optional[str], response: str) -> None:
+        """Store a response"""
+        if key is None or not response:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    'INSERT OR REPLACE INTO cache (key, response, ts) VALUES (?, ?, ?)',
+                    (key, response, int(time.time()))
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"[LLMCache] Write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute('DELETE FROM cache')
+            conn.commit()
+
+    def get_stats(self) -> dict:
+        """Get statistics"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+# Global instance
+llm_cache = LLMCache()
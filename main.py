@@ -19,12 +19,13 @@ from PyQt6.QtWidgets import (
     QMenuBar, QMenu, QToolBar, QStatusBar, QMessageBox, QFileDialog, QApplication,
     QLabel, QPushButton, QStackedWidget, QTabWidget
 )
-from PyQt6.QtCore import Qt, QSettings, pyqtSignal, QTimer, QPoint
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPoint
 from PyQt6.QtGui import QAction, QKeySequence, QIcon, QMouseEvent, QActionGroup
 from pathlib import Path
 
 from ai_integration import AIFeatures
 from ai_manager import ai_manager
+from app_settings import SETTINGS
 from autosave_manager import AutoSaveManager
 from db_manager import DatabaseManager, InsightDatabase
 from editor_widget import EditorWidget
@@ -104,7 +105,7 @@ def install_exception_hooks() -> None:
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.settings = QSettings("Rabbit Consulting", "Novelist AI")
+        self.settings = SETTINGS
         self.db_manager: DatabaseManager = None
         self.ai_integration = None
         self.story_extractor = None
@@ -804,6 +805,8 @@ class MainWindow(QMainWindow):
 
                 # Initialize AI integration and story extractor
                 self.ai_integration = AIFeatures(self, self.db_manager, self.current_project.id)
+                if self.story_extractor:
+                    self.story_extractor.shutdown()
                 self.story_extractor = StoryExtractor(self, self.db_manager, self.current_project.id)
                 # Initialize insight service
                 self.insight_db = InsightDatabase(self.db_manager)
@@ -862,6 +865,8 @@ class MainWindow(QMainWindow):
                     self.insight_db
                 )
                 # Initialize story extractor
+                if self.story_extractor:
+                    self.story_extractor.shutdown()
                 self.story_extractor = StoryExtractor(self, self.db_manager, self.current_project.id)
                 # Initialize persona manager
                 from writing_persona import PersonaManager
@@ -1234,6 +1239,10 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'insight_service') and self.insight_service:
                 self.insight_service.shutdown()
 
+            # Stop the story extraction worker
+            if hasattr(self, 'story_extractor') and self.story_extractor:
+                self.story_extractor.shutdown()
+
             # Save settings
             if hasattr(self, 'settings') and self.settings:
                 self.settings.setValue("geometry", self.saveGeometry())
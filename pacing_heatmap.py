@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QToolTip, QFrame
 from PyQt6.QtCore import Qt, QRect, QPoint, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QLinearGradient, QBrush, QPen, QFontMetrics
+from PyQt6.QtGui import QPainter, QColor, QLinearGradient, QBrush, QPen, QFontMetrics, QPixmap
 
 class PacingHeatmapWidget(QWidget):
     """
@@ -15,18 +15,49 @@ class PacingHeatmapWidget(QWidget):
         self.pacing_data = [] # List of dicts with intensity, length, scene_name, etc.
         self.setMouseTracking(True)
         self.hovered_scene_index = -1
+        # Heatmap without the hover outline, redrawn only when the data or size changes;
+        # hovering repaints on every scene change and just blits it
+        self._pixmap = None
+        self._scene_rects = []
 
     def set_data(self, pacing_data):
         self.pacing_data = pacing_data
+        self._pixmap = None
         self.update()
 
+    def resizeEvent(self, event):
+        self._pixmap = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         if not self.pacing_data:
             painter = QPainter(self)
             painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "No pacing data available. Run analysis.")
             return
 
+        if self._pixmap is None:
+            self._pixmap = self._render_heatmap()
+
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+
+        # Highlight hovered
+        if 0 <= self.hovered_scene_index < len(self._scene_rects):
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.setPen(QPen(Qt.GlobalColor.white, 2))
+            painter.drawRect(self._scene_rects[self.hovered_scene_index])
+
+    def _render_heatmap(self) -> QPixmap:
+        """Draw the bars, tension curve and labels into a pixmap the size of the widget"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        self._scene_rects = []
+
+        painter = QPainter(pixmap)
+        painter.setFont(self.font())
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         width = self.width()
@@ -42,7 +73,8 @@ class PacingHeatmapWidget(QWidget):
         
         total_length = sum(d.get('length', 1000) for d in self.pacing_data)
         if total_length == 0:
-            return
+            painter.end()
+            return pixmap
 
         current_x = margin_left
         
@@ -55,16 +87,12 @@ class PacingHeatmapWidget(QWidget):
             color = self._get_intensity_color(intensity)
             
             rect = QRect(int(current_x), margin_top, int(scene_width), draw_height)
+            self._scene_rects.append(rect)
             
             # Draw scene block
             painter.setBrush(QBrush(color))
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawRect(rect)
-            
-            # Highlight hovered
-            if i == self.hovered_scene_index:
-                painter.setPen(QPen(Qt.GlobalColor.white, 2))
-                painter.drawRect(rect)
                 
             # Dialogue vs Exposition markers (small bar below)
             diag_ratio = scene.get('dialogue_ratio', 0.5)
@@ -93,6 +121,8 @@ class PacingHeatmapWidget(QWidget):
         painter.setPen(Qt.GlobalColor.white)
         painter.drawText(margin_left, margin_top - 10, "Pacing Heatmap (Calm 🔵 → Intense 🔴)")
         painter.drawText(margin_left, margin_top + draw_height + 30, "Dialogue-Heavy (Gold) vs Exposition-Heavy (Grey)")
+        painter.end()
+        return pixmap
 
     def _get_intensity_color(self, intensity):
         # 0 is Blue, 10 is Red
@@ -133,6 +133,34 @@ class ProjectTreeWidget(QTreeWidget):
             tree_item.setText(0, f"{icon} {item.name}" if icon else item.name)
             tree_item.setData(0, Qt.ItemDataRole.UserRole, item.id)
 
+    def _find_root(self, root_key: str):
+        """Find a top-level section ("characters_root", "plots_root", ...) or None"""
+        for i in range(self.topLevelItemCount()):
+            root = self.topLevelItem(i)
+            if root.data(0, Qt.ItemDataRole.UserRole) == root_key:
+                return root
+        return None
+
+    def add_plot_threads(self, threads: list, replace: bool = False) -> bool:
+        """
+        Add plot thread nodes under the Plot Threads section without rebuilding
+        the tree (expanded state elsewhere is kept). With replace=True the
+        section's existing nodes are removed first.
+        Returns False if the section isn't loaded.
+        """
+        plots_root = self._find_root("plots_root")
+        if plots_root is None:
+            return False
+
+        if replace:
+            plots_root.takeChildren()
+
+        for thread in threads:
+            tree_item = QTreeWidgetItem(plots_root)
+            tree_item.setText(0, f"🧵 {thread.name}")
+            tree_item.setData(0, Qt.ItemDataRole.UserRole, thread.id)
+        return True
+
     def on_item_clicked(self, item: QTreeWidgetItem, column: int):
         """Handle item click"""
         item_id = item.data(0, Qt.ItemDataRole.UserRole)
@@ -2,27 +2,179 @@
 Settings dialog with modern styling
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QTabWidget,
     QLineEdit, QSpinBox, QCheckBox, QDialogButtonBox, QLabel,
     QGroupBox, QPushButton, QMessageBox, QWidget, QRadioButton,
     QButtonGroup, QColorDialog, QComboBox
 )
-from PyQt6.QtCore import Qt, QSettings, pyqtSignal
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QColor, QIcon
 
+from app_settings import SETTINGS
 from theme_manager import theme_manager
 
+# Per-tab form rows: (widget attribute, widget class, label, {setter: args})
+FORM_SCHEMA = {
+    "azure": [
+        ("azure_api_key_edit", QLineEdit, "API Key:", {
+            "setEchoMode": QLineEdit.EchoMode.Password,
+            "setPlaceholderText": "Your API key",
+        }),
+        ("azure_endpoint_edit", QLineEdit, "Endpoint:", {
+            "setPlaceholderText": "https://your-resource.openai.azure.com/",
+        }),
+        ("azure_api_version_edit", QLineEdit, "API Version:", {
+            "setText": "2024-02-15-preview",
+        }),
+        ("azure_deployment_edit", QLineEdit, "Deployment:", {
+            "setPlaceholderText": "gpt-4",
+        }),
+    ],
+    "openai": [
+        ("openai_api_key_edit", QLineEdit, "API Key:", {
+            "setEchoMode": QLineEdit.EchoMode.Password,
+            "setPlaceholderText": "sk-...",
+        }),
+        ("openai_model_edit", QLineEdit, "Model:", {
+            "setText": "gpt-4",
+            "setPlaceholderText": "gpt-4, gpt-3.5-turbo, etc.",
+        }),
+    ],
+    "editor": [
+        ("autosave_spin", QSpinBox, "Auto-save interval:", {
+            "setRange": (0, 60),
+            "setSuffix": " seconds",
+            "setValue": 5,
+        }),
+        ("font_size_spin", QSpinBox, "Editor font size:", {
+            "setRange": (8, 24),
+            "setValue": 12,
+        }),
+        ("show_word_count_check", QCheckBox, "Show word count:", {
+            "setChecked": True,
+        }),
+    ],
+    "appearance": [
+        ("theme_combo", QComboBox, "Theme:", {
+            "addItems": ["Dark", "Light", "Custom"],
+        }),
+        ("primary_color_btn", QPushButton, "Primary Color:", {"setText": "Pick Color"}),
+        ("bg_color_btn", QPushButton, "Background Color:", {"setText": "Pick Color"}),
+        ("text_color_btn", QPushButton, "Text Color:", {"setText": "Pick Color"}),
+    ],
+    "ai": [
+        ("temperature_spin", QSpinBox, "AI Temperature:", {
+            "setRange": (0, 100),
+            "setValue": 70,
+            "setSuffix": "%",
+        }),
+        ("max_tokens_spin", QSpinBox, "Max tokens:", {
+            "setRange": (100, 4000),
+            "setSingleStep": 100,
+            "setValue": 2000,
+        }),
+        ("enable_caching_check", QCheckBox, "Cache responses:", {
+            "setChecked": True,
+        }),
+        ("disable_temperature_check", QCheckBox, "Disable temperature:", {
+            "setChecked": False,
+        }),
+    ],
+}
+
+# (settings key, widget attribute, getter, setter, default, type)
+_FIELDS = (
+    ("azure/api_key", "azure_api_key_edit", QLineEdit.text, QLineEdit.setText, "", str),
+    ("azure/endpoint", "azure_endpoint_edit", QLineEdit.text, QLineEdit.setText, "", str),
+    ("azure/api_version", "azure_api_version_edit", QLineEdit.text, QLineEdit.setText, "2024-02-15-preview", str),
+    ("azure/deployment", "azure_deployment_edit", QLineEdit.text, QLineEdit.setText, "", str),
+    ("openai/api_key", "openai_api_key_edit", QLineEdit.text, QLineEdit.setText, "", str),
+    ("openai/model", "openai_model_edit", QLineEdit.text, QLineEdit.setText, "gpt-4", str),
+    ("editor/autosave_interval", "autosave_spin", QSpinBox.value, QSpinBox.setValue, 5, int),
+    ("editor/font_size", "font_size_spin", QSpinBox.value, QSpinBox.setValue, 12, int),
+    ("editor/show_word_count", "show_word_count_check", QCheckBox.isChecked, QCheckBox.setChecked, True, bool),
+    ("ai/temperature", "temperature_spin", QSpinBox.value, QSpinBox.setValue, 70, int),
+    ("ai/max_tokens", "max_tokens_spin", QSpinBox.value, QSpinBox.setValue, 2000, int),
+    ("ai/enable_caching", "enable_caching_check", QCheckBox.isChecked, QCheckBox.setChecked, True, bool),
+    ("ai/disable_temperature", "disable_temperature_check", QCheckBox.isChecked, QCheckBox.setChecked, False, bool),
+    ("appearance/theme", "theme_combo", QComboBox.currentText, QComboBox.setCurrentText, "Dark", str),
+)
+
+# (settings key, default, type) for every key the dialog reads or writes
+_SETTINGS_KEYS = (
+    ("ai/provider", "azure", str),
+    ("appearance/primary_color", "#7C4DFF", str),
+    ("appearance/bg_color", "#121212", str),
+    ("appearance/text_color", "#E0E0E0", str),
+) + tuple((key, default, typ) for key, _, _, _, default, typ in _FIELDS)
+
+# The same keys split by QSettings group: {group: [(name, default, type)]}
+_SETTINGS_GROUPS = {}
+for _key, _default, _typ in _SETTINGS_KEYS:
+    _group, _name = _key.split("/", 1)
+    _SETTINGS_GROUPS.setdefault(_group, []).append((_name, _default, _typ))
+
+
+@lru_cache(maxsize=None)
+def _icon(name):
+    """Load an icon from the icons folder once and reuse it"""
+    return QIcon(f"icons/{name}.svg")
+
+
+class RefreshClientTask(QRunnable):
+    """Rebuild the AI client on a pool thread so the dialog closes immediately"""
+
+    def run(self):
+        from ai_manager import ai_manager
+        ai_manager.refresh_client()
+
+
+class ConnectionTestSignals(QObject):
+    finished = pyqtSignal(bool, str)  # success, message
+
+
+class ConnectionTestTask(QRunnable):
+    """Refresh the AI client and probe the connection on a pool thread"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = ConnectionTestSignals()
+
+    def run(self):
+        from ai_manager import ai_manager
+        ai_manager.refresh_client()
+        success, message = ai_manager.test_connection()
+        self.signals.finished.emit(success, message)
+
+
 class SettingsDialog(QDialog):
     theme_changed = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.settings = QSettings("Rabbit Consulting", "Novelist AI")
+        self.settings = SETTINGS
+        self._settings_cache = self._load_cache()
         self.init_ui()
         self.load_settings()
         self.apply_modern_style()
 
+    def _load_cache(self):
+        """Read every setting the dialog uses, one QSettings group at a time"""
+        cache = {}
+        for group, entries in _SETTINGS_GROUPS.items():
+            self.settings.beginGroup(group)
+            present = set(self.settings.childKeys())
+            for name, default, typ in entries:
+                if name in present:
+                    cache[f"{group}/{name}"] = self.settings.value(name, default, type=typ)
+                else:
+                    cache[f"{group}/{name}"] = default
+            self.settings.endGroup()
+        return cache
+
     def init_ui(self):
         """Initialize the dialog UI"""
         self.setWindowTitle("Settings")
@@ -34,7 +186,9 @@ class SettingsDialog(QDialog):
         layout.setSpacing(0)
 
         # Header
-        header = QLabel("⚙️ Application Settings")
+        # Plain text plus a prebuilt icon avoids emoji font fallback
+        self.setWindowIcon(_icon("settings"))
+        header = QLabel("Application Settings")
         header.setObjectName("settingsHeader")
         layout.addWidget(header)
 
@@ -54,6 +208,8 @@ class SettingsDialog(QDialog):
         
         self.provider_bg.addButton(self.azure_radio, 0)
         self.provider_bg.addButton(self.openai_radio, 1)
+        self._last_provider_id = None
+        self.provider_bg.idToggled.connect(self._on_provider_id)
         
         provider_layout.addWidget(self.azure_radio)
         provider_layout.addWidget(self.openai_radio)
@@ -65,25 +221,23 @@ class SettingsDialog(QDialog):
         self.tabs = QTabWidget()
         self.tabs.setObjectName("settingsTabs")
 
-        # Azure OpenAI tab
-        azure_tab = self.create_azure_tab()
-        self.tabs.addTab(azure_tab, "Azure OpenAI")
-
-        # OpenAI tab
-        openai_tab = self.create_openai_tab()
-        self.tabs.addTab(openai_tab, "Standard OpenAI")
-
-        # Editor tab
-        editor_tab = self.create_editor_tab()
-        self.tabs.addTab(editor_tab, "Editor")
-
-        # Appearance tab
-        appearance_tab = self.create_appearance_tab()
-        self.tabs.addTab(appearance_tab, "Appearance")
-
-        # AI Analysis tab
-        ai_tab = self.create_ai_tab()
-        self.tabs.addTab(ai_tab, "AI Analysis")
+        # Tabs start as empty placeholders and are built the first time
+        # they are shown (see _ensure_tab_built)
+        self._tab_builders = [
+            ("Azure OpenAI", self.create_azure_tab),
+            ("Standard OpenAI", self.create_openai_tab),
+            ("Editor", self.create_editor_tab),
+            ("Appearance", self.create_appearance_tab),
+            ("AI Analysis", self.create_ai_tab),
+        ]
+        self._tab_built = set()
+        self._loaded_fields = set()
+        self._btn_style_cache = {}
+        self._qcolors = {}
+        self._active_test = None
+        for title, _ in self._tab_builders:
+            self.tabs.addTab(QWidget(), title)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
 
         content_layout.addWidget(self.tabs)
 
@@ -97,11 +251,45 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(content_widget)
 
-        # Connect radio buttons to tab switching (optional but helpful)
-        self.azure_radio.toggled.connect(self.on_provider_changed)
-        self.openai_radio.toggled.connect(self.on_provider_changed)
+    def _ensure_tab_built(self, index):
+        """Replace a placeholder tab with its real contents on first show"""
+        if index < 0 or index in self._tab_built:
+            return
+        self._tab_built.add(index)
+
+        title, builder = self._tab_builders[index]
+        widget = builder()
+        enabled = self.tabs.isTabEnabled(index)
+
+        self.tabs.blockSignals(True)
+        placeholder = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, title)
+        self.tabs.setTabEnabled(index, enabled)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+        self._load_fields()
+        if title == "Appearance":
+            self._refresh_appearance()
+
+    def _load_fields(self):
+        """Populate widgets of freshly built tabs from the settings cache"""
+        for key, attr, _, setter, _, _ in _FIELDS:
+            if attr in self._loaded_fields or not hasattr(self, attr):
+                continue
+            setter(getattr(self, attr), self._settings_cache[key])
+            self._loaded_fields.add(attr)
+
+    def _on_provider_id(self, button_id, checked):
+        # Each switch toggles both radios; only react to the newly checked one
+        if not checked or button_id == self._last_provider_id:
+            return
+        self.on_provider_changed()
 
     def on_provider_changed(self):
+        self._last_provider_id = self.provider_bg.checkedId()
         if self.azure_radio.isChecked():
             self.tabs.setTabEnabled(0, True)
             self.tabs.setTabEnabled(1, False)
@@ -111,43 +299,50 @@ class SettingsDialog(QDialog):
             self.tabs.setTabEnabled(1, True)
             self.tabs.setCurrentIndex(1)
 
-    def create_openai_tab(self):
-        """Create Standard OpenAI configuration tab"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setSpacing(15)
-
-        # Info
-        info = QLabel(
-            "Configure your Standard OpenAI API key to enable AI analysis.\n"
-            "Get this from platform.openai.com."
-        )
-        info.setWordWrap(True)
-        info.setObjectName("infoLabel")
-        layout.addWidget(info)
-
-        # Form
+    def _build_form(self, schema_key):
+        """Create the widgets listed in FORM_SCHEMA and return their form"""
         form = QFormLayout()
         form.setSpacing(12)
         form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
 
-        self.openai_api_key_edit = QLineEdit()
-        self.openai_api_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.openai_api_key_edit.setPlaceholderText("sk-...")
-        form.addRow("API Key:", self.openai_api_key_edit)
+        for attr, widget_class, label, setup in FORM_SCHEMA[schema_key]:
+            widget = widget_class()
+            for method, args in setup.items():
+                if isinstance(args, tuple):
+                    getattr(widget, method)(*args)
+                else:
+                    getattr(widget, method)(args)
+            setattr(self, attr, widget)
+            form.addRow(label, widget)
 
-        self.openai_model_edit = QLineEdit()
-        self.openai_model_edit.setText("gpt-4")
-        self.openai_model_edit.setPlaceholderText("gpt-4, gpt-3.5-turbo, etc.")
-        form.addRow("Model:", self.openai_model_edit)
+        return form
 
-        layout.addLayout(form)
+    def _create_info_label(self, text):
+        info = QLabel(text)
+        info.setWordWrap(True)
+        info.setObjectName("infoLabel")
+        return info
 
-        # Test button
-        test_btn = QPushButton("🔌 Test Connection")
+    def _create_test_button(self, slot):
+        test_btn = QPushButton("Test Connection")
+        test_btn.setIcon(_icon("plug"))
         test_btn.setObjectName("testButton")
-        test_btn.clicked.connect(self.test_openai_connection)
-        layout.addWidget(test_btn)
+        test_btn.clicked.connect(slot)
+        return test_btn
+
+    def create_openai_tab(self):
+        """Create Standard OpenAI configuration tab"""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setSpacing(15)
+
+        layout.addWidget(self._create_info_label(
+            "Configure your Standard OpenAI API key to enable AI analysis.\n"
+            "Get this from platform.openai.com."
+        ))
+        layout.addLayout(self._build_form("openai"))
+        self.openai_test_btn = self._create_test_button(self.test_openai_connection)
+        layout.addWidget(self.openai_test_btn)
 
         layout.addStretch()
         return widget
@@ -158,44 +353,13 @@ class SettingsDialog(QDialog):
         layout = QVBoxLayout(widget)
         layout.setSpacing(15)
 
-        # Info
-        info = QLabel(
+        layout.addWidget(self._create_info_label(
             "Configure your Azure OpenAI credentials to enable AI analysis.\n"
             "Get these from your Azure Portal."
-        )
-        info.setWordWrap(True)
-        info.setObjectName("infoLabel")
-        layout.addWidget(info)
-
-        # Form
-        form = QFormLayout()
-        form.setSpacing(12)
-        form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
-
-        self.azure_api_key_edit = QLineEdit()
-        self.azure_api_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.azure_api_key_edit.setPlaceholderText("Your API key")
-        form.addRow("API Key:", self.azure_api_key_edit)
-
-        self.azure_endpoint_edit = QLineEdit()
-        self.azure_endpoint_edit.setPlaceholderText("https://your-resource.openai.azure.com/")
-        form.addRow("Endpoint:", self.azure_endpoint_edit)
-
-        self.azure_api_version_edit = QLineEdit()
-        self.azure_api_version_edit.setText("2024-02-15-preview")
-        form.addRow("API Version:", self.azure_api_version_edit)
-
-        self.azure_deployment_edit = QLineEdit()
-        self.azure_deployment_edit.setPlaceholderText("gpt-4")
-        form.addRow("Deployment:", self.azure_deployment_edit)
-
-        layout.addLayout(form)
-
-        # Test button
-        test_btn = QPushButton("🔌 Test Connection")
-        test_btn.setObjectName("testButton")
-        test_btn.clicked.connect(self.test_azure_connection)
-        layout.addWidget(test_btn)
+        ))
+        layout.addLayout(self._build_form("azure"))
+        self.azure_test_btn = self._create_test_button(self.test_azure_connection)
+        layout.addWidget(self.azure_test_btn)
 
         layout.addStretch()
         return widget
@@ -205,26 +369,7 @@ class SettingsDialog(QDialog):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        form = QFormLayout()
-        form.setSpacing(12)
-        form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
-
-        self.autosave_spin = QSpinBox()
-        self.autosave_spin.setRange(0, 60)
-        self.autosave_spin.setSuffix(" seconds")
-        self.autosave_spin.setValue(5)
-        form.addRow("Auto-save interval:", self.autosave_spin)
-
-        self.font_size_spin = QSpinBox()
-        self.font_size_spin.setRange(8, 24)
-        self.font_size_spin.setValue(12)
-        form.addRow("Editor font size:", self.font_size_spin)
-
-        self.show_word_count_check = QCheckBox()
-        self.show_word_count_check.setChecked(True)
-        form.addRow("Show word count:", self.show_word_count_check)
-
-        layout.addLayout(form)
+        layout.addLayout(self._build_form("editor"))
         layout.addStretch()
         return widget
 
@@ -233,45 +378,42 @@ class SettingsDialog(QDialog):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        form = QFormLayout()
-        form.setSpacing(12)
-        form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
-
-        self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Dark", "Light", "Custom"])
-        form.addRow("Theme:", self.theme_combo)
+        layout.addLayout(self._build_form("appearance"))
+        layout.addStretch()
 
         # Custom Colors
-        self.primary_color_btn = QPushButton("Pick Color")
         self.primary_color_btn.clicked.connect(lambda: self.pick_color("primary"))
-        form.addRow("Primary Color:", self.primary_color_btn)
-
-        self.bg_color_btn = QPushButton("Pick Color")
         self.bg_color_btn.clicked.connect(lambda: self.pick_color("bg"))
-        form.addRow("Background Color:", self.bg_color_btn)
-
-        self.text_color_btn = QPushButton("Pick Color")
         self.text_color_btn.clicked.connect(lambda: self.pick_color("text"))
-        form.addRow("Text Color:", self.text_color_btn)
-
-        layout.addLayout(form)
-        layout.addStretch()
 
         self.theme_combo.currentTextChanged.connect(self.update_appearance_ui)
         
         return widget
 
     def pick_color(self, color_type):
-        current_color = getattr(self, f"{color_type}_color", "#7C4DFF" if color_type == "primary" else "#121212")
-        color = QColorDialog.getColor(QColor(current_color), self, f"Select {color_type.capitalize()} Color")
+        color = QColorDialog.getColor(self._qcolors[color_type], self, f"Select {color_type.capitalize()} Color")
         if color.isValid():
-            setattr(self, f"{color_type}_color", color.name())
+            self._set_color(color_type, color)
             self.update_color_button_style(color_type)
 
+    def _set_color(self, color_type, color):
+        """Store a color both as QColor and as the hex string that gets saved"""
+        qcolor = QColor(color)
+        self._qcolors[color_type] = qcolor
+        # Keep loaded hex strings verbatim so an unchanged color isn't re-saved
+        setattr(self, f"{color_type}_color", color if isinstance(color, str) else qcolor.name())
+
     def update_color_button_style(self, color_type):
         btn = getattr(self, f"{color_type}_color_btn")
         color = getattr(self, f"{color_type}_color")
-        btn.setStyleSheet(f"background-color: {color}; color: {'white' if QColor(color).lightness() < 128 else 'black'};")
+        fg = "white" if self._qcolors[color_type].lightness() < 128 else "black"
+
+        # Skip the stylesheet re-parse when the button already shows this color
+        key = (color, fg)
+        if self._btn_style_cache.get(color_type) == key:
+            return
+        btn.setStyleSheet(f"background-color: {color}; color: {fg};")
+        self._btn_style_cache[color_type] = key
 
     def update_appearance_ui(self):
         is_custom = self.theme_combo.currentText() == "Custom"
@@ -284,119 +426,96 @@ class SettingsDialog(QDialog):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        form = QFormLayout()
-        form.setSpacing(12)
-        form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
-
-        self.temperature_spin = QSpinBox()
-        self.temperature_spin.setRange(0, 100)
-        self.temperature_spin.setValue(70)
-        self.temperature_spin.setSuffix("%")
-        form.addRow("AI Temperature:", self.temperature_spin)
-
-        self.max_tokens_spin = QSpinBox()
-        self.max_tokens_spin.setRange(100, 4000)
-        self.max_tokens_spin.setSingleStep(100)
-        self.max_tokens_spin.setValue(2000)
-        form.addRow("Max tokens:", self.max_tokens_spin)
-
-        self.enable_caching_check = QCheckBox()
-        self.enable_caching_check.setChecked(True)
-        form.addRow("Cache responses:", self.enable_caching_check)
-
-        self.disable_temperature_check = QCheckBox()
-        self.disable_temperature_check.setChecked(False)
-        form.addRow("Disable temperature:", self.disable_temperature_check)
-
-        layout.addLayout(form)
-
-        # Info
-        info = QLabel(
+        layout.addLayout(self._build_form("ai"))
+        layout.addWidget(self._create_info_label(
             "Higher temperature = more creative but less focused.\n"
             "Lower temperature = more deterministic and focused."
-        )
-        info.setWordWrap(True)
-        info.setObjectName("infoLabel")
-        layout.addWidget(info)
+        ))
 
         layout.addStretch()
         return widget
 
     def load_settings(self):
         """Load settings from QSettings"""
-        provider = self.settings.value("ai/provider", "azure")
-        if provider == "openai":
+        cache = self._settings_cache
+        self.provider_bg.blockSignals(True)
+        if cache["ai/provider"] == "openai":
             self.openai_radio.setChecked(True)
         else:
             self.azure_radio.setChecked(True)
-        self.on_provider_changed()
-
-        self.azure_api_key_edit.setText(self.settings.value("azure/api_key", ""))
-        self.azure_endpoint_edit.setText(self.settings.value("azure/endpoint", ""))
-        self.azure_api_version_edit.setText(self.settings.value("azure/api_version", "2024-02-15-preview"))
-        self.azure_deployment_edit.setText(self.settings.value("azure/deployment", ""))
+        self.provider_bg.blockSignals(False)
 
-        self.openai_api_key_edit.setText(self.settings.value("openai/api_key", ""))
-        self.openai_model_edit.setText(self.settings.value("openai/model", "gpt-4"))
+        # Appearance
+        for color_type in ("primary", "bg", "text"):
+            self._set_color(color_type, cache[f"appearance/{color_type}_color"])
 
-        self.autosave_spin.setValue(int(self.settings.value("editor/autosave_interval", 5)))
-        self.font_size_spin.setValue(int(self.settings.value("editor/font_size", 12)))
-        self.show_word_count_check.setChecked(self.settings.value("editor/show_word_count", True, type=bool))
+        # Widgets of tabs that aren't built yet are filled in by
+        # _ensure_tab_built when the tab is first shown
+        self._load_fields()
 
-        self.temperature_spin.setValue(int(self.settings.value("ai/temperature", 70)))
-        self.max_tokens_spin.setValue(int(self.settings.value("ai/max_tokens", 2000)))
-        self.enable_caching_check.setChecked(self.settings.value("ai/enable_caching", True, type=bool))
-        self.disable_temperature_check.setChecked(self.settings.value("ai/disable_temperature", False, type=bool))
+        self.on_provider_changed()
+        self._ensure_tab_built(self.tabs.currentIndex())
 
-        # Appearance
-        theme = self.settings.value("appearance/theme", "Dark")
-        self.theme_combo.setCurrentText(theme)
-        self.primary_color = self.settings.value("appearance/primary_color", "#7C4DFF")
-        self.bg_color = self.settings.value("appearance/bg_color", "#121212")
-        self.text_color = self.settings.value("appearance/text_color", "#E0E0E0")
-        
-        self.update_color_button_style("primary")
-        self.update_color_button_style("bg")
-        self.update_color_button_style("text")
+    def _refresh_appearance(self):
+        """Sync the appearance tab's color buttons with the loaded colors"""
+        for color_type in ("primary", "bg", "text"):
+            self.update_color_button_style(color_type)
         self.update_appearance_ui()
 
     def save_settings(self):
         """Save settings to QSettings"""
-        provider = "openai" if self.openai_radio.isChecked() else "azure"
-        self.settings.setValue("ai/provider", provider)
-
-        # Strip all values to remove whitespace/newlines
-        self.settings.setValue("azure/api_key", self.azure_api_key_edit.text().strip())
-        self.settings.setValue("azure/endpoint", self.azure_endpoint_edit.text().strip())
-        self.settings.setValue("azure/api_version", self.azure_api_version_edit.text().strip())
-        self.settings.setValue("azure/deployment", self.azure_deployment_edit.text().strip())
-
-        self.settings.setValue("openai/api_key", self.openai_api_key_edit.text().strip())
-        self.settings.setValue("openai/model", self.openai_model_edit.text().strip())
-
-        self.settings.setValue("editor/autosave_interval", self.autosave_spin.value())
-        self.settings.setValue("editor/font_size", self.font_size_spin.value())
-        self.settings.setValue("editor/show_word_count", self.show_word_count_check.isChecked())
-
-        self.settings.setValue("ai/temperature", self.temperature_spin.value())
-        self.settings.setValue("ai/max_tokens", self.max_tokens_spin.value())
-        self.settings.setValue("ai/enable_caching", self.enable_caching_check.isChecked())
-        self.settings.setValue("ai/disable_temperature", self.disable_temperature_check.isChecked())
-
-        # Appearance
-        self.settings.setValue("appearance/theme", self.theme_combo.currentText())
-        self.settings.setValue("appearance/primary_color", self.primary_color)
-        self.settings.setValue("appearance/bg_color", self.bg_color)
-        self.settings.setValue("appearance/text_color", self.text_color)
+        values = {
+            "ai/provider": "openai" if self.openai_radio.isChecked() else "azure",
+            "appearance/primary_color": self.primary_color,
+            "appearance/bg_color": self.bg_color,
+            "appearance/text_color": self.text_color,
+        }
+        values.update(self._field_values())
+
+        if self._write_settings(values):
+            self.settings.sync()
+
+    def _field_values(self, keys=None):
+        """Current widget values for loaded fields, optionally limited to keys"""
+        values = {}
+        for key, attr, getter, _, _, typ in _FIELDS:
+            # Tabs that were never opened keep their cached values
+            if attr not in self._loaded_fields or (keys is not None and key not in keys):
+                continue
+            value = getter(getattr(self, attr))
+            if typ is str:
+                # Strip to remove whitespace/newlines
+                value = value.strip()
+            values[key] = value
+        return values
+
+    def _save_keys(self, keys, extra=None):
+        """Write the given fields (plus any extra values) without syncing"""
+        values = self._field_values(keys)
+        if extra:
+            values.update(extra)
+        self._write_settings(values)
+
+    def _write_settings(self, values):
+        """Write only the values that differ from the cached settings
+
+        Returns True if anything was written.
+        """
+        dirty = False
+        for key, value in values.items():
+            if self._settings_cache.get(key) != value:
+                self.settings.setValue(key, value)
+                self._settings_cache[key] = value
+                dirty = True
+        return dirty
 
     def save_and_accept(self):
         """Save settings and close"""
         self.save_settings()
         self.theme_changed.emit()
 
-        # Refresh AI manager with new settings
-        from ai_manager import ai_manager
-        ai_manager.refresh_client()
+        # Refresh AI manager with new settings in the background
+        QThreadPool.globalInstance().start(RefreshClientTask())
 
         self.accept()
 
@@ -413,39 +532,14 @@ class SettingsDialog(QDialog):
             )
             return
 
-        # Save settings first
-        self.settings.setValue("azure/api_key", api_key)
-        self.settings.setValue("azure/endpoint", endpoint)
-        self.settings.setValue("azure/api_version", self.azure_api_version_edit.text())
-        self.settings.setValue("azure/deployment", self.azure_deployment_edit.text())
-
-        # Force sync settings to disk
-        self.settings.sync()
-
-        # Refresh AI manager with new settings
-        from ai_manager import ai_manager
-        ai_manager.refresh_client()
-
-        # Test connection
-        success, message = ai_manager.test_connection()
+        # Save settings first; QSettings flushes them on its own schedule
+        self._save_keys(("azure/api_key", "azure/endpoint", "azure/api_version", "azure/deployment"))
 
-        if success:
-            QMessageBox.information(
-                self,
-                "Connection Successful",
-                f"{message}\n\nYour Azure OpenAI is configured correctly!"
-            )
-        else:
-            QMessageBox.warning(
-                self,
-                "Connection Failed",
-                f"{message}\n\nPlease check your credentials."
-            )
+        self._start_connection_test(self.azure_test_btn, "Azure OpenAI")
 
     def test_openai_connection(self):
         """Test Standard OpenAI connection"""
         api_key = self.openai_api_key_edit.text()
-        model = self.openai_model_edit.text()
 
         if not api_key:
             QMessageBox.warning(
@@ -455,26 +549,33 @@ class SettingsDialog(QDialog):
             )
             return
 
-        # Save settings first
-        self.settings.setValue("ai/provider", "openai")
-        self.settings.setValue("openai/api_key", api_key)
-        self.settings.setValue("openai/model", model)
+        # Save settings first; QSettings flushes them on its own schedule
+        self._save_keys(("openai/api_key", "openai/model"), {"ai/provider": "openai"})
 
-        # Force sync settings to disk
-        self.settings.sync()
+        self._start_connection_test(self.openai_test_btn, "OpenAI")
 
-        # Refresh AI manager with new settings
-        from ai_manager import ai_manager
-        ai_manager.refresh_client()
+    def _start_connection_test(self, test_btn, service_name):
+        """Run the connection test in the background, one at a time"""
+        if self._active_test is not None:
+            return
 
-        # Test connection
-        success, message = ai_manager.test_connection()
+        test_btn.setEnabled(False)
+        task = ConnectionTestTask()
+        task.signals.finished.connect(
+            lambda success, message: self._show_test_result(test_btn, service_name, success, message)
+        )
+        self._active_test = task
+        QThreadPool.globalInstance().start(task)
+
+    def _show_test_result(self, test_btn, service_name, success, message):
+        self._active_test = None
+        test_btn.setEnabled(True)
 
         if success:
             QMessageBox.information(
                 self,
                 "Connection Successful",
-                f"{message}\n\nYour OpenAI is configured correctly!"
+                f"{message}\n\nYour {service_name} is configured correctly!"
             )
         else:
             QMessageBox.warning(
@@ -6,10 +6,304 @@ from PyQt6.QtWidgets import (
     QMessageBox, QProgressDialog, QDialog, QVBoxLayout, 
     QScrollArea, QWidget, QCheckBox, QPushButton, QHBoxLayout, QLabel
 )
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import QObject, QThread, QRunnable, QThreadPool, QTimer, pyqtSignal, Qt
 from ai_manager import ai_manager
-from typing import List, Dict, Any
+from app_settings import SETTINGS
+from llm_cache import llm_cache
+from embed_cache import embed_cache
+from typing import List, Dict, Any, Callable, Iterable, Iterator
+from collections import deque
+from itertools import islice
+from html import unescape
+import hashlib
+import json
+import logging
+import queue
 import re
+import threading
+
+try:
+    # selectolax >= 1.0 only ships the lexbor backend
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+try:
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except ImportError:
+    SPACY_AVAILABLE = False
+
+_TAG_RE = re.compile(r'<[^>]+>')
+# Any word starting with a capital; text without one names no one and nowhere
+_CAPITALIZED_RE = re.compile(r'\b[A-Z]')
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.I | re.S)
+
+# "FIELD: value" lines in the per-chapter AI responses
+_CHARACTER_LINE_RE = re.compile(r'^[ \t]*(CHARACTER|SIGNIFICANCE|ROLE):(.*)$', re.M)
+_LOCATION_LINE_RE = re.compile(r'^[ \t]*(LOCATION|TYPE|DESCRIPTION):(.*)$', re.M)
+_PLOT_THREADS_LINE_RE = re.compile(r'^[ \t]*PLOT THREADS:(.*)$', re.M)
+
+# Characters of text kept on each side of a name when asking the AI to classify it
+NER_CONTEXT_CHARS = 120
+
+# Size (in tokens of chapter text) of one batched extraction call;
+# chapters are grouped so each call stays well inside the context window
+BATCH_TOKEN_BUDGET = 24000
+
+# A small final group is folded into the previous one when the merged group
+# is within BATCH_TOKEN_BUDGET / BATCH_MERGE_THRESHOLD, saving a call for a
+# chapter or two
+BATCH_MERGE_THRESHOLD = 0.95
+
+# Default prompt budget for one chapter's text
+CHAPTER_TOKEN_BUDGET = 3500
+
+# Response caps for one chapter; real answers stay well below these, and a
+# lower cap shortens decoding and the provider's reservation per request
+CHARACTER_MAX_TOKENS = 1500
+LOCATION_MAX_TOKENS = 1500
+PLOT_MAX_TOKENS = 800
+
+# Ceiling for calls covering many chapters or characters at once
+MAX_RESPONSE_TOKENS = 16000
+
+# Used when tiktoken is unavailable, and as an upper bound when collecting text
+APPROX_CHARS_PER_TOKEN = 4
+MAX_CHARS_PER_TOKEN = 8
+
+# Names whose embeddings are at least this similar are treated as one
+# character/location ("Dr. Watson" / "John H. Watson")
+NAME_CLUSTER_THRESHOLD = 0.88
+
+_SIGNIFICANCE_RANK = {'minor': 0, 'supporting': 1, 'major': 2}
+
+logger = logging.getLogger("novelist_ai.story_extractor")
+
+# Loaded on first use by _get_nlp, _get_encoder and _get_ai_pool
+_nlp = None
+_encoder = None
+_ai_pool = None
+
+# Workers that were still inside an AI call when their extractor shut down.
+# Held here until the thread exits, since destroying a running QThread aborts
+# the process; PyQt doesn't destroy them at interpreter exit either.
+_retired_workers = set()
+
+# Upper bound on one AI request, so a stop request never waits on a hung connection
+REQUEST_TIMEOUT_SECONDS = 180
+
+# Characters of each chapter's prompt text used for its embedding
+EMBED_CHAR_LIMIT = 8000
+
+# Texts per embedding request; chapters are also read from the database this
+# many at a time while an extraction runs
+EMBED_BATCH_SIZE = 64
+
+# Upper bound on one embedding request; embeddings can't be abandoned mid-call
+EMBED_TIMEOUT_SECONDS = 30
+
+# Bump when prompts or result conversion change so cached per-chapter
+# results from older versions are no longer reused
+EXTRACTION_VERSION = "v1"
+
+
+def _get_nlp():
+    """Load the spaCy English model once; None if spaCy or the model is missing"""
+    global _nlp
+    if _nlp is None and SPACY_AVAILABLE:
+        try:
+            # Only the NER component is needed
+            _nlp = spacy.load("en_core_web_sm", disable=["tagger", "parser", "lemmatizer"])
+        except OSError as e:
+            print(f"spaCy model unavailable, using AI character extraction: {e}")
+            _nlp = False
+    return _nlp or None
+
+
+def _get_encoder():
+    """Load the tokenizer once; None if tiktoken or its encoding data is missing"""
+    global _encoder
+    if _encoder is None and TIKTOKEN_AVAILABLE:
+        try:
+            _encoder = tiktoken.encoding_for_model("gpt-4o-mini")
+        except Exception as e:
+            print(f"tiktoken encoding unavailable, estimating tokens from length: {e}")
+            _encoder = False
+    return _encoder or None
+
+
+# Labeled lines that fill in the current record: label -> (key, normalize).
+# normalize returns None to ignore an unrecognized value.
+_CHARACTER_FIELDS = {
+    'SIGNIFICANCE': ('significance', lambda v: v.lower() if v.lower() in _SIGNIFICANCE_RANK else None),
+    'ROLE': ('role', None),
+}
+_LOCATION_FIELDS = {
+    'TYPE': ('type', None),
+    'DESCRIPTION': ('description', None),
+}
+
+
+def _parse_labeled_records(response: str, line_re, start_label: str,
+                           new_record: Callable[[str], Dict], fields: Dict) -> Dict:
+    """
+    Parse "LABEL: value" blocks in one pass. A start_label line opens a new
+    record keyed by its value; the other labels in fields fill it in.
+    """
+    records = {}
+    current = None
+
+    for match in line_re.finditer(response):
+        label, value = match.group(1), match.group(2).strip()
+        if label == start_label:
+            current = None
+            if value:
+                current = records[value] = new_record(value)
+        elif current is not None:
+            key, normalize = fields[label]
+            if normalize is not None:
+                value = normalize(value)
+            if value is not None:
+                current[key] = value
+
+    return records
+
+
+def _thread_key(name: str) -> str:
+    """Plot thread identity: "Love Story", "love  story" and "Love story " are one thread"""
+    return ' '.join(name.split()).casefold()
+
+
+def _get_ai_pool() -> QThreadPool:
+    """
+    Thread pool for AI calls. They spend their time blocked on the network, so
+    they get their own pool instead of the CPU-sized global one. It lives for
+    the whole session so dropping a worker never waits on its calls.
+    """
+    global _ai_pool
+    if _ai_pool is None:
+        _ai_pool = QThreadPool()
+    return _ai_pool
+
+
+def _release_retired_worker(worker: 'ExtractionWorker'):
+    """Drop a stopped worker once its thread has exited (runs on the GUI thread)"""
+    # finished is emitted just before the thread ends; wait out the last step
+    worker.wait()
+    if worker in _retired_workers:
+        _retired_workers.discard(worker)
+        worker.finished.disconnect()
+
+
+def _count_tokens(text: str) -> int:
+    """Number of tokens in text (estimated from its length without tiktoken)"""
+    enc = _get_encoder()
+    if enc is None:
+        return len(text) // APPROX_CHARS_PER_TOKEN + 1
+    return len(enc.encode(text, disallowed_special=()))
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens"""
+    enc = _get_encoder()
+    if enc is None:
+        return text[:max_tokens * APPROX_CHARS_PER_TOKEN]
+    ids = enc.encode(text, disallowed_special=())
+    if len(ids) <= max_tokens:
+        return text
+    return enc.decode(ids[:max_tokens])
+
+
+def _json_dumps(obj) -> str:
+    """Serialize prompt payloads (orjson when available; non-ASCII kept as-is)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _json_loads(text: str):
+    """Parse an AI response; both parsers raise json.JSONDecodeError on bad input"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _text_hash(text: str) -> bytes:
+    """Short content hash used to spot scenes with identical text"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+class _NameIndex:
+    """Word index over character names so matching only compares names that share a word"""
+
+    def __init__(self):
+        self._by_word = {}  # lowercase word -> set of names
+        self._order = {}  # name -> insertion sequence
+        self._normalized = {}  # name -> (lowercase name, its words)
+        self._seq = 0
+
+    def normalized(self, name: str):
+        """(lowercase name, words) for an indexed name, computed once"""
+        cached = self._normalized.get(name)
+        if cached is None:
+            clean = name.strip().lower()
+            cached = (clean, clean.split())
+        return cached
+
+    def add(self, name: str):
+        self._order[name] = self._seq
+        self._seq += 1
+        clean = name.strip().lower()
+        parts = clean.split()
+        self._normalized[name] = (clean, parts)
+        for word in parts:
+            self._by_word.setdefault(word, set()).add(name)
+
+    def remove(self, name: str):
+        self._order.pop(name, None)
+        normalized = self._normalized.pop(name, None)
+        for word in (normalized[1] if normalized else name.strip().lower().split()):
+            names = self._by_word.get(word)
+            if names:
+                names.discard(name)
+
+    def candidates(self, name: str) -> List[str]:
+        """Names sharing at least one word with name, oldest first"""
+        found = set()
+        for word in name.strip().lower().split():
+            found |= self._by_word.get(word, set())
+        return sorted(found, key=self._order.__getitem__)
+
 
 class SelectionDialog(QDialog):
     """Dialog with checkboxes to select items for import"""
@@ -30,16 +324,9 @@ class SelectionDialog(QDialog):
         self.content_layout = QVBoxLayout(content)
         
         self.checkboxes = []
-        for item in items:
-            cb = QCheckBox(f"{item['display_name']}")
-            cb.setToolTip(item.get('description', ''))
-            cb.setChecked(True)
-            cb.setProperty("item_data", item['original_data'])
-            cb.setProperty("item_id", item['id'])
-            self.content_layout.addWidget(cb)
-            self.checkboxes.append(cb)
-            
         self.content_layout.addStretch()
+        for item in items:
+            self.add_item(item)
         scroll.setWidget(content)
         layout.addWidget(scroll)
         
@@ -47,21 +334,46 @@ class SelectionDialog(QDialog):
         btn_layout = QHBoxLayout()
         select_all_btn = QPushButton("Select All")
         select_none_btn = QPushButton("Select None")
-        ok_btn = QPushButton("Import Selected")
+        self.ok_btn = QPushButton("Import Selected")
         cancel_btn = QPushButton("Cancel")
         
         select_all_btn.clicked.connect(self.select_all)
         select_none_btn.clicked.connect(self.select_none)
-        ok_btn.clicked.connect(self.accept)
+        self.ok_btn.clicked.connect(self.accept)
         cancel_btn.clicked.connect(self.reject)
         
         btn_layout.addWidget(select_all_btn)
         btn_layout.addWidget(select_none_btn)
         btn_layout.addStretch()
-        btn_layout.addWidget(ok_btn)
+        btn_layout.addWidget(self.ok_btn)
         btn_layout.addWidget(cancel_btn)
         layout.addLayout(btn_layout)
 
+    def add_item(self, item: Dict):
+        """Append a checkbox for one item"""
+        cb = QCheckBox(f"{item['display_name']}")
+        cb.setToolTip(item.get('description', ''))
+        cb.setChecked(True)
+        cb.setProperty("item_data", item['original_data'])
+        cb.setProperty("item_id", item['id'])
+        # Keep the stretch last
+        self.content_layout.insertWidget(self.content_layout.count() - 1, cb)
+        self.checkboxes.append(cb)
+
+    def set_items(self, items: List[Dict]):
+        """Replace all checkboxes with the given items"""
+        for cb in self.checkboxes:
+            self.content_layout.removeWidget(cb)
+            cb.deleteLater()
+        self.checkboxes = []
+        for item in items:
+            self.add_item(item)
+
+    def set_busy(self, busy: bool):
+        """Disable importing while results are still coming in"""
+        self.ok_btn.setEnabled(not busy)
+        self.ok_btn.setText("Analyzing..." if busy else "Import Selected")
+
     def select_all(self):
         for cb in self.checkboxes:
             cb.setChecked(True)
@@ -78,20 +390,129 @@ class SelectionDialog(QDialog):
                 selected[item_id] = cb.property("item_data")
         return selected
 
-class ExtractionWorker(QThread):
-    """Worker thread for extracting story elements"""
-    progress = pyqtSignal(str, int)  # message, percentage
-    finished = pyqtSignal(dict)  # extracted data
-    error = pyqtSignal(str)
 
-    def __init__(self, operation_type: str, chapters: List[Dict], scenes: List[Dict]):
+class ChapterRunnable(QRunnable):
+    """Run one batched or single-chapter AI call on a pool thread"""
+
+    def __init__(self, work, fn, args: tuple, done: queue.Queue, worker: 'ExtractionWorker'):
+        super().__init__()
+        self.op_id = worker.current_op
+        self.work = work
+        self.fn = fn
+        self.args = args
+        self.done = done
+        self.worker = worker
+
+    def run(self):
+        result = None
+        if not self.worker.is_cancelled(self.op_id):
+            self.worker.bind_call_op(self.op_id)
+            try:
+                result = self.fn(*self.args)
+            except Exception as e:
+                print(f"Error in extraction task: {e}")
+        self.done.put((self.work, result))
+
+
+class ExtractionWorker(QThread):
+    """
+    Long-lived worker thread for extracting story elements.
+
+    Operations are queued with submit() and run one at a time; every signal
+    carries the id submit() returned so callers can tell runs apart.
+    """
+    progress = pyqtSignal(int, str, int)  # op id, message, percentage
+    op_finished = pyqtSignal(int, dict)  # op id, extracted data
+    chapter_done = pyqtSignal(int, str, dict)  # op id, chapter name, that chapter's results
+    op_error = pyqtSignal(int, str)  # op id, error
+
+    def __init__(self, project_id=None, max_chapter_tokens: int = CHAPTER_TOKEN_BUDGET):
         super().__init__()
+        self.project_id = project_id
+        self.max_chapter_tokens = max_chapter_tokens
+        # Max AI calls in flight at once; the AI manager's rate limiter still
+        # spaces out request starts
+        self.concurrency = max(1, SETTINGS.value("ai/max_parallel_requests", 8, type=int))
+        self.op_queue = queue.Queue()
+        self._stop = threading.Event()
+        self._next_op = 1
+        self._current_op = 0
+        self._cancelled = set()
+        # Op id of the call running on each pool thread, so a cancel can abort it mid-stream
+        self._call_op = threading.local()
+        # scene id -> (content hash, stripped text); kept across operations so
+        # running a second extraction doesn't strip unchanged scenes again
+        self._stripped = {}
+
+        # State of the operation being run
+        self.operation_type = None
+        self.chapters: Iterable[Dict] = ()
+        self._chapter_total = 0  # expected number of chapters, for progress
+        self._load_scenes: Callable[[Any], List[Dict]] = lambda chapter_id: []
+        self._chapter_order = {}  # chapter name -> position in the book
+
+    def is_cancelled(self, op_id: int) -> bool:
+        """True once the operation was cancelled or the worker is stopping"""
+        return self._stop.is_set() or op_id in self._cancelled
+
+    @property
+    def current_op(self) -> int:
+        """Id of the operation being run"""
+        return self._current_op
+
+    def bind_call_op(self, op_id: int):
+        """Tie AI calls made on the calling pool thread to op_id, so cancelling it aborts them"""
+        self._call_op.op_id = op_id
+
+    @property
+    def cancel_flag(self) -> bool:
+        """Whether the running operation should stop"""
+        return self.is_cancelled(self._current_op)
+
+    def submit(self, operation_type: str, chapters: Iterable[Dict],
+               load_scenes: Callable[[Any], List[Dict]], total_chapters: int = 0) -> int:
+        """
+        Queue an operation ("characters", "locations" or "plot"); returns its id.
+        chapters is consumed once on the worker thread and load_scenes(chapter_id)
+        is called per chapter, so neither needs to be materialized up front;
+        total_chapters is only used to scale progress until chapters runs out.
+        """
+        op_id = self._next_op
+        self._next_op += 1
+        self.op_queue.put((op_id, operation_type, chapters, load_scenes, total_chapters))
+        return op_id
+
+    def cancel(self, op_id: int):
+        """Cancel a queued or running operation; in-flight AI calls finish but are discarded"""
+        self._cancelled.add(op_id)
+
+    def request_stop(self):
+        """Abandon all work and exit once the current AI calls return"""
+        self._stop.set()
+
+    def run(self):
+        """Process operations from the queue"""
+        while not self._stop.is_set():
+            try:
+                op = self.op_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            self._execute(*op)
+
+    def _execute(self, op_id: int, operation_type: str, chapters: Iterable[Dict],
+                 load_scenes: Callable[[Any], List[Dict]], total_chapters: int = 0):
+        """Run one operation and report its result"""
+        self._current_op = op_id
         self.operation_type = operation_type
         self.chapters = chapters
-        self.scenes = scenes
+        self._chapter_total = total_chapters
+        self._load_scenes = load_scenes
+        self._chapter_order = {}
 
-    def run(self):
         try:
+            if self.cancel_flag:
+                return
+
             if self.operation_type == "characters":
                 result = self._extract_characters()
             elif self.operation_type == "locations":
@@ -101,34 +522,611 @@ class ExtractionWorker(QThread):
             else:
                 result = {}
 
-            self.finished.emit(result)
+            if not self.cancel_flag:
+                self.op_finished.emit(op_id, result)
         except Exception as e:
             import traceback
             traceback.print_exc()
-            self.error.emit(str(e))
+            self.op_error.emit(op_id, str(e))
+        finally:
+            self.chapters = ()
+            self._load_scenes = lambda chapter_id: []
+
+    def _iter_chapter_scenes(self):
+        """
+        Yield (index, chapter_name, scenes) for every chapter with scenes,
+        loading one chapter's scenes at a time. Also records the chapter order.
+        """
+        for idx, chapter in enumerate(self.chapters):
+            if self.cancel_flag:
+                break
+            chapter_name = chapter.get('name', f'Chapter {idx + 1}')
+            self._chapter_order.setdefault(chapter_name, idx)
+
+            chapter_scenes = self._load_scenes(chapter.get('id'))
+            if chapter_scenes:
+                yield idx, chapter_name, chapter_scenes
+
+    def _chapter_payloads(self) -> Iterator[Dict]:
+        """Yield the prompt text for each chapter that has scenes, as chapters are read"""
+        for idx, chapter_name, chapter_scenes in self._iter_chapter_scenes():
+            if self.operation_type == "plot":
+                # Get scene summaries or content, skipping copy-pasted duplicates
+                scene_info = []
+                seen_hashes = set()
+                for scene in chapter_scenes:
+                    summary = scene.get('summary', '')
+                    if not summary:
+                        content = self._scene_excerpt(scene, 500)
+                        summary = content
+                    h = _text_hash(summary)
+                    if h in seen_hashes:
+                        continue
+                    seen_hashes.add(h)
+                    scene_info.append(f"Scene: {scene.get('name', 'Untitled')}\n{summary}")
+                text = "\n\n".join(scene_info)
+            else:
+                # Combine scene content, limited to prevent token overflow
+                text = self._concat_stripped(chapter_scenes, self.max_chapter_tokens)
+
+            yield {
+                'chapter_id': str(idx + 1),
+                'name': chapter_name,
+                'text': text,
+                'tokens': _count_tokens(text)
+            }
+
+    def _concat_stripped(self, scenes: List[Dict], max_tokens: int) -> str:
+        """
+        Join stripped scene text and cut it to max_tokens tokens. Scenes are
+        only stripped until there is certainly enough text to fill the budget.
+        Scenes whose text is identical to an earlier one are only sent once.
+        """
+        limit = max_tokens * MAX_CHARS_PER_TOKEN
+        parts = []
+        seen_hashes = set()
+        total = 0
+        for scene in scenes:
+            text = self._scene_text(scene)
+            h = _text_hash(text)
+            if h in seen_hashes:
+                continue
+            seen_hashes.add(h)
+            parts.append(text)
+            total += len(text)
+            if total >= limit:
+                break
+            total += 2  # "\n\n" separator
+        return _truncate_to_tokens("\n\n".join(parts), max_tokens)
+
+    def _collect_chapter_results(self, payloads: Iterable[Dict], batch_spec: Dict,
+                                 analyze_chapter, progress_label: str) -> List[tuple]:
+        """
+        Run one extraction over all chapters.
+
+        payloads is read EMBED_BATCH_SIZE chapters at a time, and only while
+        the pool has room for more work, so the first AI call goes out once
+        the first batch fills and only chapters still waiting on a result keep
+        their text in memory. Chapters whose text is nearly identical to an
+        earlier draft reuse that draft's result from embed_cache, where each
+        new result is stored as soon as its chapter finishes, so an
+        interrupted run picks up where it stopped. The rest are grouped
+        greedily, in arrival order, into batched calls that fit in
+        BATCH_TOKEN_BUDGET. Chapters missing from a batch's response (or whose
+        batch failed to parse) fall back to analyze_chapter(payload). Each call
+        is a ChapterRunnable on the AI thread pool, with up to
+        self.concurrency in flight at once since each one just waits on the
+        network. Results come back through a queue and are only touched on
+        this thread, so no locking is needed.
+
+        Returns [(chapter_name, result)] in chapter order.
+        """
+        results = {}
+        order = []  # (chapter_id, name) of every chapter read, in chapter order
+        source = iter(payloads)
+        exhausted = False
+
+        # The chapter count is an estimate (chapters without scenes are never
+        # yielded) until the payloads run out
+        total = max(1, self._chapter_total)
+        completed = 0
+        reused = 0  # chapters settled without an AI call
+
+        # Report progress at most ~20 times however many chapters there are
+        progress_step = max(1, total // 20)
+        last_reported = 0
+
+        needs_ai = batch_spec.get('needs_ai')
+        scope = (f"{self.project_id}:{self.operation_type}:{EXTRACTION_VERSION}:"
+                 f"{ai_manager.get_deployment()}:{ai_manager.get_embedding_model()}")
+        embeddings = {}  # chapter id -> embedding, until the chapter's result is stored
+
+        backlog = deque()
+        group = []  # batch being filled as chapters arrive
+        group_size = 0
+
+        def read_more():
+            """Read the next chapters; settle stubs and near-duplicates, batch the rest"""
+            nonlocal exhausted, completed, reused, total, group, group_size
+            chunk = list(islice(source, EMBED_BATCH_SIZE))
+            if len(chunk) < EMBED_BATCH_SIZE:
+                exhausted = True
+
+            candidates = []
+            for payload in chunk:
+                order.append((payload['chapter_id'], payload['name']))
+                # Stub chapters that can't contain anything to extract get an
+                # empty result without an AI call
+                if needs_ai and not needs_ai(payload['text']):
+                    results[payload['chapter_id']] = {}
+                    completed += 1
+                    reused += 1
+                else:
+                    candidates.append(payload)
+
+            # Reuse results for chapters that barely changed since the last run
+            chunk_embeddings = self._embed_payloads(candidates)
+            for payload in candidates:
+                embedding = chunk_embeddings.get(payload['chapter_id'])
+                cached = embed_cache.lookup(scope, payload['name'], embedding) if embedding else None
+                if cached is not None:
+                    result = tuple(cached) if self.operation_type == "plot" else cached
+                    results[payload['chapter_id']] = result
+                    self._emit_chapter_done(payload['name'], result)
+                    completed += 1
+                    reused += 1
+                    continue
+                if embedding:
+                    embeddings[payload['chapter_id']] = embedding
+
+                size = payload['tokens']
+                if group and group_size + size > BATCH_TOKEN_BUDGET:
+                    backlog.append((group, self._call_batched, (group, batch_spec)))
+                    group = []
+                    group_size = 0
+                group.append(payload)
+                group_size += size
+
+            if exhausted:
+                total = max(1, len(order))
+                if group:
+                    # Fold a small final group into the previous batch if that hasn't started yet
+                    last = backlog[-1][0] if backlog else None
+                    if (isinstance(last, list) and group_size + sum(p['tokens'] for p in last)
+                            <= BATCH_TOKEN_BUDGET / BATCH_MERGE_THRESHOLD):
+                        last.extend(group)
+                    else:
+                        backlog.append((group, self._call_batched, (group, batch_spec)))
+                    group = []
+                    group_size = 0
+            else:
+                total = max(total, len(order))
+
+        pool = _get_ai_pool()
+        pool.setMaxThreadCount(max(pool.maxThreadCount(), self.concurrency))
+        done = queue.Queue()
+        in_flight = 0
+
+        def finish(payload, result):
+            # Stored as each chapter finishes, so a cancelled or crashed run
+            # keeps every chapter it already paid for
+            results[payload['chapter_id']] = result
+            self._emit_chapter_done(payload['name'], result)
+            embedding = embeddings.pop(payload['chapter_id'], None)
+            if embedding:
+                embed_cache.store(scope, payload['name'], embedding, result)
+
+        while not self.cancel_flag:
+            # Read chapters only as fast as the pool can take more work
+            while not exhausted and len(backlog) < self.concurrency - in_flight and not self.cancel_flag:
+                before = completed
+                read_more()
+                if completed > before and order:
+                    self.progress.emit(self._current_op, f"{progress_label} {order[-1][1]}...",
+                                       min(100, completed * 100 // total))
+                    last_reported = completed
+
+            if not backlog and not in_flight:
+                break
+
+            while backlog and in_flight < self.concurrency:
+                work, fn, args = backlog.popleft()
+                pool.start(ChapterRunnable(work, fn, args, done, self))
+                in_flight += 1
+
+            try:
+                # Wake up periodically so a cancel doesn't wait on a slow call
+                work, result = done.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            in_flight -= 1
+            if self.cancel_flag:
+                break
+
+            if isinstance(work, list):
+                # A batch finished; queue per-chapter calls for anything it missed
+                batched = result or {}
+                for payload in work:
+                    chapter_id = payload['chapter_id']
+                    if chapter_id in batched:
+                        finish(payload, batched[chapter_id])
+                        completed += 1
+                    else:
+                        backlog.append((payload, analyze_chapter, (payload,)))
+                last_name = work[-1]['name']
+            else:
+                if result is not None:
+                    finish(work, result)
+                completed += 1
+                last_name = work['name']
+
+            if completed - last_reported >= progress_step or (exhausted and completed == total):
+                self.progress.emit(self._current_op, f"{progress_label} {last_name}...",
+                                   min(100, completed * 100 // total))
+                last_reported = completed
+
+        if reused:
+            print(f"Skipped or reused results for {reused}/{len(order)} chapters")
+        return [(name, results[chapter_id]) for chapter_id, name in order if chapter_id in results]
+
+    def _embed_payloads(self, payloads: List[Dict]) -> Dict[str, List[float]]:
+        """Embed every chapter's prompt text; returns {} if embeddings are unavailable"""
+        if not payloads or not embed_cache.is_enabled():
+            return {}
+
+        embeddings = {}
+        try:
+            for start in range(0, len(payloads), EMBED_BATCH_SIZE):
+                chunk = payloads[start:start + EMBED_BATCH_SIZE]
+                vectors = ai_manager.embed([p['text'][:EMBED_CHAR_LIMIT] or " " for p in chunk],
+                                           timeout=EMBED_TIMEOUT_SECONDS)
+                for payload, vector in zip(chunk, vectors):
+                    embeddings[payload['chapter_id']] = vector
+        except Exception as e:
+            print(f"Embedding failed, skipping similarity cache: {e}")
+            return {}
+        return embeddings
+
+    def _emit_chapter_done(self, chapter_name: str, result):
+        """Publish one chapter's (unmerged) results in the same shape as finished"""
+        if self.operation_type == "plot":
+            analysis, threads = result
+            data = {
+                'plot_analysis': [{'chapter': chapter_name, 'analysis': analysis}],
+                'plot_threads': threads
+            }
+        else:
+            data = {self.operation_type: result}
+        self.chapter_done.emit(self._current_op, chapter_name, data)
+
+    def _call_batched(self, group: List[Dict], spec: Dict) -> Dict:
+        """
+        Ask the AI about several chapters at once using a JSON prompt.
+        Returns {chapter_id: result}; empty if the call or parse failed.
+        """
+        names = {p['chapter_id']: p['name'] for p in group}
+        chapters_json = _json_dumps(
+            [{'chapter_id': p['chapter_id'], 'chapter': p['name'], 'text': p['text']} for p in group]
+        )
+        key = spec['key']
+
+        prompt = f"""{spec['task']}
+
+CHAPTERS (JSON):
+{chapters_json}
+
+Respond with JSON only, in this exact shape:
+{{"chapters": [{{"chapter_id": "<chapter_id>", "{key}": {spec['shape']}}}]}}
+
+Include one entry for every chapter_id in the input."""
+
+        try:
+            response = self._call_api_cached(
+                prompt,
+                system_message=spec['system_message'],
+                temperature=spec['temperature'],
+                max_tokens=min(MAX_RESPONSE_TOKENS, spec['max_tokens'] * len(group)),
+                response_format={"type": "json_object"},
+                validate=self._parse_json_response
+            )
+            data = self._parse_json_response(response)
+        except json.JSONDecodeError as e:
+            print(f"Batched response was not valid JSON, falling back to per-chapter calls: {e}")
+            return {}
+        except Exception as e:
+            print(f"Error in batched analysis, falling back to per-chapter calls: {e}")
+            return {}
+
+        results = {}
+        for entry in data.get('chapters', []):
+            chapter_id = str(entry.get('chapter_id', ''))
+            if chapter_id in names and entry.get(key) is not None:
+                results[chapter_id] = spec['convert'](entry[key], names[chapter_id])
+        return results
+
+    def _call_api_cached(self, prompt: str, system_message: str, temperature: float,
+                         max_tokens: int, response_format: Dict = None,
+                         validate: Callable[[str], Any] = None) -> str:
+        """
+        Call the AI, reusing a cached response for an identical low-temperature prompt.
+        With validate, a new response is only cached if validate(response) doesn't
+        raise, so a truncated or malformed reply isn't replayed on every rerun.
+        """
+        messages = [{"role": "user", "content": prompt}]
+        key = llm_cache.cache_key(
+            ai_manager.get_deployment(),
+            [{"role": "system", "content": system_message}] + messages,
+            temperature,
+            max_tokens=max_tokens,
+            response_format=response_format
+        )
+
+        response = llm_cache.get(key)
+        if response is None:
+            op_id = getattr(self._call_op, 'op_id', self._current_op)
+            response = ai_manager.call_api(
+                messages=messages,
+                system_message=system_message,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+                should_stop=lambda: self.is_cancelled(op_id)
+            )
+            if validate is not None:
+                try:
+                    validate(response)
+                except Exception:
+                    return response
+            llm_cache.set(key, response)
+        return response
+
+    def _parse_json_response(self, response: str) -> Dict:
+        """Parse a JSON response, tolerating ```json fences"""
+        text = response.strip()
+        if text.startswith('```'):
+            text = text.split('\n', 1)[1] if '\n' in text else ''
+            if text.rstrip().endswith('```'):
+                text = text.rstrip()[:-3]
+        data = _json_loads(text)
+        if not isinstance(data, dict):
+            raise json.JSONDecodeError("Expected a JSON object", text, 0)
+        return data
 
     def _extract_characters(self):
         """Extract characters from all scenes chapter by chapter"""
+        if _get_nlp() is not None:
+            return self._extract_characters_ner()
+
         all_characters = {}
-        total_chapters = len(self.chapters)
+        index = _NameIndex()
+
+        batch_spec = {
+            'task': "Extract all character names from each chapter below. For each character give "
+                    "their full name (first and last if available), their significance "
+                    "(major, supporting, or minor) and a brief one-line description of their role.",
+            'key': 'characters',
+            'shape': '[{"name": "...", "significance": "major|supporting|minor", "role": "..."}]',
+            'system_message': "You are a literary analyst extracting character information from novels.",
+            'temperature': 0.3,
+            'max_tokens': CHARACTER_MAX_TOKENS,
+            'convert': self._characters_from_json,
+            'needs_ai': _CAPITALIZED_RE.search
+        }
 
-        for idx, chapter in enumerate(self.chapters):
-            chapter_name = chapter.get('name', f'Chapter {idx + 1}')
-            self.progress.emit(f"Analyzing {chapter_name}...", int((idx / total_chapters) * 100))
+        results = self._collect_chapter_results(
+            self._chapter_payloads(), batch_spec, self._analyze_chapter_characters, "Analyzing"
+        )
 
-            # Get scenes for this chapter
-            chapter_scenes = [s for s in self.scenes if s.get('parent_id') == chapter.get('id')]
+        for chapter_name, characters in results:
+            # Merge with existing characters
+            for char_name, char_data in characters.items():
+                self._merge_character(all_characters, index, char_name, char_data, chapter_name)
 
-            if not chapter_scenes:
-                continue
+        self._merge_character_clusters(all_characters, index)
+
+        return {'characters': all_characters}
+
+    def _merge_character(self, all_characters: Dict, index: _NameIndex,
+                         char_name: str, char_data: Dict, chapter_name: str):
+        """Merge one chapter's character into the running results (and their name index)"""
+        # Find if this is a duplicate (first/last name match)
+        matched_name = self._find_matching_character(char_name, all_characters, index)
+
+        if matched_name:
+            # Matched an existing character - merge
+            all_characters[matched_name]['mentions'] += 1
+            all_characters[matched_name]['chapters'].append(chapter_name)
+            # Upgrade significance if needed
+            if char_data['significance'] == 'major':
+                all_characters[matched_name]['significance'] = 'major'
+            elif char_data['significance'] == 'supporting' and all_characters[matched_name][
+                'significance'] == 'minor':
+                all_characters[matched_name]['significance'] = 'supporting'
+            # Use the longer/more complete name
+            if len(char_name) > len(matched_name):
+                all_characters[char_name] = all_characters.pop(matched_name)
+                all_characters[char_name]['name'] = char_name
+                index.remove(matched_name)
+                index.add(char_name)
+        else:
+            # New character
+            all_characters[char_name] = {
+                **char_data,
+                'mentions': 1,
+                'chapters': [chapter_name]
+            }
+            index.add(char_name)
+
+    def _cluster_similar_names(self, names: List[str]) -> List[List[str]]:
+        """
+        Group names that refer to the same thing by embedding them in one call
+        and joining pairs above NAME_CLUSTER_THRESHOLD (union-find).
+        Returns only groups with more than one name; [] if embeddings are unavailable.
+        """
+        if not NUMPY_AVAILABLE or len(names) < 2 or self.cancel_flag:
+            return []
+
+        try:
+            vectors = np.asarray(ai_manager.embed(names, timeout=EMBED_TIMEOUT_SECONDS), dtype=np.float32)
+        except Exception as e:
+            print(f"Embedding failed, skipping name clustering: {e}")
+            return []
+
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        similar = np.triu((vectors @ vectors.T) > NAME_CLUSTER_THRESHOLD, k=1)
+
+        parent = list(range(len(names)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, j in zip(*np.nonzero(similar)):
+            parent[find(int(i))] = find(int(j))
+
+        groups = {}
+        for i, name in enumerate(names):
+            groups.setdefault(find(i), []).append(name)
+        return [group for group in groups.values() if len(group) > 1]
+
+    def _union_chapters(self, first: List[str], second: List[str]) -> List[str]:
+        """Chapters appearing in either list, once each, in book order"""
+        order = self._chapter_order
+        return sorted(set(first) | set(second), key=lambda name: order.get(name, len(order)))
+
+    def _merge_character_clusters(self, all_characters: Dict, index: _NameIndex):
+        """Fold characters whose names embed as the same person into the longest name"""
+        for group in self._cluster_similar_names(list(all_characters)):
+            canonical = max(group, key=len)
+            merged = all_characters[canonical]
+            for name in group:
+                if name == canonical:
+                    continue
+                data = all_characters.pop(name)
+                index.remove(name)
+                merged['chapters'] = self._union_chapters(merged['chapters'], data['chapters'])
+                if _SIGNIFICANCE_RANK.get(data['significance'], 0) > _SIGNIFICANCE_RANK.get(merged['significance'], 0):
+                    merged['significance'] = data['significance']
+                if not merged.get('role'):
+                    merged['role'] = data.get('role', '')
+            merged['mentions'] = len(merged['chapters'])
+            merged['first_appearance'] = merged['chapters'][0]
+
+    def _extract_characters_ner(self):
+        """
+        Find character names locally with spaCy NER, then make a single AI
+        call to classify the deduplicated names by significance and role.
+        """
+        nlp = _get_nlp()
+        all_characters = {}
+        index = _NameIndex()
+        contexts = {}  # name -> text around its first mention
+
+        # Stream stripped scenes chapter by chapter, tagged with their chapter
+        chapter_names = []
+        chapter_found = []
+
+        def scene_texts():
+            for _, chapter_name, chapter_scenes in self._iter_chapter_scenes():
+                chapter_names.append(chapter_name)
+                chapter_found.append({})
+                for scene in chapter_scenes:
+                    yield self._scene_text(scene), len(chapter_names) - 1
+
+        # Run NER over all scenes in one batched pass. Collapse variants within
+        # a chapter ("Smith" / "John Smith") so each character counts once per chapter
+        self.progress.emit(self._current_op, "Finding character names...", 0)
+        for doc, chapter_idx in nlp.pipe(scene_texts(), as_tuples=True, batch_size=64):
+            if self.cancel_flag:
+                break
+            text = doc.text
+            names = chapter_found[chapter_idx]
+            for ent in doc.ents:
+                name = ent.text.strip()
+                if ent.label_ != "PERSON" or not name:
+                    continue
+                matched_name = self._find_matching_character(name, names)
+                if matched_name is None:
+                    start = max(0, ent.start_char - NER_CONTEXT_CHARS)
+                    names[name] = text[start:ent.end_char + NER_CONTEXT_CHARS]
+                elif len(name) > len(matched_name):
+                    names[name] = names.pop(matched_name)
+
+        for chapter_name, names in zip(chapter_names, chapter_found):
+            chapter_characters = {}
+            for name, context in names.items():
+                contexts.setdefault(name, context)
+                chapter_characters[name] = {
+                    'name': name,
+                    'significance': 'minor',
+                    'role': '',
+                    'first_appearance': chapter_name
+                }
+                self._merge_character(all_characters, index, name, chapter_characters[name], chapter_name)
+            if chapter_characters:
+                self._emit_chapter_done(chapter_name, chapter_characters)
+
+        self._merge_character_clusters(all_characters, index)
+
+        if all_characters:
+            self.progress.emit(self._current_op, "Classifying characters...", 90)
+            self._classify_characters(all_characters, index, contexts)
 
-            # Combine scene content
-            chapter_text = "\n\n".join([
-                self._strip_html(s.get('content', '')) for s in chapter_scenes
-            ])[:3000]  # Limit to prevent token overflow
+        return {'characters': all_characters}
+
+    def _classify_characters(self, all_characters: Dict, index: _NameIndex, contexts: Dict):
+        """Fill in significance and role for NER-found characters with one AI call"""
+        entries = []
+        for name, data in all_characters.items():
+            entries.append({
+                'name': name,
+                'chapters': len(data['chapters']),
+                'context': contexts.get(name, '')
+            })
+
+        prompt = f"""These character names were found in a novel, with the number of chapters each
+appears in and a short excerpt around one mention. For each character estimate their
+significance (major, supporting, or minor) and give a brief one-line description of their role.
+
+CHARACTERS (JSON):
+{_json_dumps(entries)}
+
+Respond with JSON only, in this exact shape:
+{{"characters": [{{"name": "...", "significance": "major|supporting|minor", "role": "..."}}]}}"""
+
+        try:
+            response = self._call_api_cached(
+                prompt,
+                system_message="You are a literary analyst extracting character information from novels.",
+                temperature=0.3,
+                max_tokens=min(MAX_RESPONSE_TOKENS, 100 + 60 * len(entries)),
+                response_format={"type": "json_object"},
+                validate=self._parse_json_response
+            )
+            classified = self._characters_from_json(
+                self._parse_json_response(response).get('characters', []), ''
+            )
+        except Exception as e:
+            print(f"Error classifying characters: {e}")
+            classified = {}
+
+        for name, data in classified.items():
+            matched_name = name if name in all_characters else self._find_matching_character(
+                name, all_characters, index
+            )
+            if matched_name:
+                all_characters[matched_name]['significance'] = data['significance']
+                all_characters[matched_name]['role'] = data['role']
 
-            # Ask AI to extract characters
-            prompt = f"""Extract all character names from this chapter text. For each character:
+    def _analyze_chapter_characters(self, payload: Dict):
+        """Extract characters from a single chapter (fallback path)"""
+        chapter_name = payload['name']
+
+        # Ask AI to extract characters
+        prompt = f"""Extract all character names from this chapter text. For each character:
 1. Identify their full name (first and last if available)
 2. Estimate their significance (major, supporting, or minor)
 3. Brief one-line description of their role
@@ -136,81 +1134,87 @@ class ExtractionWorker(QThread):
 Chapter: {chapter_name}
 
 TEXT:
-{chapter_text}
+{payload['text']}
 
-Respond in this EXACT format:
-CHARACTER: [Name]
-SIGNIFICANCE: [major/supporting/minor]
-ROLE: [one-line role description]
+Respond with JSON only, in this exact shape:
+{{"characters": [{{"name": "...", "significance": "major|supporting|minor", "role": "..."}}]}}"""
 
-(Repeat for each character found)"""
+        try:
+            response = self._call_api_cached(
+                prompt,
+                system_message="You are a literary analyst extracting character information from novels.",
+                temperature=0.3,
+                max_tokens=CHARACTER_MAX_TOKENS,
+                response_format={"type": "json_object"},
+                validate=self._parse_json_response
+            )
 
+            # Parse response, falling back to the line format for non-JSON replies
             try:
-                response = ai_manager.call_api(
-                    messages=[{"role": "user", "content": prompt}],
-                    system_message="You are a literary analyst extracting character information from novels.",
-                    temperature=0.3,
-                    max_tokens=16000
-                )
-
-                # Parse response
-                characters = self._parse_character_response(response, chapter_name)
-
-                # Merge with existing characters
-                for char_name, char_data in characters.items():
-                    # Find if this is a duplicate (first/last name match)
-                    matched_name = self._find_matching_character(char_name, all_characters)
-
-                    if matched_name:
-                        # Matched an existing character - merge
-                        all_characters[matched_name]['mentions'] += 1
-                        all_characters[matched_name]['chapters'].append(chapter_name)
-                        # Upgrade significance if needed
-                        if char_data['significance'] == 'major':
-                            all_characters[matched_name]['significance'] = 'major'
-                        elif char_data['significance'] == 'supporting' and all_characters[matched_name][
-                            'significance'] == 'minor':
-                            all_characters[matched_name]['significance'] = 'supporting'
-                        # Use the longer/more complete name
-                        if len(char_name) > len(matched_name):
-                            all_characters[char_name] = all_characters.pop(matched_name)
-                            all_characters[char_name]['name'] = char_name
-                    else:
-                        # New character
-                        all_characters[char_name] = {
-                            **char_data,
-                            'mentions': 1,
-                            'chapters': [chapter_name]
-                        }
+                data = self._parse_json_response(response)
+                return self._characters_from_json(data.get('characters') or [], chapter_name)
+            except json.JSONDecodeError:
+                return self._parse_character_response(response, chapter_name)
 
-            except Exception as e:
-                print(f"Error analyzing chapter {chapter_name}: {e}")
-                continue
-
-        return {'characters': all_characters}
+        except Exception as e:
+            print(f"Error analyzing chapter {chapter_name}: {e}")
+            return None
 
     def _extract_locations(self):
         """Extract locations from all scenes chapter by chapter"""
         all_locations = {}
-        total_chapters = len(self.chapters)
 
-        for idx, chapter in enumerate(self.chapters):
-            chapter_name = chapter.get('name', f'Chapter {idx + 1}')
-            self.progress.emit(f"Finding locations in {chapter_name}...", int((idx / total_chapters) * 100))
+        batch_spec = {
+            'task': "Extract all significant locations mentioned in each chapter below. For each "
+                    "location give the location name, its type (city, building, room, outdoor, etc.) "
+                    "and a brief description.",
+            'key': 'locations',
+            'shape': '[{"name": "...", "type": "...", "description": "..."}]',
+            'system_message': "You are a literary analyst extracting location information from novels.",
+            'temperature': 0.3,
+            'max_tokens': LOCATION_MAX_TOKENS,
+            'convert': self._locations_from_json,
+            'needs_ai': _CAPITALIZED_RE.search
+        }
 
-            # Get scenes for this chapter
-            chapter_scenes = [s for s in self.scenes if s.get('parent_id') == chapter.get('id')]
+        results = self._collect_chapter_results(
+            self._chapter_payloads(), batch_spec, self._analyze_chapter_locations, "Finding locations in"
+        )
 
-            if not chapter_scenes:
-                continue
+        for chapter_name, locations in results:
+            # Merge with existing locations
+            for loc_name, loc_data in locations.items():
+                if loc_name in all_locations:
+                    all_locations[loc_name]['appearances'] += 1
+                    all_locations[loc_name]['chapters'].append(chapter_name)
+                else:
+                    all_locations[loc_name] = {
+                        **loc_data,
+                        'appearances': 1,
+                        'chapters': [chapter_name]
+                    }
+
+        for group in self._cluster_similar_names(list(all_locations)):
+            canonical = max(group, key=len)
+            merged = all_locations[canonical]
+            for name in group:
+                if name == canonical:
+                    continue
+                data = all_locations.pop(name)
+                merged['chapters'] = self._union_chapters(merged['chapters'], data['chapters'])
+                if not merged.get('description'):
+                    merged['description'] = data.get('description', '')
+            merged['appearances'] = len(merged['chapters'])
+            merged['first_mention'] = merged['chapters'][0]
 
-            # Combine scene content
-            chapter_text = "\n\n".join([
-                self._strip_html(s.get('content', '')) for s in chapter_scenes
-            ])[:3000]
+        return {'locations': all_locations}
+
+    def _analyze_chapter_locations(self, payload: Dict):
+        """Extract locations from a single chapter (fallback path)"""
+        chapter_name = payload['name']
 
-            # Ask AI to extract locations
-            prompt = f"""Extract all significant locations mentioned in this chapter text. For each location:
+        # Ask AI to extract locations
+        prompt = f"""Extract all significant locations mentioned in this chapter text. For each location:
 1. The location name
 2. Type (city, building, room, outdoor, etc.)
 3. Brief description
@@ -218,78 +1222,89 @@ ROLE: [one-line role description]
 Chapter: {chapter_name}
 
 TEXT:
-{chapter_text}
+{payload['text']}
 
-Respond in this EXACT format:
-LOCATION: [Name]
-TYPE: [type]
-DESCRIPTION: [one-line description]
+Respond with JSON only, in this exact shape:
+{{"locations": [{{"name": "...", "type": "...", "description": "..."}}]}}"""
 
-(Repeat for each location)"""
+        try:
+            response = self._call_api_cached(
+                prompt,
+                system_message="You are a literary analyst extracting location information from novels.",
+                temperature=0.3,
+                max_tokens=LOCATION_MAX_TOKENS,
+                response_format={"type": "json_object"},
+                validate=self._parse_json_response
+            )
 
+            # Parse response, falling back to the line format for non-JSON replies
             try:
-                response = ai_manager.call_api(
-                    messages=[{"role": "user", "content": prompt}],
-                    system_message="You are a literary analyst extracting location information from novels.",
-                    temperature=0.3,
-                    max_tokens=16000
-                )
-
-                # Parse response
-                locations = self._parse_location_response(response, chapter_name)
-
-                # Merge with existing locations
-                for loc_name, loc_data in locations.items():
-                    if loc_name in all_locations:
-                        all_locations[loc_name]['appearances'] += 1
-                        all_locations[loc_name]['chapters'].append(chapter_name)
-                    else:
-                        all_locations[loc_name] = {
-                            **loc_data,
-                            'appearances': 1,
-                            'chapters': [chapter_name]
-                        }
-
-            except Exception as e:
-                print(f"Error analyzing chapter {chapter_name}: {e}")
-                continue
+                data = self._parse_json_response(response)
+                return self._locations_from_json(data.get('locations') or [], chapter_name)
+            except json.JSONDecodeError:
+                return self._parse_location_response(response, chapter_name)
 
-        return {'locations': all_locations}
+        except Exception as e:
+            print(f"Error analyzing chapter {chapter_name}: {e}")
+            return None
 
     def _analyze_plot(self):
         """Analyze plot structure chapter by chapter"""
         plot_analysis = []
         plot_threads = {}  # Track unique plot threads
-        total_chapters = len(self.chapters)
-
-        for idx, chapter in enumerate(self.chapters):
-            chapter_name = chapter.get('name', f'Chapter {idx + 1}')
-            self.progress.emit(f"Analyzing plot in {chapter_name}...", int((idx / total_chapters) * 100))
+        thread_keys = {}  # Case/whitespace-folded name -> first-seen name
+
+        batch_spec = {
+            'task': "Analyze the plot elements in each chapter below. For each chapter list the "
+                    "ongoing plot threads (give each a short name), the key events, the conflicts "
+                    "that arise or continue, and any major turning points or revelations.",
+            'key': 'plot',
+            'shape': '{"plot_threads": ["..."], "key_events": ["..."], "conflicts": ["..."], '
+                     '"turning_points": ["..."]}',
+            'system_message': "You are a plot analyst examining story structure.",
+            'temperature': 0.4,
+            'max_tokens': PLOT_MAX_TOKENS,
+            'convert': self._plot_from_json
+        }
 
-            # Get scenes for this chapter
-            chapter_scenes = [s for s in self.scenes if s.get('parent_id') == chapter.get('id')]
+        results = self._collect_chapter_results(
+            self._chapter_payloads(), batch_spec, self._analyze_chapter_plot, "Analyzing plot in"
+        )
 
-            if not chapter_scenes:
-                continue
+        for chapter_name, (analysis, threads) in results:
+            plot_analysis.append({
+                'chapter': chapter_name,
+                'analysis': analysis
+            })
+
+            for thread_name, thread_data in threads.items():
+                key = _thread_key(thread_name)
+                existing = thread_keys.get(key)
+                if existing is not None:
+                    chapters = plot_threads[existing]['chapters']
+                    if chapters[-1] != chapter_name:
+                        chapters.append(chapter_name)
+                else:
+                    thread_keys[key] = thread_name
+                    plot_threads[thread_name] = thread_data
+                    plot_threads[thread_name]['chapters'] = [chapter_name]
 
-            # Get scene summaries or content
-            scene_info = []
-            for scene in chapter_scenes:
-                summary = scene.get('summary', '')
-                if not summary:
-                    content = self._strip_html(scene.get('content', ''))[:500]
-                    summary = content
-                scene_info.append(f"Scene: {scene.get('name', 'Untitled')}\n{summary}")
+        return {
+            'plot_analysis': plot_analysis,
+            'plot_threads': plot_threads
+        }
 
-            chapter_content = "\n\n".join(scene_info)
+    def _analyze_chapter_plot(self, payload: Dict):
+        """Analyze plot in a single chapter (fallback path)"""
+        chapter_name = payload['name']
 
-            # Ask AI to analyze plot
-            prompt = f"""Analyze the plot elements in this chapter:
+        # Ask AI to analyze plot
+        prompt = f"""Analyze the plot elements in this chapter:
 
 Chapter: {chapter_name}
 
 SCENES:
-{chapter_content}
+{payload['text']}
 
 Provide:
 1. PLOT THREADS: What ongoing storylines are present? (Give each a short name)
@@ -297,151 +1312,216 @@ Provide:
 3. CONFLICTS: What conflicts arise or continue?
 4. TURNING POINTS: Any major turning points or revelations?
 
-Format as:
-PLOT THREADS: [Thread Name 1], [Thread Name 2], ...
-KEY EVENTS: [list]
-CONFLICTS: [list]
-TURNING POINTS: [list or "None"]"""
+Respond with JSON only, in this exact shape:
+{{"plot": {{"plot_threads": ["..."], "key_events": ["..."], "conflicts": ["..."], "turning_points": ["..."]}}}}"""
 
-            try:
-                response = ai_manager.call_api(
-                    messages=[{"role": "user", "content": prompt}],
-                    system_message="You are a plot analyst examining story structure.",
-                    temperature=0.4,
-                    max_tokens=800
-                )
-
-                plot_analysis.append({
-                    'chapter': chapter_name,
-                    'analysis': response
-                })
-
-                # Extract plot threads from response
-                threads = self._extract_plot_threads(response, chapter_name)
-                for thread_name, thread_data in threads.items():
-                    if thread_name in plot_threads:
-                        plot_threads[thread_name]['chapters'].append(chapter_name)
-                    else:
-                        plot_threads[thread_name] = thread_data
-                        plot_threads[thread_name]['chapters'] = [chapter_name]
+        try:
+            response = self._call_api_cached(
+                prompt,
+                system_message="You are a plot analyst examining story structure.",
+                temperature=0.4,
+                max_tokens=PLOT_MAX_TOKENS,
+                response_format={"type": "json_object"},
+                validate=self._parse_json_response
+            )
 
-            except Exception as e:
-                print(f"Error analyzing plot for {chapter_name}: {e}")
-                continue
+            # Parse response, falling back to the line format for non-JSON replies
+            try:
+                data = self._parse_json_response(response)
+                return self._plot_from_json(data.get('plot'), chapter_name)
+            except json.JSONDecodeError:
+                return response, self._extract_plot_threads(response, chapter_name)
 
-        return {
-            'plot_analysis': plot_analysis,
-            'plot_threads': plot_threads
-        }
+        except Exception as e:
+            print(f"Error analyzing plot for {chapter_name}: {e}")
+            return None
 
-    def _parse_character_response(self, response: str, chapter_name: str) -> Dict:
-        """Parse AI response for character extraction"""
+    def _characters_from_json(self, items: List[Dict], chapter_name: str) -> Dict:
+        """Convert batched JSON character entries to the parsed-response format"""
         characters = {}
-        lines = response.strip().split('\n')
-
-        current_char = None
-        current_data = {}
-
-        for line in lines:
-            line = line.strip()
-            if not line:
+        for item in items:
+            if not isinstance(item, dict):
                 continue
-
-            if line.startswith('CHARACTER:'):
-                # Save previous character
-                if current_char:
-                    characters[current_char] = current_data
-                # Start new character
-                current_char = line.split(':', 1)[1].strip()
-                current_data = {
-                    'name': current_char,
-                    'significance': 'minor',
-                    'role': '',
-                    'first_appearance': chapter_name
-                }
-            elif line.startswith('SIGNIFICANCE:') and current_char:
-                sig = line.split(':', 1)[1].strip().lower()
-                if sig in ['major', 'supporting', 'minor']:
-                    current_data['significance'] = sig
-            elif line.startswith('ROLE:') and current_char:
-                current_data['role'] = line.split(':', 1)[1].strip()
-
-        # Don't forget last character
-        if current_char:
-            characters[current_char] = current_data
-
+            name = str(item.get('name', '')).strip()
+            if not name:
+                continue
+            sig = str(item.get('significance', '')).strip().lower()
+            characters[name] = {
+                'name': name,
+                'significance': sig if sig in ['major', 'supporting', 'minor'] else 'minor',
+                'role': str(item.get('role', '')).strip(),
+                'first_appearance': chapter_name
+            }
         return characters
 
-    def _parse_location_response(self, response: str, chapter_name: str) -> Dict:
-        """Parse AI response for location extraction"""
+    def _locations_from_json(self, items: List[Dict], chapter_name: str) -> Dict:
+        """Convert batched JSON location entries to the parsed-response format"""
         locations = {}
-        lines = response.strip().split('\n')
-
-        current_loc = None
-        current_data = {}
-
-        for line in lines:
-            line = line.strip()
-            if not line:
+        for item in items:
+            if not isinstance(item, dict):
                 continue
+            name = str(item.get('name', '')).strip()
+            if not name:
+                continue
+            locations[name] = {
+                'name': name,
+                'type': str(item.get('type', '')).strip() or 'unknown',
+                'description': str(item.get('description', '')).strip(),
+                'first_mention': chapter_name
+            }
+        return locations
 
-            if line.startswith('LOCATION:'):
-                # Save previous location
-                if current_loc:
-                    locations[current_loc] = current_data
-                # Start new location
-                current_loc = line.split(':', 1)[1].strip()
-                current_data = {
-                    'name': current_loc,
-                    'type': 'unknown',
-                    'description': '',
-                    'first_mention': chapter_name
-                }
-            elif line.startswith('TYPE:') and current_loc:
-                current_data['type'] = line.split(':', 1)[1].strip()
-            elif line.startswith('DESCRIPTION:') and current_loc:
-                current_data['description'] = line.split(':', 1)[1].strip()
+    def _plot_from_json(self, plot: Dict, chapter_name: str) -> tuple:
+        """Convert a batched JSON plot entry to (analysis text, plot threads)"""
+        if not isinstance(plot, dict):
+            plot = {}
+
+        def as_text(value):
+            if isinstance(value, list):
+                return ", ".join(str(v).strip() for v in value if str(v).strip())
+            return str(value or '').strip()
+
+        analysis = "\n".join([
+            f"PLOT THREADS: {as_text(plot.get('plot_threads'))}",
+            f"KEY EVENTS: {as_text(plot.get('key_events'))}",
+            f"CONFLICTS: {as_text(plot.get('conflicts'))}",
+            f"TURNING POINTS: {as_text(plot.get('turning_points')) or 'None'}"
+        ])
+
+        # Keep the list structure; only a plain-string answer is split on commas
+        names = plot.get('plot_threads')
+        if not isinstance(names, list):
+            names = str(names or '').split(',')
+        return analysis, self._plot_threads_from_names(names, chapter_name)
 
-        # Don't forget last location
-        if current_loc:
-            locations[current_loc] = current_data
+    def _parse_character_response(self, response: str, chapter_name: str) -> Dict:
+        """Parse AI response for character extraction"""
+        return _parse_labeled_records(
+            response, _CHARACTER_LINE_RE, 'CHARACTER',
+            lambda name: {
+                'name': name,
+                'significance': 'minor',
+                'role': '',
+                'first_appearance': chapter_name
+            },
+            _CHARACTER_FIELDS
+        )
 
-        return locations
+    def _parse_location_response(self, response: str, chapter_name: str) -> Dict:
+        """Parse AI response for location extraction"""
+        return _parse_labeled_records(
+            response, _LOCATION_LINE_RE, 'LOCATION',
+            lambda name: {
+                'name': name,
+                'type': 'unknown',
+                'description': '',
+                'first_mention': chapter_name
+            },
+            _LOCATION_FIELDS
+        )
 
     def _extract_plot_threads(self, response: str, chapter_name: str) -> Dict:
         """Extract plot thread names from AI response"""
+        match = _PLOT_THREADS_LINE_RE.search(response)
+        if not match:
+            return {}
+        # Extract thread names, split by commas
+        return self._plot_threads_from_names(match.group(1).split(','), chapter_name)
+
+    def _plot_threads_from_names(self, names: Iterable, chapter_name: str) -> Dict:
+        """Build the plot threads dict from thread names, dropping blanks, 'none' and repeats"""
         plot_threads = {}
-        lines = response.strip().split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if line.startswith('PLOT THREADS:'):
-                # Extract thread names
-                threads_text = line.split(':', 1)[1].strip()
-                # Split by commas
-                thread_names = [t.strip() for t in threads_text.split(',')]
-
-                for thread_name in thread_names:
-                    if thread_name and thread_name.lower() not in ['none', 'n/a', '']:
-                        plot_threads[thread_name] = {
-                            'name': thread_name,
-                            'description': f'Plot thread identified in {chapter_name}'
-                        }
-                break
+        seen_keys = set()
+
+        for thread_name in names:
+            thread_name = str(thread_name).strip()
+            if thread_name and thread_name.lower() not in ['none', 'n/a', '']:
+                key = _thread_key(thread_name)
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                plot_threads[thread_name] = {
+                    'name': thread_name,
+                    'description': f'Plot thread identified in {chapter_name}'
+                }
 
         return plot_threads
 
     def _strip_html(self, html: str) -> str:
-        """Strip HTML tags from content"""
-        text = re.sub(r'<[^>]+>', ' ', html)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
-
-    def _find_matching_character(self, new_name: str, existing_characters: Dict) -> str:
+        """Strip HTML tags (and script/style bodies) from content"""
+        if not html:
+            return ''
+        if '<' not in html:
+            # Plain text (or only entities): nothing for a parser to do
+            text = unescape(html) if '&' in html else html
+            return ' '.join(text.split())
+        try:
+            if SELECTOLAX_AVAILABLE:
+                tree = HTMLParser(html)
+                tree.strip_tags(['script', 'style'])
+                text = tree.text(separator=' ')
+            elif LXML_AVAILABLE:
+                doc = lxml_html.fromstring(html)
+                for element in doc.xpath('//script|//style'):
+                    element.drop_tree()
+                text = ' '.join(doc.itertext())
+            else:
+                text = unescape(_TAG_RE.sub(' ', _SCRIPT_STYLE_RE.sub(' ', html)))
+        except Exception:
+            # Malformed (or whitespace-only) markup the parser rejects
+            text = unescape(_TAG_RE.sub(' ', _SCRIPT_STYLE_RE.sub(' ', html)))
+        # str.split() collapses the same whitespace as \s+ without the regex engine
+        return ' '.join(text.split())
+
+    def _scene_text(self, scene: Dict) -> str:
+        """A scene's stripped content, reused while the content is unchanged"""
+        content = scene.get('content', '')
+        scene_id = scene.get('id')
+        if not content or scene_id is None:
+            return self._strip_html(content)
+
+        content_hash = _text_hash(content)
+        cached = self._stripped.get(scene_id)
+        if cached is not None and cached[0] == content_hash:
+            return cached[1]
+
+        text = self._strip_html(content)
+        self._stripped[scene_id] = (content_hash, text)
+        return text
+
+    def _scene_excerpt(self, scene: Dict, max_chars: int) -> str:
+        """The start of a scene's stripped content, from the cache when it is current"""
+        content = scene.get('content', '')
+        cached = self._stripped.get(scene.get('id'))
+        if cached is not None and content and cached[0] == _text_hash(content):
+            return cached[1][:max_chars]
+        return self._strip_html_prefix(content, max_chars)
+
+    def _strip_html_prefix(self, html: str, max_chars: int) -> str:
+        """
+        First max_chars characters of _strip_html(html), stripping only as much
+        of a long scene's markup as needed. The cut is made just after a tag so
+        no partial tag leaks into the text.
+        """
+        window = max(4096, max_chars * MAX_CHARS_PER_TOKEN)
+        while window < len(html):
+            end = html.rfind('>', 0, window) + 1
+            if end:
+                text = self._strip_html(html[:end])
+                if len(text) > max_chars:
+                    return text[:max_chars]
+            window *= 4
+        return self._strip_html(html)[:max_chars]
+
+    def _find_matching_character(self, new_name: str, existing_characters: Dict,
+                                 index: _NameIndex = None) -> str:
         """
         Find if a character name matches an existing one
         Returns the existing character name if match found, None otherwise
 
+        With an index, only existing names sharing a word with new_name are
+        compared instead of every existing name.
+
         Handles cases like:
         - "John Smith" matches "Smith" or "John"
         - "Sarah" matches "Sarah Johnson"
@@ -450,9 +1530,14 @@ TURNING POINTS: [list or "None"]"""
         new_name_clean = new_name.strip().lower()
         new_parts = new_name_clean.split()
 
-        for existing_name in existing_characters.keys():
-            existing_clean = existing_name.strip().lower()
-            existing_parts = existing_clean.split()
+        candidates = index.candidates(new_name) if index is not None else existing_characters.keys()
+
+        for existing_name in candidates:
+            if index is not None:
+                existing_clean, existing_parts = index.normalized(existing_name)
+            else:
+                existing_clean = existing_name.strip().lower()
+                existing_parts = existing_clean.split()
 
             # Exact match
             if new_name_clean == existing_clean:
@@ -489,6 +1574,79 @@ TURNING POINTS: [list or "None"]"""
         return None
 
 
+class PlotThreadSaveWorker(QObject):
+    """Writes selected plot threads to the database off the GUI thread"""
+    progress = pyqtSignal(int, int)  # threads prepared, total
+    written = pyqtSignal(int, int)  # rows written, total
+    finished = pyqtSignal(list)  # saved PlotThread items
+    error = pyqtSignal(str)
+
+    def __init__(self, db_manager, project_id: str, plot_threads: Dict):
+        super().__init__()
+        self.db_manager = db_manager
+        self.project_id = project_id
+        self.plot_threads = plot_threads
+
+    def run(self):
+        if not self.plot_threads:
+            self.finished.emit([])
+            return
+
+        try:
+            threads = self._build_threads()
+        except Exception as e:
+            logger.exception("Preparing plot threads failed")
+            self.error.emit(f"Could not prepare plot threads: {e}")
+            return
+
+        if not self.db_manager.save_items_bulk(self.project_id, threads, self.written.emit):
+            logger.error("Writing %d plot threads failed", len(threads))
+            self.error.emit("Database write failed")
+            return
+        logger.info("Saved %d plot threads", len(threads))
+
+        self.finished.emit(threads)
+
+    def _build_threads(self) -> list:
+        """Turn the extracted thread dicts into PlotThread items"""
+        from models.project import PlotThread
+
+        total = len(self.plot_threads)
+        progress_step = max(1, total // 20)
+        logger.info("Preparing %d plot threads", total)
+
+        default_description = "Plot thread identified from story analysis"
+        threads = []
+        append = threads.append
+        for name, data in self.plot_threads.items():
+            get = data.get
+            chapters = get('chapters') or ()
+
+            # Determine importance based on how many chapters it appears in
+            chapter_count = len(chapters)
+            if chapter_count >= 10:
+                importance = "main"
+            elif chapter_count >= 5:
+                importance = "major"
+            else:
+                importance = "minor"
+
+            # Create plot thread with correct fields
+            append(PlotThread(
+                name=name,
+                description=get('description', default_description),
+                importance=importance,
+                resolution="ongoing",
+                notes=f"Appears in {chapter_count} chapters: {', '.join(chapters[:5])}"
+            ))
+
+            done = len(threads)
+            if done % progress_step == 0 or done == total:
+                self.progress.emit(done, total)
+
+        return threads
+
+
 class StoryExtractor:
     """Main class for extracting and analyzing story elements"""
 
@@ -496,17 +1654,83 @@ class StoryExtractor:
         self.parent = parent
         self.db_manager = db_manager
         self.project_id = project_id
-        self.worker = None
 
-    def extract_characters(self):
-        """Extract characters from manuscript"""
+        # Background saves in progress: (QThread, worker) pairs kept alive until done
+        self._save_jobs = []
+
+        # One worker thread serves every extraction; callbacks are looked up by op id
+        self._ops = {}
+        self.worker = ExtractionWorker(project_id)
+        self.worker.progress.connect(self._on_op_progress)
+        self.worker.chapter_done.connect(self._on_op_chapter_done)
+        self.worker.op_finished.connect(self._on_op_finished)
+        self.worker.op_error.connect(self._on_op_error)
+        self.worker.start()
+
+    def shutdown(self):
+        """Stop the worker thread and let any pending save finish"""
+        worker = self.worker
+        worker.request_stop()
+        if not worker.wait(1500):
+            # Still inside an AI call: keep the thread object alive until it exits
+            _retired_workers.add(worker)
+            worker.finished.connect(lambda w=worker: _release_retired_worker(w))
+            if worker.isFinished():
+                _release_retired_worker(worker)
+        for thread, _ in list(self._save_jobs):
+            thread.wait()
+
+    def _has_scenes(self) -> bool:
+        """Check for scenes without loading them"""
         from models.project import ItemType
+        return self.db_manager.count_items(self.project_id, ItemType.SCENE) > 0
 
-        # Get all chapters and scenes
-        chapters = [c.to_dict() for c in self.db_manager.load_items(self.project_id, ItemType.CHAPTER)]
-        scenes = [s.to_dict() for s in self.db_manager.load_items(self.project_id, ItemType.SCENE)]
+    def _submit(self, operation_type: str, progress: QProgressDialog, **handlers) -> int:
+        """
+        Queue an operation on the worker and route its signals to handlers.
+        Chapters and their scenes are read from the database by the worker as it goes.
+        """
+        from models.project import ItemType
+        db_manager = self.db_manager
+        chapters = (c.to_dict() for c in db_manager.iter_items(self.project_id, ItemType.CHAPTER))
+
+        def load_scenes(chapter_id):
+            return [s.to_dict() for s in db_manager.load_scenes_for(chapter_id)]
+
+        op_id = self.worker.submit(operation_type, chapters, load_scenes,
+                                   db_manager.count_items(self.project_id, ItemType.CHAPTER))
+        self._ops[op_id] = handlers
+        progress.canceled.connect(lambda: self._cancel(op_id))
+        return op_id
+
+    def _cancel(self, op_id: int):
+        """Cancel an operation and drop its callbacks"""
+        self.worker.cancel(op_id)
+        self._ops.pop(op_id, None)
+
+    def _on_op_progress(self, op_id: int, message: str, percentage: int):
+        handlers = self._ops.get(op_id)
+        if handlers:
+            handlers['on_progress'](message, percentage)
+
+    def _on_op_chapter_done(self, op_id: int, chapter_name: str, data: Dict):
+        handlers = self._ops.get(op_id)
+        if handlers and 'on_chapter_done' in handlers:
+            handlers['on_chapter_done'](chapter_name, data)
+
+    def _on_op_finished(self, op_id: int, data: Dict):
+        handlers = self._ops.pop(op_id, None)
+        if handlers:
+            handlers['on_finished'](data)
+
+    def _on_op_error(self, op_id: int, error: str):
+        handlers = self._ops.pop(op_id, None)
+        if handlers:
+            handlers['on_error'](error)
 
-        if not scenes:
+    def extract_characters(self):
+        """Extract characters from manuscript"""
+        if not self._has_scenes():
             QMessageBox.warning(self.parent, "No Content", "Please write some scenes first.")
             return
 
@@ -516,28 +1740,34 @@ class StoryExtractor:
         progress.setMinimumDuration(0)
         progress.setValue(0)
 
-        # Start worker
-        self.worker = ExtractionWorker("characters", chapters, scenes)
+        # Shown as soon as the first chapter comes back and filled in as the rest do
+        dialog = SelectionDialog([], "Select Characters to Import", self.parent)
+        dialog.set_busy(True)
+        shown = set()
+
+        def on_chapter_done(chapter_name, data):
+            for name, char_data in data.get('characters', {}).items():
+                if name not in shown:
+                    shown.add(name)
+                    dialog.add_item(self._character_item(name, char_data))
+            if shown and not dialog.isVisible():
+                dialog.show()
 
         def on_finished(data):
             progress.close()
             characters = data.get('characters', {})
 
             if not characters:
+                dialog.close()
                 QMessageBox.information(self.parent, "No Characters", "No characters were found.")
                 return
 
-            # Prepare items for selection dialog
-            items = []
-            for name, char_data in sorted(characters.items(), key=lambda x: -x[1]['mentions']):
-                items.append({
-                    'id': name,
-                    'display_name': f"{name} ({char_data['significance']}) - {char_data['mentions']} chapters",
-                    'description': char_data.get('role', ''),
-                    'original_data': char_data
-                })
-
-            dialog = SelectionDialog(items, "Select Characters to Import", self.parent)
+            # Replace the per-chapter preview with the merged results
+            dialog.set_items([
+                self._character_item(name, char_data)
+                for name, char_data in sorted(characters.items(), key=lambda x: -x[1]['mentions'])
+            ])
+            dialog.set_busy(False)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 selected_characters = dialog.get_selected()
                 if selected_characters:
@@ -548,27 +1778,20 @@ class StoryExtractor:
 
         def on_error(error):
             progress.close()
+            dialog.close()
             QMessageBox.critical(self.parent, "Error", f"Failed to extract characters:\n\n{error}")
 
         def on_progress(message, percentage):
             progress.setLabelText(message)
             progress.setValue(percentage)
 
-        self.worker.finished.connect(on_finished)
-        self.worker.error.connect(on_error)
-        self.worker.progress.connect(on_progress)
-        progress.canceled.connect(self.worker.terminate)
-
-        self.worker.start()
+        self._submit("characters", progress, on_finished=on_finished,
+                     on_chapter_done=on_chapter_done, on_error=on_error, on_progress=on_progress)
+        progress.canceled.connect(dialog.reject)
 
     def extract_locations(self):
         """Extract locations from manuscript"""
-        from models.project import ItemType
-
-        chapters = [c.to_dict() for c in self.db_manager.load_items(self.project_id, ItemType.CHAPTER)]
-        scenes = [s.to_dict() for s in self.db_manager.load_items(self.project_id, ItemType.SCENE)]
-
-        if not scenes:
+        if not self._has_scenes():
             QMessageBox.warning(self.parent, "No Content", "Please write some scenes first.")
             return
 
@@ -577,27 +1800,35 @@ class StoryExtractor:
         progress.setMinimumDuration(0)
         progress.setValue(0)
 
-        self.worker = ExtractionWorker("locations", chapters, scenes)
+
+        # Shown as soon as the first chapter comes back and filled in as the rest do
+        dialog = SelectionDialog([], "Select Locations to Import", self.parent)
+        dialog.set_busy(True)
+        shown = set()
+
+        def on_chapter_done(chapter_name, data):
+            for name, loc_data in data.get('locations', {}).items():
+                if name not in shown:
+                    shown.add(name)
+                    dialog.add_item(self._location_item(name, loc_data))
+            if shown and not dialog.isVisible():
+                dialog.show()
 
         def on_finished(data):
             progress.close()
             locations = data.get('locations', {})
 
             if not locations:
+                dialog.close()
                 QMessageBox.information(self.parent, "No Locations", "No locations were found.")
                 return
 
-            # Prepare items for selection dialog
-            items = []
-            for name, loc_data in sorted(locations.items(), key=lambda x: -x[1]['appearances']):
-                items.append({
-                    'id': name,
-                    'display_name': f"{name} ({loc_data['type']}) - {loc_data['appearances']} chapters",
-                    'description': loc_data.get('description', ''),
-                    'original_data': loc_data
-                })
-
-            dialog = SelectionDialog(items, "Select Locations to Import", self.parent)
+            # Replace the per-chapter preview with the merged results
+            dialog.set_items([
+                self._location_item(name, loc_data)
+                for name, loc_data in sorted(locations.items(), key=lambda x: -x[1]['appearances'])
+            ])
+            dialog.set_busy(False)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 selected_locations = dialog.get_selected()
                 if selected_locations:
@@ -608,27 +1839,20 @@ class StoryExtractor:
 
         def on_error(error):
             progress.close()
+            dialog.close()
             QMessageBox.critical(self.parent, "Error", f"Failed to extract locations:\n\n{error}")
 
         def on_progress(message, percentage):
             progress.setLabelText(message)
             progress.setValue(percentage)
 
-        self.worker.finished.connect(on_finished)
-        self.worker.error.connect(on_error)
-        self.worker.progress.connect(on_progress)
-        progress.canceled.connect(self.worker.terminate)
-
-        self.worker.start()
+        self._submit("locations", progress, on_finished=on_finished,
+                     on_chapter_done=on_chapter_done, on_error=on_error, on_progress=on_progress)
+        progress.canceled.connect(dialog.reject)
 
     def analyze_plot(self):
         """Analyze plot structure"""
-        from models.project import ItemType
-
-        chapters = [c.to_dict() for c in self.db_manager.load_items(self.project_id, ItemType.CHAPTER)]
-        scenes = [s.to_dict() for s in self.db_manager.load_items(self.project_id, ItemType.SCENE)]
-
-        if not scenes:
+        if not self._has_scenes():
             QMessageBox.warning(self.parent, "No Content", "Please write some scenes first.")
             return
 
@@ -637,7 +1861,6 @@ class StoryExtractor:
         progress.setMinimumDuration(0)
         progress.setValue(0)
 
-        self.worker = ExtractionWorker("plot", chapters, scenes)
 
         def on_finished(data):
             progress.close()
@@ -691,27 +1914,43 @@ class StoryExtractor:
             progress.setLabelText(message)
             progress.setValue(percentage)
 
-        self.worker.finished.connect(on_finished)
-        self.worker.error.connect(on_error)
-        self.worker.progress.connect(on_progress)
-        progress.canceled.connect(self.worker.terminate)
+        self._submit("plot", progress, on_finished=on_finished,
+                     on_error=on_error, on_progress=on_progress)
 
-        self.worker.start()
+    def _character_item(self, name: str, char_data: Dict) -> Dict:
+        """Selection dialog entry for a character (merged or from a single chapter)"""
+        mentions = char_data.get('mentions', 1)
+        return {
+            'id': name,
+            'display_name': f"{name} ({char_data['significance']}) - {mentions} chapters",
+            'description': char_data.get('role', ''),
+            'original_data': char_data
+        }
+
+    def _location_item(self, name: str, loc_data: Dict) -> Dict:
+        """Selection dialog entry for a location (merged or from a single chapter)"""
+        appearances = loc_data.get('appearances', 1)
+        return {
+            'id': name,
+            'display_name': f"{name} ({loc_data['type']}) - {appearances} chapters",
+            'description': loc_data.get('description', ''),
+            'original_data': loc_data
+        }
 
     def _save_characters(self, characters: Dict):
         """Save extracted characters to database"""
         from models.project import Character
 
-        saved_count = 0
-        for name, data in characters.items():
-            char = Character(
+        items = [
+            Character(
                 name=name,
                 role=data['significance'].title(),
                 description=data['role'],
                 motivation=f"Appears in: {', '.join(data['chapters'][:3])}"
             )
-            self.db_manager.save_item(self.project_id, char)
-            saved_count += 1
+            for name, data in characters.items()
+        ]
+        saved_count = len(items) if self.db_manager.save_items_bulk(self.project_id, items) else 0
 
         QMessageBox.information(
             self.parent,
@@ -720,8 +1959,7 @@ class StoryExtractor:
         )
 
         # Reload the project tree
-        if hasattr(self.parent, 'project_tree'):
-            self.parent.project_tree.load_project(self.db_manager, self.project_id)
+        self._schedule_tree_reload()
 
     def _clear_existing_items(self, item_type: str):
         """Clear existing items of a specific type before adding new ones"""
@@ -737,28 +1975,22 @@ class StoryExtractor:
         if item_type not in type_map:
             return
 
-        # Load all items of this type
-        items = self.db_manager.load_items(self.project_id, type_map[item_type])
-
-        # Delete each one
-        for item in items:
-            self.db_manager.delete_item(item.id)
-
-        print(f"Cleared {len(items)} existing {item_type}s")
+        deleted = self.db_manager.delete_items_of_type(self.project_id, type_map[item_type])
+        print(f"Cleared {deleted} existing {item_type}s")
 
     def _save_locations(self, locations: Dict):
         """Save extracted locations to database"""
         from models.project import Location
 
-        saved_count = 0
-        for name, data in locations.items():
-            loc = Location(
+        items = [
+            Location(
                 name=name,
                 description=data['description'],
                 significance=f"{data['type'].title()} - appears {data['appearances']} times"
             )
-            self.db_manager.save_item(self.project_id, loc)
-            saved_count += 1
+            for name, data in locations.items()
+        ]
+        saved_count = len(items) if self.db_manager.save_items_bulk(self.project_id, items) else 0
 
         QMessageBox.information(
             self.parent,
@@ -767,63 +1999,69 @@ class StoryExtractor:
         )
 
         # Reload the project tree
-        if hasattr(self.parent, 'project_tree'):
-            self.parent.project_tree.load_project(self.db_manager, self.project_id)
+        self._schedule_tree_reload()
 
     def _save_plot_threads(self, plot_threads: Dict):
-        """Save extracted plot threads to database"""
-        try:
-            print(f"Saving {len(plot_threads)} plot threads...")
-            from models.project import PlotThread
-
-            saved_count = 0
-            for name, data in plot_threads.items():
-                print(f"Creating plot thread: {name}")
-                print(f"  Data: {data}")
-
-                # Determine importance based on how many chapters it appears in
-                chapter_count = len(data.get('chapters', []))
-                if chapter_count >= 10:
-                    importance = "main"
-                elif chapter_count >= 5:
-                    importance = "major"
-                else:
-                    importance = "minor"
+        """Save extracted plot threads to database on a background thread"""
+        print(f"Saving {len(plot_threads)} plot threads...")
 
-                # Create plot thread with correct fields
-                thread = PlotThread(
-                    name=name,
-                    description=data.get('description', f"Plot thread identified from story analysis"),
-                    importance=importance,
-                    resolution="ongoing",
-                    notes=f"Appears in {chapter_count} chapters: {', '.join(data.get('chapters', [])[:5])}"
-                )
+        thread = QThread()
+        worker = PlotThreadSaveWorker(self.db_manager, self.project_id, plot_threads)
+        worker.moveToThread(thread)
 
-                print(f"  Saving to database...")
-                self.db_manager.save_item(self.project_id, thread)
-                saved_count += 1
-                print(f"  Saved successfully")
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_plot_threads_saved)
+        worker.error.connect(self._on_plot_threads_save_error)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
 
-            print(f"All {saved_count} plot threads saved")
+        job = (thread, worker)
+        self._save_jobs.append(job)
+        thread.finished.connect(lambda: self._save_jobs.remove(job))
+        thread.start()
 
-            QMessageBox.information(
-                self.parent,
-                "Plot Threads Saved",
-                f"Successfully added {saved_count} plot threads to your project!"
-            )
+    def _on_plot_threads_saved(self, threads: list):
+        saved_count = len(threads)
+        print(f"All {saved_count} plot threads saved")
 
-            # Reload the project tree
-            print("Reloading project tree...")
-            if hasattr(self.parent, 'project_tree'):
-                self.parent.project_tree.load_project(self.db_manager, self.project_id)
-            print("Done!")
+        QMessageBox.information(
+            self.parent,
+            "Plot Threads Saved",
+            f"Successfully added {saved_count} plot threads to your project!"
+        )
+
+        # Existing threads were cleared before saving, so swap the tree's
+        # Plot Threads section in place; full reload only if it isn't there
+        if hasattr(self.parent, 'project_tree'):
+            try:
+                updated = self.parent.project_tree.add_plot_threads(threads, replace=True)
+            except Exception:
+                logger.exception("Updating the Plot Threads section failed")
+                updated = False
+            if not updated:
+                self._schedule_tree_reload()
+        print("Done!")
+
+    def _schedule_tree_reload(self):
+        """Reload the project tree on the next event-loop pass, after the dialog has closed"""
+        if hasattr(self.parent, 'project_tree'):
+            QTimer.singleShot(0, self._reload_tree)
 
+    def _reload_tree(self):
+        """Rebuild the project tree; the data is already saved, so failures are reported separately"""
+        try:
+            self.parent.project_tree.load_project(self.db_manager, self.project_id)
         except Exception as e:
-            print(f"ERROR in _save_plot_threads: {e}")
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(
+            logger.exception("Reloading the project tree failed")
+            QMessageBox.warning(
                 self.parent,
-                "Save Error",
-                f"Failed to save plot threads:\n\n{str(e)}"
-            )
\ No newline at end of file
+                "Reload Error",
+                f"Your changes were saved, but the project tree could not be refreshed:\n\n{e}"
+            )
+
+    def _on_plot_threads_save_error(self, error: str):
+        QMessageBox.critical(
+            self.parent,
+            "Save Error",
+            f"Failed to save plot threads:\n\n{error}"
+        )
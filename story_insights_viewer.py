@@ -3,15 +3,17 @@ Story Insights Viewer - Shows all tracked issues by location with AI Fix
 """
 import html
 import re
+from functools import lru_cache
 
 import unicodedata
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QLabel, QPushButton, QScrollArea, QFrame, QTextEdit, QToolButton,
-    QSizePolicy, QMessageBox, QProgressDialog
+    QSizePolicy, QMessageBox, QProgressDialog, QListView, QStyledItemDelegate,
+    QStyle, QSplitter, QStackedWidget
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
-from PyQt6.QtGui import QFont, QTextDocument
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QAbstractListModel, QModelIndex, QRect, QSize, QPointF
+from PyQt6.QtGui import QFont, QTextDocument, QPainter, QColor, QFontMetrics, QStaticText, QTransform
 from ai_manager import ai_manager
 from typing import Dict, List
 import html as _html
@@ -20,52 +22,242 @@ from pacing_heatmap import PacingHeatmapWidget
 
 from theme_manager import theme_manager
 
-class CollapsibleSection(QWidget):
-    """A widget that can collapse its contents"""
-    def __init__(self, title: str, parent=None):
+# Section, card and badge styles for the whole dialog, applied once in
+# StoryInsightsViewer.apply_modern_style instead of per widget
+_INSIGHTS_QSS = """
+    QListView#issueList {
+        border: none;
+        background: transparent;
+    }
+    QFrame#IssueCard {
+        background: #252526;
+        border: 1px solid #3D3D3D;
+        border-radius: 8px;
+        padding: 15px;
+        margin: 5px;
+    }
+    QFrame#IssueCard:hover {
+        border-color: #7C4DFF;
+        background: #2D2D30;
+    }
+    QLabel#SeverityBadge {
+        color: white;
+        padding: 6px 14px;
+        border-radius: 14px;
+    }
+    QLabel#SeverityBadge[severity="Critical"] { background: #dc3545; font-weight: bold; }
+    QLabel#SeverityBadge[severity="Major"] { background: #fd7e14; font-weight: bold; }
+    QLabel#SeverityBadge[severity="Minor"] { background: #ffc107; color: black; font-weight: bold; }
+    QLabel#SeverityBadge[severity="Suggestion"] { background: #0dcaf0; }
+    QLabel#SeverityBadge[severity="Strength"] { background: #198754; }
+    QLabel#SeverityBadge[severity="Observation"] { background: #6c757d; }
+    QPushButton#FixButton {
+        background: #667eea;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-weight: bold;
+    }
+    QPushButton#FixButton:hover {
+        background: #5a67d8;
+    }
+    QPushButton#FixButton:disabled {
+        background: #adb5bd;
+    }
+    QPushButton#FixButton[fixed="true"], QPushButton#FixButton[fixed="true"]:disabled {
+        background: #28a745;
+    }
+    QLabel#IssueLocation { color: #A0A0A0; font-size: 10pt; margin-left: 10px; }
+    QLabel#IssueTitle { font-size: 12pt; font-weight: bold; color: #E0E0E0; margin: 8px 0; }
+    QLabel#IssueChapter { color: #A0A0A0; font-size: 10pt; margin-bottom: 8px; }
+    QLabel#IssueDetail { color: #A0A0A0; font-size: 10pt; }
+    QToolButton#DetailsToggle {
+        border: none;
+        color: #7C4DFF;
+        font-weight: bold;
+        padding: 4px 0;
+    }
+    QToolButton#DetailsToggle:hover { color: #9E7BFF; }
+"""
+
+# Badge (background, text) colours, matching SeverityBadge in _INSIGHTS_QSS;
+# IssueRowDelegate paints these directly
+_SEVERITY_COLORS = {
+    'Critical': ('#dc3545', 'white'),
+    'Major': ('#fd7e14', 'white'),
+    'Minor': ('#ffc107', 'black'),
+    'Suggestion': ('#0dcaf0', 'white'),
+    'Strength': ('#198754', 'white'),
+    'Observation': ('#6c757d', 'white'),
+}
+
+_BADGE_SEVERITIES = set(_SEVERITY_COLORS)
+
+
+@lru_cache(maxsize=8)
+def _font_metrics(font_key: str) -> QFontMetrics:
+    """Metrics for a QFont.toString(); cards and rows share a handful of fonts"""
+    font = QFont()
+    font.fromString(font_key)
+    return QFontMetrics(font)
+
+
+def _make_static_text(text: str, font_key: str) -> QStaticText:
+    """Plain text laid out once for font_key (a QFont.toString())"""
+    font = QFont()
+    font.fromString(font_key)
+    static = QStaticText(text)
+    static.setTextFormat(Qt.TextFormat.PlainText)
+    static.prepare(QTransform(), font)
+    return static
+
+
+# Severities have a handful of values; titles, locations and chapters many.
+# The font key is part of the cache key, so a font change never reuses stale layouts.
+_badge_static = lru_cache(maxsize=32)(_make_static_text)
+_line_static = lru_cache(maxsize=1024)(_make_static_text)
+
+
+class IssueListModel(QAbstractListModel):
+    """Rows of one issues tab: section titles (str) followed by their issue dicts"""
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
-
-        self.toggle_btn = QToolButton()
-        self.toggle_btn.setCheckable(True)
-        self.toggle_btn.setChecked(True)
-        self.toggle_btn.setText(title)
-        self.toggle_btn.setArrowType(Qt.ArrowType.DownArrow)
-        self.toggle_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        self.toggle_btn.setStyleSheet("""
-            QToolButton {
-                border: none;
-                font-size: 12pt;
-                font-weight: bold;
-                color: #E0E0E0;
-                padding: 10px;
-                background: #2D2D2D;
-                border-radius: 4px;
-                text-align: left;
-            }
-            QToolButton:hover {
-                background: #3D3D3D;
-            }
-        """)
-        self.toggle_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.toggle_btn.toggled.connect(self._on_toggle)
+        self._rows = []
 
-        self.content_area = QWidget()
-        self.content_layout = QVBoxLayout(self.content_area)
-        self.content_layout.setContentsMargins(5, 5, 5, 5)
-        self.content_layout.setSpacing(10)
+    def set_rows(self, rows: list):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
 
-        self.layout.addWidget(self.toggle_btn)
-        self.layout.addWidget(self.content_area)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
 
-    def _on_toggle(self, checked: bool):
-        self.content_area.setVisible(checked)
-        self.toggle_btn.setArrowType(Qt.ArrowType.DownArrow if checked else Qt.ArrowType.RightArrow)
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return row
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row if isinstance(row, str) else row.get('issue', '')
+        return None
+
+    def flags(self, index):
+        if index.isValid() and isinstance(self._rows[index.row()], str):
+            return Qt.ItemFlag.ItemIsEnabled
+        return super().flags(index)
+
+
+class IssueRowDelegate(QStyledItemDelegate):
+    """Paints section headers and compact issue cards without child widgets"""
+
+    MARGIN = 5
+    PADDING = 12
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font_sets = {}
+
+    def _fonts(self, base: QFont):
+        """(font, toString() key) for the base, badge and title text, built once per base font"""
+        base_key = base.toString()
+        fonts = self._font_sets.get(base_key)
+        if fonts is None:
+            badge_font = QFont(base)
+            badge_font.setBold(True)
+            title_font = QFont(base)
+            title_font.setPointSize(12)
+            title_font.setBold(True)
+            fonts = ((QFont(base), base_key),
+                     (badge_font, badge_font.toString()),
+                     (title_font, title_font.toString()))
+            self._font_sets[base_key] = fonts
+        return fonts
+
+    def sizeHint(self, option, index):
+        # Width 0: rows stretch to the viewport in list mode
+        row = index.data(Qt.ItemDataRole.UserRole)
+        (_, base_key), (_, badge_key), (_, title_key) = self._fonts(option.font)
+        if isinstance(row, str):
+            return QSize(0, _font_metrics(title_key).height() + 2 * (self.MARGIN + 10))
+        height = (_font_metrics(badge_key).height() + 8
+                  + _font_metrics(title_key).height()
+                  + _font_metrics(base_key).height()
+                  + 2 * (self.MARGIN + self.PADDING) + 2 * 8)
+        return QSize(0, height)
+
+    def paint(self, painter, option, index):
+        row = index.data(Qt.ItemDataRole.UserRole)
+        base, (badge_font, badge_key), title = self._fonts(option.font)
+        rect = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if isinstance(row, str):
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor("#3D3D3D" if hovered else "#2D2D2D"))
+            painter.drawRoundedRect(rect, 4, 4)
+            view = option.widget
+            collapsed = view is not None and view.isRowHidden(index.row() + 1)
+            painter.setPen(QColor("#E0E0E0"))
+            self._draw_line(painter, rect.adjusted(10, 0, -10, 0), title,
+                            f"{'▶' if collapsed else '▼'}  {row}")
+            painter.restore()
+            return
+
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        painter.setPen(QColor("#7C4DFF" if hovered or selected else "#3D3D3D"))
+        painter.setBrush(QColor("#2D2D30" if hovered or selected else "#252526"))
+        painter.drawRoundedRect(rect, 8, 8)
+
+        inner = rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+
+        # Severity pill
+        severity = str(row.get('severity', 'Minor'))
+        pill_bg, pill_fg = _SEVERITY_COLORS[severity if severity in _SEVERITY_COLORS else 'Observation']
+        badge_text = _badge_static(severity, badge_key)
+        text_size = badge_text.size()
+        pill = QRect(inner.left(), inner.top(),
+                     int(text_size.width()) + 28, _font_metrics(badge_key).height() + 8)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(pill_bg))
+        painter.drawRoundedRect(pill, pill.height() / 2, pill.height() / 2)
+        painter.setFont(badge_font)
+        painter.setPen(QColor(pill_fg))
+        painter.drawStaticText(QPointF(pill.left() + (pill.width() - text_size.width()) / 2,
+                                       pill.top() + (pill.height() - text_size.height()) / 2),
+                               badge_text)
+
+        # Location beside the pill
+        loc_rect = QRect(pill.right() + 12, pill.top(), inner.right() - pill.right() - 12, pill.height())
+        painter.setPen(QColor("#A0A0A0"))
+        self._draw_line(painter, loc_rect, base, f"📍 {row.get('location', 'Unknown')}")
+
+        # Title and chapter, one elided line each
+        title_rect = QRect(inner.left(), pill.bottom() + 8, inner.width(), _font_metrics(title[1]).height())
+        painter.setPen(QColor("#E0E0E0"))
+        self._draw_line(painter, title_rect, title, str(row.get('issue', 'No description')))
+
+        chapter_rect = QRect(inner.left(), title_rect.bottom() + 8, inner.width(), _font_metrics(base[1]).height())
+        painter.setPen(QColor("#A0A0A0"))
+        self._draw_line(painter, chapter_rect, base, f"Chapter: {row.get('chapter', 'Unknown')}")
+
+        painter.restore()
+
+    @staticmethod
+    def _draw_line(painter, rect: QRect, font_entry: tuple, text: str):
+        """Draw text elided to rect's width, left aligned and vertically centred"""
+        font, font_key = font_entry
+        elided = _font_metrics(font_key).elidedText(text, Qt.TextElideMode.ElideRight, rect.width())
+        static = _line_static(elided, font_key)
+        painter.setFont(font)
+        painter.drawStaticText(QPointF(rect.left(), rect.top() + (rect.height() - static.size().height()) / 2),
+                               static)
 
-    def add_widget(self, widget: QWidget):
-        self.content_layout.addWidget(widget)
 
 class AIFixWorker(QThread):
     """Worker thread for AI fix suggestions"""
@@ -225,25 +417,16 @@ class IssueCard(QFrame):
         self.db_manager = db_manager
         self.project_id = project_id
         self.details_visible = False
+        self.details_container = None
+        self._pending_details = None
         self.fix_worker = None
         self.suggested_fix = None
         self.init_ui()
 
     def init_ui(self):
         self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background: #252526;
-                border: 1px solid #3D3D3D;
-                border-radius: 8px;
-                padding: 15px;
-                margin: 5px;
-            }
-            QFrame:hover {
-                border-color: #7C4DFF;
-                background: #2D2D30;
-            }
-        """)
+        # Styled by _INSIGHTS_QSS on the dialog
+        self.setObjectName("IssueCard")
 
         layout = QVBoxLayout(self)
 
@@ -252,10 +435,11 @@ class IssueCard(QFrame):
 
         severity = str(self.issue_data.get('severity', 'Minor'))
         severity_badge = QLabel(severity)
-        severity_badge.setStyleSheet(self._get_severity_style(severity))
+        severity_badge.setTextFormat(Qt.TextFormat.PlainText)
+        severity_badge.setObjectName("SeverityBadge")
+        severity_badge.setProperty("severity", severity if severity in _BADGE_SEVERITIES else "Observation")
 
-        fm = severity_badge.fontMetrics()
-        severity_badge.setMinimumHeight(fm.height() + 14)
+        severity_badge.setMinimumHeight(_font_metrics(severity_badge.font().toString()).height() + 14)
         severity_badge.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
         severity_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -265,22 +449,7 @@ class IssueCard(QFrame):
         # Add Fix button if we have db_manager
         if self.db_manager and self.project_id:
             self.fix_btn = QPushButton("🔧 AI Fix")
-            self.fix_btn.setStyleSheet("""
-                QPushButton {
-                    background: #667eea;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: #5a67d8;
-                }
-                QPushButton:disabled {
-                    background: #adb5bd;
-                }
-            """)
+            self.fix_btn.setObjectName("FixButton")
             self.fix_btn.clicked.connect(self._request_fix)
             header.addWidget(self.fix_btn)
 
@@ -289,7 +458,8 @@ class IssueCard(QFrame):
                 self.fix_btn.hide()
 
         location_label = QLabel(f"📍 {self.issue_data.get('location', 'Unknown')}")
-        location_label.setStyleSheet("color: #A0A0A0; font-size: 10pt; margin-left: 10px;")
+        location_label.setTextFormat(Qt.TextFormat.PlainText)
+        location_label.setObjectName("IssueLocation")
         location_label.setWordWrap(True)
         header.addWidget(location_label)
 
@@ -297,14 +467,16 @@ class IssueCard(QFrame):
 
         # Issue title
         title = QLabel(self.issue_data.get('issue', 'No description'))
+        title.setTextFormat(Qt.TextFormat.PlainText)
         title.setWordWrap(True)
-        title.setStyleSheet("font-size: 12pt; font-weight: bold; color: #E0E0E0; margin: 8px 0;")
+        title.setObjectName("IssueTitle")
         layout.addWidget(title)
 
         # Chapter info
         chapter = QLabel(f"Chapter: {self.issue_data.get('chapter', 'Unknown')}")
+        chapter.setTextFormat(Qt.TextFormat.PlainText)
         chapter.setWordWrap(True)
-        chapter.setStyleSheet("color: #A0A0A0; font-size: 10pt; margin-bottom: 8px;")
+        chapter.setObjectName("IssueChapter")
         layout.addWidget(chapter)
 
         # Collapsible details
@@ -324,52 +496,18 @@ class IssueCard(QFrame):
             self.toggle_btn.setArrowType(Qt.ArrowType.RightArrow)
             self.toggle_btn.setText(" Details")
             self.toggle_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-            self.toggle_btn.setStyleSheet("""
-                QToolButton {
-                    border: none;
-                    color: #7C4DFF;
-                    font-weight: bold;
-                    padding: 4px 0;
-                }
-                QToolButton:hover { color: #9E7BFF; }
-            """)
+            self.toggle_btn.setObjectName("DetailsToggle")
             self.toggle_btn.toggled.connect(self._toggle_details)
             layout.addWidget(self.toggle_btn)
 
-            self.details_container = QWidget()
-            details_layout = QVBoxLayout(self.details_container)
-            details_layout.setContentsMargins(0, 6, 0, 0)
-            details_layout.setSpacing(6)
-
-            if detail_text:
-                detail = QLabel(detail_text)
-                detail.setWordWrap(True)
-                detail.setStyleSheet("color: #A0A0A0; font-size: 10pt;")
-                details_layout.addWidget(detail)
-
-            if suggestions:
-                if isinstance(suggestions, list):
-                    sug_text = "\n".join([f"• {str(s).strip()}" for s in suggestions if str(s).strip()])
-                else:
-                    sug_text = str(suggestions).strip()
-
-                if sug_text:
-                    sug_label = QLabel("💡 Suggestions")
-                    sug_label.setStyleSheet("color: #E0E0E0; font-weight: bold; margin-top: 4px;")
-                    details_layout.addWidget(sug_label)
-
-                    sug_body = QLabel(sug_text)
-                    sug_body.setWordWrap(True)
-                    sug_body.setStyleSheet("color: #A0A0A0; font-size: 10pt;")
-                    details_layout.addWidget(sug_body)
-
-            self.details_container.setVisible(False)
-            layout.addWidget(self.details_container)
+            # Most cards are never expanded; build the details on first toggle
+            self._pending_details = (detail_text, suggestions)
         else:
             if detail_text:
                 detail = QLabel(detail_text)
+                detail.setTextFormat(Qt.TextFormat.PlainText)
                 detail.setWordWrap(True)
-                detail.setStyleSheet("color: #A0A0A0; font-size: 10pt;")
+                detail.setObjectName("IssueDetail")
                 layout.addWidget(detail)
 
     def _norm_scene_key(s: str) -> str:
@@ -789,38 +927,60 @@ class IssueCard(QFrame):
                 self.db_manager.save_item(self.project_id, scene)
 
             self.fix_btn.setText("✓ Fixed")
-            self.fix_btn.setStyleSheet("""
-                QPushButton {
-                    background: #28a745;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                    font-weight: bold;
-                }
-            """)
+            self.fix_btn.setProperty("fixed", True)
+            self.fix_btn.style().unpolish(self.fix_btn)
+            self.fix_btn.style().polish(self.fix_btn)
             self.fix_btn.setEnabled(False)
 
             scene_name = scene.name if hasattr(scene, "name") else "selected scenes"
             QMessageBox.information(self, "Fix Applied", f"The fix has been applied to '{scene_name}'!")
 
+    def _build_details(self):
+        """Create the collapsible details below the toggle"""
+        detail_text, suggestions = self._pending_details
+        self._pending_details = None
+
+        self.details_container = QWidget()
+        details_layout = QVBoxLayout(self.details_container)
+        details_layout.setContentsMargins(0, 6, 0, 0)
+        details_layout.setSpacing(6)
+
+        if detail_text:
+            detail = QLabel(detail_text)
+            detail.setTextFormat(Qt.TextFormat.PlainText)
+            detail.setWordWrap(True)
+            detail.setObjectName("IssueDetail")
+            details_layout.addWidget(detail)
+
+        if suggestions:
+            if isinstance(suggestions, list):
+                items = [str(s).strip() for s in suggestions if str(s).strip()]
+                sug_html = ("<ul style='margin: 0; padding-left: 18px;'>"
+                            + "".join(f"<li>{html.escape(s)}</li>" for s in items) + "</ul>") if items else ""
+            else:
+                sug_html = html.escape(str(suggestions).strip()).replace("\n", "<br>")
+
+            if sug_html:
+                # Heading and every suggestion share one rich-text label
+                sug_label = QLabel(
+                    "<p style='color: #E0E0E0; font-weight: bold; margin-top: 4px;'>💡 Suggestions</p>"
+                    + sug_html
+                )
+                sug_label.setTextFormat(Qt.TextFormat.RichText)
+                sug_label.setWordWrap(True)
+                sug_label.setObjectName("IssueDetail")
+                details_layout.addWidget(sug_label)
+
+        self.layout().addWidget(self.details_container)
+
     def _toggle_details(self, checked: bool):
         self.details_visible = checked
-        self.details_container.setVisible(checked)
+        if checked and self.details_container is None:
+            self._build_details()
+        if self.details_container is not None:
+            self.details_container.setVisible(checked)
         self.toggle_btn.setArrowType(Qt.ArrowType.DownArrow if checked else Qt.ArrowType.RightArrow)
 
-    def _get_severity_style(self, severity: str) -> str:
-        """Get CSS style for severity badge"""
-        styles = {
-            'Critical': "background: #dc3545; color: white; padding: 6px 14px; border-radius: 14px; font-weight: bold;",
-            'Major': "background: #fd7e14; color: white; padding: 6px 14px; border-radius: 14px; font-weight: bold;",
-            'Minor': "background: #ffc107; color: black; padding: 6px 14px; border-radius: 14px; font-weight: bold;",
-            'Suggestion': "background: #0dcaf0; color: white; padding: 6px 14px; border-radius: 14px;",
-            'Strength': "background: #198754; color: white; padding: 6px 14px; border-radius: 14px;",
-            'Observation': "background: #6c757d; color: white; padding: 6px 14px; border-radius: 14px;"
-        }
-        return styles.get(severity, styles['Observation'])
-
 
 class StoryInsightsViewer(QDialog):
     """Main dialog for viewing all story insights"""
@@ -835,6 +995,11 @@ class StoryInsightsViewer(QDialog):
         self.consistency_data = None
         self.style_data = None
         self.pacing_data = None
+        # Bumped by each load that feeds the Full Reports tab
+        self._reports_version = 0
+        self._reports_built_version = None
+        # Issues for tabs that haven't been shown since their data arrived
+        self._pending_issues = {}
         self.init_ui()
 
     def init_ui(self):
@@ -872,6 +1037,8 @@ class StoryInsightsViewer(QDialog):
         self.reports_tab = self.create_reports_tab()
         self.tabs.addTab(self.reports_tab, "📄 Full Reports")
 
+        # Connected after the tabs are added so building them doesn't trigger it
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(self.tabs)
 
         # Close button
@@ -882,7 +1049,7 @@ class StoryInsightsViewer(QDialog):
 
     def apply_modern_style(self):
         """Apply modern styling"""
-        self.setStyleSheet(theme_manager.get_dialog_stylesheet())
+        self.setStyleSheet(theme_manager.get_dialog_stylesheet() + _INSIGHTS_QSS)
         self.header.setObjectName("settingsHeader")
 
     def create_issues_tab(self) -> QWidget:
@@ -890,22 +1057,45 @@ class StoryInsightsViewer(QDialog):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        # Scroll area for issues
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        scroll_layout.setSpacing(10)
-
-        scroll.setWidget(scroll_widget)
-        layout.addWidget(scroll)
-
-        # Store reference to scroll layout for adding issues
-        widget.scroll_layout = scroll_layout
-        widget.scroll_widget = scroll_widget
+        # Issues are painted rows; only the selected one gets a full IssueCard
+        splitter = QSplitter(Qt.Orientation.Vertical)
+
+        model = IssueListModel(widget)
+        view = QListView()
+        view.setObjectName("issueList")
+        view.setModel(model)
+        view.setItemDelegate(IssueRowDelegate(view))
+        view.setMouseTracking(True)
+        view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        view.setResizeMode(QListView.ResizeMode.Adjust)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        view.clicked.connect(lambda index, tab=widget: self._on_issue_row_clicked(tab, index))
+        splitter.addWidget(view)
+
+        detail_scroll = QScrollArea()
+        detail_scroll.setWidgetResizable(True)
+        detail_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        detail_scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        detail_stack = QStackedWidget()
+        detail_scroll.setWidget(detail_stack)
+        detail_scroll.hide()
+        splitter.addWidget(detail_scroll)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 2)
+        layout.addWidget(splitter)
+
+        empty_label = QLabel("✅ No issues found!")
+        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        empty_label.setStyleSheet("font-size: 14pt; color: #28a745; padding: 50px;")
+        empty_label.hide()
+        layout.addWidget(empty_label)
+
+        widget.issue_model = model
+        widget.issue_view = view
+        widget.detail_scroll = detail_scroll
+        widget.detail_stack = detail_stack
+        widget.detail_cards = {}
+        widget.empty_label = empty_label
 
         return widget
 
@@ -953,19 +1143,22 @@ class StoryInsightsViewer(QDialog):
     def load_timeline_data(self, data: dict):
         """Load timeline analysis data"""
         self.timeline_data = data
-        self._populate_issues_tab(self.timeline_tab, data.get('issues', []))
+        self._reports_version += 1
+        self._set_tab_issues(self.timeline_tab, data.get('issues', []))
         self._update_reports()
 
     def load_consistency_data(self, data: dict):
         """Load consistency analysis data"""
         self.consistency_data = data
-        self._populate_issues_tab(self.consistency_tab, data.get('issues', []))
+        self._reports_version += 1
+        self._set_tab_issues(self.consistency_tab, data.get('issues', []))
         self._update_reports()
 
     def load_style_data(self, data: dict):
         """Load style analysis data"""
         self.style_data = data
-        self._populate_issues_tab(self.style_tab, data.get('issues', []))
+        self._reports_version += 1
+        self._set_tab_issues(self.style_tab, data.get('issues', []))
         self._update_reports()
 
     def load_pacing_data(self, data: dict):
@@ -976,48 +1169,82 @@ class StoryInsightsViewer(QDialog):
         self.heatmap.set_data(pacing_list)
         self._update_reports()
 
-    def _populate_issues_tab(self, tab: QWidget, issues: list):
-        """Populate a tab with issue cards"""
-        # Clear existing
-        layout = tab.scroll_layout
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        if not issues:
-            no_issues = QLabel("✅ No issues found!")
-            no_issues.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_issues.setStyleSheet("font-size: 14pt; color: #28a745; padding: 50px;")
-            layout.addWidget(no_issues)
+    def _set_tab_issues(self, tab: QWidget, issues: list):
+        """Populate the tab now if it is showing, otherwise when it is next selected"""
+        if self.tabs.currentWidget() is tab:
+            self._pending_issues.pop(tab, None)
+            self._populate_issues_tab(tab, issues)
         else:
-            # Group by severity
-            critical = [i for i in issues if i.get('severity') == 'Critical']
-            major = [i for i in issues if i.get('severity') == 'Major']
-            minor = [i for i in issues if i.get('severity') == 'Minor']
-            suggestions = [i for i in issues if i.get('severity') == 'Suggestion']
-            strengths = [i for i in issues if i.get('severity') == 'Strength']
-            other = [i for i in issues if i.get('severity') not in ['Critical', 'Major', 'Minor', 'Suggestion', 'Strength']]
-
-            groups = [
-                (critical, 'Critical Issues'),
-                (major, 'Major Issues'),
-                (minor, 'Minor Issues'),
-                (suggestions, 'Suggestions'),
-                (strengths, 'Strengths'),
-                (other, 'Observations')
-            ]
-
-            for issue_list, title in groups:
-                if issue_list:
-                    section = CollapsibleSection(f"{title} ({len(issue_list)})")
-                    layout.addWidget(section)
-
-                    for issue in issue_list:
-                        card = IssueCard(issue, self.db_manager, self.project_id)
-                        section.add_widget(card)
+            self._pending_issues[tab] = issues
 
-        layout.addStretch()
+    def _on_tab_changed(self, index: int):
+        """Fill in whatever the newly selected tab deferred while hidden"""
+        tab = self.tabs.widget(index)
+        issues = self._pending_issues.pop(tab, None)
+        if issues is not None:
+            self._populate_issues_tab(tab, issues)
+        elif tab is self.reports_tab:
+            self._update_reports()
+
+    def _populate_issues_tab(self, tab: QWidget, issues: list):
+        """Populate a tab with issue rows grouped by severity"""
+        for card in tab.detail_cards.values():
+            tab.detail_stack.removeWidget(card)
+            card.deleteLater()
+        tab.detail_cards = {}
+        tab.detail_scroll.hide()
+
+        # Group by severity in a single pass
+        buckets = {sev: [] for sev in ('Critical', 'Major', 'Minor', 'Suggestion', 'Strength')}
+        other = []
+        for issue in issues:
+            sev = issue.get('severity')
+            (buckets[sev] if sev in buckets else other).append(issue)
+
+        groups = [
+            (buckets['Critical'], 'Critical Issues'),
+            (buckets['Major'], 'Major Issues'),
+            (buckets['Minor'], 'Minor Issues'),
+            (buckets['Suggestion'], 'Suggestions'),
+            (buckets['Strength'], 'Strengths'),
+            (other, 'Observations')
+        ]
+
+        rows = []
+        for issue_list, title in groups:
+            if issue_list:
+                rows.append(f"{title} ({len(issue_list)})")
+                rows.extend(issue_list)
+
+        tab.issue_model.set_rows(rows)
+        tab.issue_view.setVisible(bool(rows))
+        tab.empty_label.setVisible(not rows)
+
+    def _on_issue_row_clicked(self, tab: QWidget, index: QModelIndex):
+        """Collapse a section on its header; show the full card for an issue"""
+        row = index.data(Qt.ItemDataRole.UserRole)
+        view = tab.issue_view
+
+        if isinstance(row, str):
+            # Hide or show every row up to the next section header
+            first = index.row() + 1
+            hide = not view.isRowHidden(first)
+            model = tab.issue_model
+            for r in range(first, model.rowCount()):
+                if isinstance(model.index(r, 0).data(Qt.ItemDataRole.UserRole), str):
+                    break
+                view.setRowHidden(r, hide)
+            view.viewport().update()
+            return
+
+        # Cards are kept once built so a running AI fix survives switching rows
+        card = tab.detail_cards.get(index.row())
+        if card is None:
+            card = IssueCard(row, self.db_manager, self.project_id)
+            tab.detail_cards[index.row()] = card
+            tab.detail_stack.addWidget(card)
+        tab.detail_stack.setCurrentWidget(card)
+        tab.detail_scroll.show()
 
     def _on_pacing_scene_selected(self, scene_name: str):
         """Handle scene selection from pacing heatmap"""
@@ -1052,26 +1279,22 @@ class StoryInsightsViewer(QDialog):
 
     def _update_reports(self):
         """Update the full reports tab"""
-        report_text = ""
+        # Rebuilt by _on_tab_changed when the tab is selected
+        if self.tabs.currentWidget() is not self.reports_tab:
+            return
 
-        if self.timeline_data:
-            report_text += "=" * 60 + "\n"
-            report_text += "TIMELINE ANALYSIS\n"
-            report_text += "=" * 60 + "\n\n"
-            report_text += self.timeline_data.get('final_report', 'No report available')
-            report_text += "\n\n"
-
-        if self.consistency_data:
-            report_text += "=" * 60 + "\n"
-            report_text += "CONSISTENCY ANALYSIS\n"
-            report_text += "=" * 60 + "\n\n"
-            report_text += self.consistency_data.get('final_report', 'No report available')
-            report_text += "\n\n"
-
-        if self.style_data:
-            report_text += "=" * 60 + "\n"
-            report_text += "WRITING STYLE ANALYSIS\n"
-            report_text += "=" * 60 + "\n\n"
-            report_text += self.style_data.get('final_report', 'No report available')
-
-        self.reports_text.setText(report_text)
\ No newline at end of file
+        # Pacing loads and revisits of the tab leave the text as is
+        if self._reports_built_version == self._reports_version:
+            return
+        self._reports_built_version = self._reports_version
+
+        rule = "=" * 60 + "\n"
+        parts = []
+        for data, heading in ((self.timeline_data, "TIMELINE ANALYSIS"),
+                              (self.consistency_data, "CONSISTENCY ANALYSIS"),
+                              (self.style_data, "WRITING STYLE ANALYSIS")):
+            if data:
+                parts.extend((rule, heading, "\n", rule, "\n",
+                              data.get('final_report', 'No report available'), "\n\n"))
+
+        self.reports_text.setPlainText("".join(parts))
@@ -8,6 +8,7 @@ Prevents API overload by:
 - Monitoring API usage
 """
 
+import threading
 import time
 from typing import Optional, Callable, Any
 from collections import deque
@@ -46,6 +47,9 @@ class RateLimiter:
         self.requests_per_hour = requests_per_hour
         self.min_delay_seconds = min_delay_seconds
 
+        # Callers may share one limiter across threads
+        self._lock = threading.RLock()
+
         # Track recent requests
         self.recent_requests = deque(maxlen=requests_per_hour)
         self.last_request_time: Optional[float] = None
@@ -57,67 +61,76 @@ class RateLimiter:
 
     def record_request(self):
         """Record a request"""
-        now = time.time()
-        self.recent_requests.append(now)
-        self.last_request_time = now
-        self.total_requests += 1
+        with self._lock:
+            now = time.time()
+            self.recent_requests.append(now)
+            self.last_request_time = now
+            self.total_requests += 1
 
     def get_requests_in_window(self, window_seconds: int) -> int:
         """Get number of requests in the last N seconds"""
-        now = time.time()
-        cutoff = now - window_seconds
-        return sum(1 for req_time in self.recent_requests if req_time > cutoff)
+        with self._lock:
+            now = time.time()
+            cutoff = now - window_seconds
+            return sum(1 for req_time in self.recent_requests if req_time > cutoff)
 
     def calculate_delay(self) -> float:
         """Calculate how long to wait before next request"""
-        now = time.time()
-        delays = []
-
-        # Check minimum delay
-        if self.last_request_time:
-            time_since_last = now - self.last_request_time
-            if time_since_last < self.min_delay_seconds:
-                delays.append(self.min_delay_seconds - time_since_last)
-
-        # Check per-minute limit
-        requests_last_minute = self.get_requests_in_window(60)
-        if requests_last_minute >= self.requests_per_minute:
-            # Find oldest request in last minute
-            cutoff = now - 60
-            oldest_in_window = min(
-                (t for t in self.recent_requests if t > cutoff),
-                default=now
-            )
-            delay_until_minute_resets = 60 - (now - oldest_in_window)
-            if delay_until_minute_resets > 0:
-                delays.append(delay_until_minute_resets)
-
-        # Check per-hour limit
-        requests_last_hour = self.get_requests_in_window(3600)
-        if requests_last_hour >= self.requests_per_hour:
-            # Find oldest request in last hour
-            cutoff = now - 3600
-            oldest_in_window = min(
-                (t for t in self.recent_requests if t > cutoff),
-                default=now
-            )
-            delay_until_hour_resets = 3600 - (now - oldest_in_window)
-            if delay_until_hour_resets > 0:
-                delays.append(delay_until_hour_resets)
-
-        return max(delays) if delays else 0.0
+        with self._lock:
+            now = time.time()
+            delays = []
+
+            # Check minimum delay
+            if self.last_request_time:
+                time_since_last = now - self.last_request_time
+                if time_since_last < self.min_delay_seconds:
+                    delays.append(self.min_delay_seconds - time_since_last)
+
+            # Check per-minute limit
+            requests_last_minute = self.get_requests_in_window(60)
+            if requests_last_minute >= self.requests_per_minute:
+                # Find oldest request in last minute
+                cutoff = now - 60
+                oldest_in_window = min(
+                    (t for t in self.recent_requests if t > cutoff),
+                    default=now
+                )
+                delay_until_minute_resets = 60 - (now - oldest_in_window)
+                if delay_until_minute_resets > 0:
+                    delays.append(delay_until_minute_resets)
+
+            # Check per-hour limit
+            requests_last_hour = self.get_requests_in_window(3600)
+            if requests_last_hour >= self.requests_per_hour:
+                # Find oldest request in last hour
+                cutoff = now - 3600
+                oldest_in_window = min(
+                    (t for t in self.recent_requests if t > cutoff),
+                    default=now
+                )
+                delay_until_hour_resets = 3600 - (now - oldest_in_window)
+                if delay_until_hour_resets > 0:
+                    delays.append(delay_until_hour_resets)
+
+            return max(delays) if delays else 0.0
 
     def wait_if_needed(self) -> float:
         """
         Wait if rate limit would be exceeded
         Returns: seconds waited
+
+        Thread-safe: concurrent callers queue on the lock and each one
+        claims its start time, so min_delay_seconds spaces them out.
         """
-        delay = self.calculate_delay()
+        with self._lock:
+            delay = self.calculate_delay()
+
+            if delay > 0:
+                print(f"[RateLimit] Waiting {delay:.1f} seconds...")
+                time.sleep(delay)
+                self.total_wait_time += delay
 
-        if delay > 0:
-            print(f"[RateLimit] Waiting {delay:.1f} seconds...")
-            time.sleep(delay)
-            self.total_wait_time += delay
+            self.last_request_time = time.time()
 
         return delay
 
@@ -152,11 +165,12 @@ class RateLimiter:
 
     def reset(self):
         """Reset the rate limiter"""
-        self.recent_requests.clear()
-        self.last_request_time = None
-        self.total_requests = 0
-        self.total_wait_time = 0.0
-        self.start_time = time.time()
+        with self._lock:
+            self.recent_requests.clear()
+            self.last_request_time = None
+            self.total_requests = 0
+            self.total_wait_time = 0.0
+            self.start_time = time.time()
 
 
 class AdaptiveRateLimiter(RateLimiter):